@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+DataGuard Benchmark - pandas baseline vs DataGuard
+
+Times the same three checks with a pandas/NumPy baseline and with DataGuard,
+on the CSV and, when pyarrow is installed, on a Parquet copy of it:
+
+- Category must equal "Home & Kitchen"
+- Currency must be at least 3 characters long
+- Index must be monotonically increasing
+
+Usage:
+    python benchmark/benchmark.py [csv_path] [num_runs]
+
+For steadier timings, pin the run to one core and bypass pymalloc:
+    PYTHONMALLOC=malloc PYTHONHASHSEED=0 taskset -c 2 python benchmark/benchmark.py
+"""
+
+import gc
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+import dataguard
+
+try:
+    import numba
+    from numba import njit
+except ImportError:  # numba is optional, fall back to the NumPy kernels
+    numba = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional, fall back to pandas' own reader
+    pa = None
+
+DEFAULT_CSV = "examples/data/products.csv"
+DEFAULT_RUNS = 5
+# Length given to a null Currency, above any minimum so nulls are never errors
+NULL_LENGTH = np.iinfo(np.int64).max
+
+
+if numba is not None:
+
+    @njit("int64(int64[:])", cache=True, parallel=True)
+    def count_monotonic_violations(a):
+        c = 0
+        for i in numba.prange(1, a.shape[0]):
+            if a[i] < a[i - 1]:
+                c += 1
+        return c
+
+    @njit("int64(int64[:], int64)", cache=True, parallel=True)
+    def count_strlen_lt(lengths, min_length):
+        c = 0
+        for i in numba.prange(lengths.shape[0]):
+            if lengths[i] < min_length:
+                c += 1
+        return c
+
+    @njit("int64(boolean[:])", cache=True, parallel=True)
+    def count_true(mask):
+        c = 0
+        for i in numba.prange(mask.shape[0]):
+            if mask[i]:
+                c += 1
+        return c
+
+else:
+
+    def count_monotonic_violations(a):
+        return np.count_nonzero(np.diff(a) < 0)
+
+    def count_strlen_lt(lengths, min_length):
+        return np.count_nonzero(lengths < min_length)
+
+    def count_true(mask):
+        return np.count_nonzero(mask)
+
+
+def count_ne_str(series, expected):
+    """Count the non-null values of series different from expected, like RegexMatch."""
+    # The mask is built by pandas: comparing pd.NA in an object array gives pd.NA,
+    # which cannot be cast to bool
+    mask = series.ne(expected).to_numpy(dtype=np.bool_, na_value=False)
+    return count_true(mask)
+
+
+def warm_kernels():
+    """Compile the kernels once so the JIT never lands in a timed run."""
+    count_monotonic_violations(np.arange(2, dtype=np.int64))
+    count_strlen_lt(np.arange(2, dtype=np.int64), 1)
+    count_true(np.zeros(2, dtype=np.bool_))
+
+
+def read_frame(csv_path):
+    """Read the benchmarked columns into a DataFrame backed by typed buffers."""
+    if pa is None:
+        return pd.read_csv(
+            csv_path,
+            usecols=["Category", "Currency", "Index"],
+            dtype={"Category": "string", "Currency": "string", "Index": "int64"},
+        )
+    table = pa_csv.read_csv(
+        csv_path,
+        read_options=pa_csv.ReadOptions(use_threads=True, block_size=8 << 20),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=["Category", "Currency", "Index"],
+            column_types={"Index": pa.int64()},
+        ),
+    )
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+@contextmanager
+def gc_paused():
+    """Collect once, then keep the garbage collector out of the timed runs."""
+    gc.collect()
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+def benchmark_pandas(csv_path, num_runs):
+    """Run the checks with columnar NumPy kernels, return (errors, timings)."""
+    timings = []
+    errors = 0
+    with gc_paused():
+        for _ in range(num_runs):
+            start = time.perf_counter_ns()
+            df = read_frame(csv_path)
+
+            # Each kernel returns a plain int, no pandas scalar is built per run
+            errors = int(count_ne_str(df["Category"], "Home & Kitchen"))
+
+            # Nulls are skipped, as StringLengthCheck does
+            lengths = df["Currency"].str.len().to_numpy(
+                dtype=np.int64, na_value=NULL_LENGTH
+            )
+            errors += int(count_strlen_lt(lengths, 3))
+
+            idx = df["Index"].to_numpy(dtype=np.int64)
+            errors += int(count_monotonic_violations(idx))
+
+            timings.append(time.perf_counter_ns() - start)
+    return errors, timings
+
+
+def benchmark_rules():
+    return [
+        dataguard.string_column("Category").with_regex(r"^Home & Kitchen$"),
+        dataguard.string_column("Currency").with_min_length(3),
+        dataguard.integer_column("Index").is_monotonically_increasing(),
+    ]
+
+
+def time_table(table, num_runs):
+    """Validate a prepared table num_runs times, return (failed rules, timings)."""
+    timings = []
+    failed = 0
+    with gc_paused():
+        for _ in range(num_runs):
+            start = time.perf_counter_ns()
+            passed, total = table.validate_passed()
+            failed = total - passed
+            timings.append(time.perf_counter_ns() - start)
+    return failed, timings
+
+
+def benchmark_validator(csv_path, num_runs):
+    """Run the checks with DataGuard, return (failed rules, timings)."""
+    # Rules are compiled once, runs only pay for reading and validating.
+    table = dataguard.CsvTable(csv_path, "benchmark")
+    table.prepare(benchmark_rules())
+    return time_table(table, num_runs)
+
+
+def benchmark_validator_parquet(csv_path, num_runs):
+    """Run the checks on a Parquet copy of the CSV, return (failed rules, timings).
+
+    Parquet columns are already typed, comparing with the CSV run separates the
+    cost of parsing CSV text from the cost of evaluating the rules.
+    """
+    parquet_path = os.path.splitext(csv_path)[0] + ".parquet"
+    # A copy older than the CSV holds stale data, it is written again
+    is_stale = not os.path.exists(parquet_path) or (
+        os.path.getmtime(parquet_path) < os.path.getmtime(csv_path)
+    )
+    if is_stale:
+        pq.write_table(pa_csv.read_csv(csv_path), parquet_path)
+
+    table = dataguard.ParquetTable(parquet_path, "benchmark")
+    table.prepare(benchmark_rules())
+    return time_table(table, num_runs)
+
+
+def prewarm(csv_path):
+    """Load the file into the page cache so no run pays for a cold read."""
+    with open(csv_path, "rb") as f:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+        while f.read(8 << 20):
+            pass
+
+
+def report(label, count_label, count, timings):
+    """Print best and mean run times, timings are in nanoseconds.
+
+    pandas counts failing rows while DataGuard counts failed rules, count_label
+    tells them apart.
+    """
+    best = min(timings) / 1e9
+    mean = sum(timings) / len(timings) / 1e9
+    count = f"{count_label}={count}"
+    print(f"{label:<18} {count:<24} best={best:.4f}s mean={mean:.4f}s")
+
+
+def main():
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_CSV
+    num_runs = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_RUNS
+
+    print(f"Benchmarking {csv_path} ({num_runs} runs)\n")
+    prewarm(csv_path)
+    warm_kernels()
+    report("pandas", "row_errors", *benchmark_pandas(csv_path, num_runs))
+    report("dataguard", "failed_rules", *benchmark_validator(csv_path, num_runs))
+    if pa is not None:
+        report(
+            "dataguard parquet",
+            "failed_rules",
+            *benchmark_validator_parquet(csv_path, num_runs),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -43,7 +43,7 @@ fn create_string_array_with_uniqueness(
 }
 
 // Prebuild arrays for 100% unique scenario
-// Worst case: HashSet grows to full array size
+// Worst case: every hash is kept after deduplication
 static ARRAYS_100PCT_UNIQUE: Lazy<Vec<(usize, Arc<StringArray>)>> = Lazy::new(|| {
     let sizes = [1_000usize, 10_000, 100_000, 300_000];
     let mut v = Vec::with_capacity(sizes.len());
@@ -67,8 +67,8 @@ static ARRAYS_50PCT_UNIQUE: Lazy<Vec<(usize, Arc<StringArray>)>> = Lazy::new(||
 });
 
 /// Benchmark unicity check with 100% unique values.
-/// This represents the worst case for memory usage as the HashSet
-/// must grow to contain all elements.
+/// This represents the worst case for memory usage as no hash
+/// is dropped by the deduplication.
 fn bench_unicity_100pct_unique(c: &mut Criterion) {
     let mut group = c.benchmark_group("unicity_100pct_unique");
 
@@ -78,7 +78,7 @@ fn bench_unicity_100pct_unique(c: &mut Criterion) {
         group.throughput(criterion::Throughput::Elements(*size as u64));
         group.bench_with_input(BenchmarkId::from_parameter(size), arr, |b, arr_ref| {
             b.iter(|| {
-                let (null_count, _hash_set) = rule.validate_str(arr_ref.as_ref());
+                let (null_count, _hashes) = rule.validate_str(arr_ref.as_ref());
                 // Only black_box the null_count as requested
                 black_box(null_count);
             });
@@ -90,7 +90,7 @@ fn bench_unicity_100pct_unique(c: &mut Criterion) {
 
 /// Benchmark unicity check with 50% unique values.
 /// This represents a realistic scenario with moderate duplication.
-/// HashSet grows to half the array size.
+/// Deduplication keeps half of the hashes.
 fn bench_unicity_50pct_unique(c: &mut Criterion) {
     let mut group = c.benchmark_group("unicity_50pct_unique");
 
@@ -100,7 +100,7 @@ fn bench_unicity_50pct_unique(c: &mut Criterion) {
         group.throughput(criterion::Throughput::Elements(*size as u64));
         group.bench_with_input(BenchmarkId::from_parameter(size), arr, |b, arr_ref| {
             b.iter(|| {
-                let (null_count, _hash_set) = rule.validate_str(arr_ref.as_ref());
+                let (null_count, _hashes) = rule.validate_str(arr_ref.as_ref());
                 // Only black_box the null_count as requested
                 black_box(null_count);
             });
@@ -37,6 +37,14 @@ fn test_string_column_invalid_regex() {
     assert!(result.is_err());
 }
 
+#[test]
+fn test_string_column_invalid_regex_flag() {
+    let mut builder = StringColumnBuilder::new("test".to_string());
+    let result = builder.with_regex("abc".to_string(), Some("z".to_string()), 0.0);
+
+    assert!(result.is_err());
+}
+
 #[test]
 fn test_integer_column_builder() {
     let mut builder = NumericColumnBuilder::<i64>::new("age".to_string());
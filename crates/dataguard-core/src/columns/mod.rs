@@ -7,10 +7,11 @@ pub mod string_builder;
 mod columns_test;
 
 use core::f64;
+use std::sync::Arc;
 
 use crate::utils::operator::CompOperator;
 
-pub trait ColumnBuilder {
+pub trait ColumnBuilder: Send + Sync {
     fn name(&self) -> &str;
     fn column_type(&self) -> ColumnType;
     fn rules(&self) -> &[ColumnRule];
@@ -85,7 +86,8 @@ pub enum ColumnRule {
     StringMembers {
         name: String,
         threshold: f64,
-        members: Vec<String>,
+        // Shared so cloning a builder never deep-copies the allowed values
+        members: Arc<[String]>,
     },
 
     // Numeric rules (works for both Integer and Float)
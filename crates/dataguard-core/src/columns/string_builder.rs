@@ -1,8 +1,8 @@
 use crate::{
     columns::{ColumnBuilder, ColumnRule, ColumnType},
     errors::RuleError,
+    rules::string::{check_pattern, EMAIL_PATTERN, URL_PATTERN, UUID_PATTERN},
 };
-use regex::Regex;
 
 #[derive(Debug, Clone)]
 pub struct StringColumnBuilder {
@@ -109,7 +109,7 @@ impl StringColumnBuilder {
         self.rules.push(ColumnRule::StringMembers {
             name: "IsIn".to_string(),
             threshold,
-            members,
+            members: members.into(),
         });
         self
     }
@@ -121,10 +121,8 @@ impl StringColumnBuilder {
         flags: Option<String>,
         threshold: f64,
     ) -> Result<&mut Self, RuleError> {
-        // Validate regex at build time
-        Regex::new(&pattern).map_err(|e| {
-            RuleError::ValidationError(format!("Invalid regex pattern '{}': {}", pattern, e))
-        })?;
+        // Validate the pattern at build time, the compiled regex is cached for the compiler
+        check_pattern(&pattern, flags.as_deref())?;
         self.rules.push(ColumnRule::StringRegex {
             name: "WithRegex".to_string(),
             threshold,
@@ -141,10 +139,8 @@ impl StringColumnBuilder {
         flags: Option<String>,
         threshold: f64,
     ) -> Result<&mut Self, RuleError> {
-        // Validate regex at build time
-        Regex::new(&pattern).map_err(|e| {
-            RuleError::ValidationError(format!("Invalid regex pattern '{}': {}", pattern, e))
-        })?;
+        // Validate the pattern at build time, the compiled regex is cached for the compiler
+        check_pattern(&pattern, flags.as_deref())?;
         self.rules.push(ColumnRule::StringRegex {
             name,
             threshold,
@@ -164,6 +160,19 @@ impl StringColumnBuilder {
         )
     }
 
+    /// Check if string contains only ASCII digits, `0-9`
+    ///
+    /// Unlike `is_numeric`, digits from other scripts are violations. The check
+    /// runs 8 bytes at a time.
+    pub fn is_ascii_digit(&mut self, threshold: f64) -> Result<&mut Self, RuleError> {
+        self.with_defined_regex(
+            "IsAsciiDigit".to_string(),
+            r"^[0-9]+$".to_string(),
+            None,
+            threshold,
+        )
+    }
+
     /// Check if string contains only alphabetic characters
     pub fn is_alpha(&mut self, threshold: f64) -> Result<&mut Self, RuleError> {
         self.with_defined_regex(
@@ -208,7 +217,7 @@ impl StringColumnBuilder {
     pub fn is_url(&mut self, threshold: f64) -> Result<&mut Self, RuleError> {
         self.with_defined_regex(
             "IsUrl".to_string(),
-            r"^https?://[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}".to_string(),
+            URL_PATTERN.to_string(),
             None,
             threshold,
         )
@@ -218,7 +227,7 @@ impl StringColumnBuilder {
     pub fn is_email(&mut self, threshold: f64) -> Result<&mut Self, RuleError> {
         self.with_defined_regex(
             "IsEmail".to_string(),
-            r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$".to_string(),
+            EMAIL_PATTERN.to_string(),
             None,
             threshold,
         )
@@ -228,8 +237,7 @@ impl StringColumnBuilder {
     pub fn is_uuid(&mut self, threshold: f64) -> Result<&mut Self, RuleError> {
         self.with_defined_regex(
             "IsUuid".to_string(),
-            r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
-                .to_string(),
+            UUID_PATTERN.to_string(),
             None,
             threshold,
         )
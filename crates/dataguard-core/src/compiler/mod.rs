@@ -74,18 +74,14 @@ fn compile_string_rules(
                     *threshold,
                     pattern.clone(),
                     flags.clone(),
-                )));
+                )?));
             }
             ColumnRule::StringMembers {
                 name,
                 threshold,
                 members,
             } => {
-                executable_rules.push(Box::new(IsInCheck::new(
-                    name.clone(),
-                    *threshold,
-                    members.to_vec(),
-                )));
+                executable_rules.push(Box::new(IsInCheck::new(name.clone(), *threshold, members)));
             }
             ColumnRule::Unicity { threshold } => {
                 unicity_check = Some(UnicityCheck::new(*threshold));
@@ -96,7 +96,7 @@ impl ResultAccumulator {
             .and_modify(|(counter, _)| {
                 counter.fetch_add(error_count, Ordering::Relaxed);
             })
-            .or_insert_with(|| (AtomicUsize::new(0), Mutex::new(threshold)));
+            .or_insert_with(|| (AtomicUsize::new(error_count), Mutex::new(threshold)));
     }
 
     /// Consolidates atomic counters into a final report of validation results.
@@ -0,0 +1,66 @@
+use std::{
+    collections::HashMap,
+    sync::{Arc, Mutex},
+};
+
+use arrow::compute::concat;
+use arrow_array::Array;
+
+use crate::validator::ExecutableColumn;
+
+// (batch index, first value, last value)
+type BatchBoundary = (usize, Arc<dyn Array>, Arc<dyn Array>);
+
+/// Collects the first and last value of every batch for columns with rules
+/// comparing neighbouring rows.
+///
+/// Batches are validated in parallel, so such rules only see the pairs inside a
+/// batch. Once every batch is done, the last value of each batch is paired with
+/// the first value of the next one so the pairs across boundaries are checked too.
+pub(crate) struct BoundaryAccumulator {
+    // Column name → boundaries of each validated batch
+    boundaries: HashMap<String, Mutex<Vec<BatchBoundary>>>,
+}
+
+impl BoundaryAccumulator {
+    /// Create accumulator for columns that have sequential rules.
+    pub fn new(columns: &[ExecutableColumn]) -> Self {
+        let boundaries = columns
+            .iter()
+            .filter(|column| column.has_sequential_rules())
+            .map(|column| (column.get_name(), Mutex::new(Vec::new())))
+            .collect();
+        Self { boundaries }
+    }
+
+    /// Record the first and last value of a batch.
+    ///
+    /// Columns without sequential rules are ignored.
+    pub fn record_boundaries(&self, column_name: &str, batch_index: usize, array: &dyn Array) {
+        if array.is_empty() {
+            return;
+        }
+        if let Some(boundaries) = self.boundaries.get(column_name) {
+            let first = array.slice(0, 1);
+            let last = array.slice(array.len() - 1, 1);
+            boundaries.lock().unwrap().push((batch_index, first, last));
+        }
+    }
+
+    /// Build a two-value array for each pair of consecutive batches: the last
+    /// value of a batch followed by the first value of the next one.
+    ///
+    /// Batches that failed validation leave a gap and are not bridged.
+    pub fn boundary_pairs(&self, column_name: &str) -> Vec<Arc<dyn Array>> {
+        let Some(boundaries) = self.boundaries.get(column_name) else {
+            return Vec::new();
+        };
+        let mut boundaries = boundaries.lock().unwrap();
+        boundaries.sort_unstable_by_key(|(batch_index, _, _)| *batch_index);
+        boundaries
+            .windows(2)
+            .filter(|pair| pair[0].0 + 1 == pair[1].0)
+            .filter_map(|pair| concat(&[pair[0].2.as_ref(), pair[1].1.as_ref()]).ok())
+            .collect()
+    }
+}
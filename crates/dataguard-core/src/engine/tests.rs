@@ -279,6 +279,17 @@ mod result_accumulator_tests {
         let column_res = &column_results["column1"];
         assert_eq!(column_res[0].error_count, 100);
     }
+
+    #[test]
+    fn test_record_relation_result_keeps_first_count() {
+        let accumulator = ResultAccumulator::new();
+        accumulator.set_total_rows(100);
+        accumulator.record_relation_result("a | b", "rule1".to_string(), 0.0, 4);
+        accumulator.record_relation_result("a | b", "rule1".to_string(), 0.0, 3);
+
+        let (_, _, relation_results) = accumulator.to_results();
+        assert_eq!(relation_results["a | b"][0].error_count, 7);
+    }
 }
 
 // ============================================================================
@@ -288,9 +299,7 @@ mod result_accumulator_tests {
 #[cfg(test)]
 mod unicity_accumulator_tests {
     use super::*;
-    use crate::utils::hasher::Xxh3Builder;
     use rayon::prelude::*;
-    use std::collections::HashSet;
     use xxhash_rust::xxh3::xxh3_64;
 
     #[test]
@@ -331,9 +340,9 @@ mod unicity_accumulator_tests {
         let columns = vec![col];
         let accumulator = UnicityAccumulator::new(&columns, 1);
 
-        let mut hashes = HashSet::with_hasher(Xxh3Builder);
-        hashes.insert(xxh3_64(b"test1"));
-        hashes.insert(xxh3_64(b"test2"));
+        let mut hashes = Vec::new();
+        hashes.push(xxh3_64(b"test1"));
+        hashes.push(xxh3_64(b"test2"));
 
         accumulator.record_hashes("email", 0, hashes);
 
@@ -347,11 +356,11 @@ mod unicity_accumulator_tests {
         let columns = vec![col];
         let accumulator = UnicityAccumulator::new(&columns, 2);
 
-        let mut hashes1 = HashSet::with_hasher(Xxh3Builder);
-        hashes1.insert(xxh3_64(b"test1"));
+        let mut hashes1 = Vec::new();
+        hashes1.push(xxh3_64(b"test1"));
 
-        let mut hashes2 = HashSet::with_hasher(Xxh3Builder);
-        hashes2.insert(xxh3_64(b"test2"));
+        let mut hashes2 = Vec::new();
+        hashes2.push(xxh3_64(b"test2"));
 
         accumulator.record_hashes("email", 0, hashes1);
         accumulator.record_hashes("email", 0, hashes2);
@@ -368,11 +377,11 @@ mod unicity_accumulator_tests {
 
         let hash = xxh3_64(b"duplicate");
 
-        let mut hashes1 = HashSet::with_hasher(Xxh3Builder);
-        hashes1.insert(hash);
+        let mut hashes1 = Vec::new();
+        hashes1.push(hash);
 
-        let mut hashes2 = HashSet::with_hasher(Xxh3Builder);
-        hashes2.insert(hash);
+        let mut hashes2 = Vec::new();
+        hashes2.push(hash);
 
         accumulator.record_hashes("email", 0, hashes1);
         accumulator.record_hashes("email", 0, hashes2);
@@ -387,10 +396,10 @@ mod unicity_accumulator_tests {
         let columns = vec![col];
         let accumulator = UnicityAccumulator::new(&columns, 3);
 
-        let mut hashes = HashSet::with_hasher(Xxh3Builder);
-        hashes.insert(xxh3_64(b"test1"));
-        hashes.insert(xxh3_64(b"test2"));
-        hashes.insert(xxh3_64(b"test3"));
+        let mut hashes = Vec::new();
+        hashes.push(xxh3_64(b"test1"));
+        hashes.push(xxh3_64(b"test2"));
+        hashes.push(xxh3_64(b"test3"));
 
         accumulator.record_hashes("email", 0, hashes);
 
@@ -404,9 +413,9 @@ mod unicity_accumulator_tests {
         let columns = vec![col];
         let accumulator = UnicityAccumulator::new(&columns, 5);
 
-        let mut hashes = HashSet::with_hasher(Xxh3Builder);
-        hashes.insert(xxh3_64(b"test1"));
-        hashes.insert(xxh3_64(b"test2"));
+        let mut hashes = Vec::new();
+        hashes.push(xxh3_64(b"test1"));
+        hashes.push(xxh3_64(b"test2"));
 
         accumulator.record_hashes("email", 0, hashes);
 
@@ -420,8 +429,8 @@ mod unicity_accumulator_tests {
         let columns = vec![col];
         let accumulator = UnicityAccumulator::new(&columns, 10);
 
-        let mut hashes = HashSet::with_hasher(Xxh3Builder);
-        hashes.insert(xxh3_64(b"same"));
+        let mut hashes = Vec::new();
+        hashes.push(xxh3_64(b"same"));
 
         accumulator.record_hashes("email", 0, hashes);
 
@@ -438,8 +447,8 @@ mod unicity_accumulator_tests {
 
         // Different threads recording to different columns
         (0..10).into_par_iter().for_each(|i| {
-            let mut hashes = HashSet::with_hasher(Xxh3Builder);
-            hashes.insert(xxh3_64(format!("value{}", i).as_bytes()));
+            let mut hashes = Vec::new();
+            hashes.push(xxh3_64(format!("value{}", i).as_bytes()));
 
             if i % 2 == 0 {
                 accumulator.record_hashes("col1", 0, hashes);
@@ -462,8 +471,8 @@ mod unicity_accumulator_tests {
 
         // Multiple threads recording to same column
         (0..10).into_par_iter().for_each(|i| {
-            let mut hashes = HashSet::with_hasher(Xxh3Builder);
-            hashes.insert(xxh3_64(format!("value{}", i).as_bytes()));
+            let mut hashes = Vec::new();
+            hashes.push(xxh3_64(format!("value{}", i).as_bytes()));
             accumulator.record_hashes("email", 0, hashes);
         });
 
@@ -652,6 +661,79 @@ mod validation_engine_tests {
         assert!(length_errors >= 2); // At least 2 errors from short strings
     }
 
+    #[test]
+    fn test_validate_low_cardinality_regex() {
+        let mut builder = StringColumnBuilder::new("currency".to_string());
+        builder
+            .with_regex("^(EUR|USD|GBP)$".to_string(), None, 0.0)
+            .unwrap();
+        let col = compiler::compile_column(Box::new(builder), true).unwrap();
+        let columns = vec![col].into_boxed_slice();
+        let relations = None;
+        let engine = ValidationEngine::new(&columns, &relations);
+
+        // 3 distinct values over 64 rows, each distinct value is checked once
+        let mut values = vec![Some("EUR"); 40];
+        values.extend(vec![Some("usd"); 20]);
+        values.extend(vec![None; 4]);
+        let batch = create_string_batch("currency", values);
+
+        let result = engine
+            .validate_batches("test_table".to_string(), &[batch])
+            .unwrap();
+
+        let column_results = result.get_column_results();
+        let regex_errors = column_results["currency"]
+            .iter()
+            .find(|r| r.rule_name == "WithRegex")
+            .map(|r| r.error_count)
+            .unwrap_or(0);
+
+        assert_eq!(regex_errors, 20);
+    }
+
+    #[test]
+    fn test_validate_string_rules_single_walk() {
+        let mut builder = StringColumnBuilder::new("code".to_string());
+        builder
+            .with_min_length(3, 0.0)
+            .with_max_length(5, 0.0)
+            .is_alpha(0.0)
+            .unwrap();
+        let col = compiler::compile_column(Box::new(builder), true).unwrap();
+        let columns = vec![col].into_boxed_slice();
+        let relations = None;
+        let engine = ValidationEngine::new(&columns, &relations);
+
+        let batch = create_string_batch(
+            "code",
+            vec![
+                Some("abc"),    // Valid
+                Some("ab"),     // Too short
+                Some("abcdef"), // Too long
+                Some("ab1"),    // Not alphabetic
+                Some("a1"),     // Too short and not alphabetic
+                None,
+            ],
+        );
+
+        let result = engine
+            .validate_batches("test_table".to_string(), &[batch])
+            .unwrap();
+
+        let column_results = result.get_column_results();
+        let errors = |rule_name: &str| {
+            column_results["code"]
+                .iter()
+                .find(|r| r.rule_name == rule_name)
+                .map(|r| r.error_count)
+                .unwrap()
+        };
+        assert_eq!(errors("WithMinLength"), 2);
+        assert_eq!(errors("WithMaxLength"), 1);
+        assert_eq!(errors("IsAlpha"), 2);
+    }
+
     #[test]
     fn test_validate_null_check() {
         let col = create_string_column_with_null_check("email");
@@ -688,6 +770,42 @@ mod validation_engine_tests {
         assert_eq!(null_errors, 2);
     }
 
+    #[test]
+    fn test_stats_column_missing_from_batch() {
+        // "missing" is not in the batch, the stats of "b" must still be computed on "b"
+        let columns = vec![
+            create_int_column_with_stats("missing", 0, 10),
+            create_int_column_with_stats("b", 0, 10),
+            create_int_column_with_stats("c", 0, 10),
+        ]
+        .into_boxed_slice();
+        let relations = None;
+        let engine = ValidationEngine::new(&columns, &relations);
+
+        let schema = Schema::new(vec![
+            Field::new("b", DataType::Utf8, true),
+            Field::new("c", DataType::Utf8, true),
+        ]);
+        let b = StringArray::from(vec!["1", "2", "3", "4"]);
+        let c = StringArray::from(vec!["1", "x", "y", "4"]);
+        let batch = RecordBatch::try_new(Arc::new(schema), vec![Arc::new(b), Arc::new(c)]).unwrap();
+
+        let result = engine
+            .validate_batches("test_table".to_string(), &[Arc::new(batch)])
+            .unwrap();
+
+        let column_results = result.get_column_results();
+        let type_errors = |column: &str| {
+            column_results[column]
+                .iter()
+                .find(|r| r.rule_name == "TypeCheck")
+                .map(|r| r.error_count)
+                .unwrap()
+        };
+        assert_eq!(type_errors("b"), 0);
+        assert_eq!(type_errors("c"), 2);
+    }
+
     #[test]
     fn test_unicity_single_batch_no_duplicates() {
         let col = create_string_column_with_unicity("email");
@@ -870,6 +988,32 @@ mod validation_engine_tests {
         assert_eq!(result.total_rows, 5);
     }
 
+    #[test]
+    fn test_monotonicity_across_batches() {
+        let mut builder = NumericColumnBuilder::<i64>::new("index".to_string());
+        builder.is_monotonically_increasing(0.0);
+        let col = compiler::compile_column(Box::new(builder), true).unwrap();
+        let columns = vec![col].into_boxed_slice();
+        let relations = None;
+        let engine = ValidationEngine::new(&columns, &relations);
+
+        let batch1 = create_int_batch("index", vec![Some(1), Some(2), Some(5)]);
+        let batch2 = create_int_batch("index", vec![Some(3), Some(4)]); // 5 -> 3 across batches
+        let batch3 = create_int_batch("index", vec![Some(6), Some(7)]);
+
+        let result = engine
+            .validate_batches("test_table".to_string(), &[batch1, batch2, batch3])
+            .unwrap();
+
+        let column_results = result.get_column_results();
+        let violations = column_results["index"]
+            .iter()
+            .find(|r| r.rule_name == "IsIncreasing")
+            .map(|r| r.error_count)
+            .unwrap();
+        assert_eq!(violations, 1);
+    }
+
     #[test]
     fn test_validate_date_relation() {
         // Create two date columns
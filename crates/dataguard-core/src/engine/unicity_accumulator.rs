@@ -1,19 +1,20 @@
+use rayon::slice::ParallelSliceMut;
 use std::{
-    collections::{HashMap, HashSet},
+    collections::HashMap,
     sync::{
         atomic::{AtomicUsize, Ordering},
         Arc, Mutex,
     },
 };
 
-use crate::{types::UnicityRecord, utils::hasher::Xxh3Builder, validator::ExecutableColumn};
+use crate::{types::UnicityRecord, validator::ExecutableColumn};
 
 /// Manages uniqueness checking across batches.
 ///
-/// Collects hashes during parallel validation, then calculates
-/// duplicate counts after all batches are processed.
+/// Collects hashes during parallel validation, then sorts them and
+/// counts the distinct ones after all batches are processed.
 pub(crate) struct UnicityAccumulator {
-    // Column name → global hash set (thread-safe)
+    // Column name → global hash list (thread-safe)
     accumulators: HashMap<String, UnicityRecord>,
 }
 
@@ -24,10 +25,7 @@ impl UnicityAccumulator {
 
         for column in columns {
             if column.has_unicity() {
-                let map = Arc::new(Mutex::new(HashSet::with_capacity_and_hasher(
-                    capacity,
-                    Xxh3Builder,
-                )));
+                let map = Arc::new(Mutex::new(Vec::with_capacity(capacity)));
                 let threshold = column.get_unicity_threshold();
                 let null_counter = AtomicUsize::new(0);
                 accumulators.insert(column.get_name(), (null_counter, map, threshold));
@@ -43,12 +41,7 @@ impl UnicityAccumulator {
     ///
     /// Panics if `column_name` was not registered during `new()`.
     /// This indicates a programming error in the validation engine.
-    pub fn record_hashes(
-        &self,
-        column_name: &str,
-        null_count: usize,
-        hashes: HashSet<u64, Xxh3Builder>,
-    ) {
+    pub fn record_hashes(&self, column_name: &str, null_count: usize, hashes: Vec<u64>) {
         // SAFETY: since we instanciate the hashmap with all projected columns we can unwrap
         let (counter, map, _) = self.accumulators.get(column_name).unwrap();
         counter.fetch_add(null_count, Ordering::Relaxed);
@@ -61,7 +54,12 @@ impl UnicityAccumulator {
         self.accumulators
             .iter()
             .map(|(name, (c, h, t))| {
-                let u = h.lock().unwrap().len();
+                let u = {
+                    let mut hashes = h.lock().unwrap();
+                    hashes.par_sort_unstable();
+                    hashes.dedup();
+                    hashes.len()
+                };
                 let n = c.load(Ordering::Relaxed);
                 // We get the total number of rows
                 // We substract the null count, to get the total valid row
@@ -1,30 +1,29 @@
 use super::accumulator::ResultAccumulator;
 use arrow::datatypes::{Date32Type, Float64Type, Int64Type};
-use std::{
-    collections::HashMap,
-    sync::{
-        atomic::{AtomicUsize, Ordering},
-        Arc,
-    },
-};
+use std::{collections::HashMap, sync::Arc};
 
 use arrow_array::{Array, ArrowNumericType, PrimitiveArray, RecordBatch, StringArray};
 use rayon::prelude::*;
 
 use crate::{
     engine::{
+        boundary_accumulator::BoundaryAccumulator,
         stats_accumulator::{merge_stats, StatsAccumulator},
         unicity_accumulator::UnicityAccumulator,
         Stats,
     },
     rules::{
         date::{DateRule, DateTypeCheck},
-        NullCheck, NumericRule, StringRule, TypeCheck, UnicityCheck,
+        string::valid_values,
+        DistinctValues, NullCheck, NumericRule, StringRule, TypeCheck, UnicityCheck,
     },
     validator::{ExecutableColumn, ExecutableRelation},
     RuleError, ValidationResult,
 };
 
+/// Type check results of a batch: column name → (type errors, casted array)
+type CastedColumns = HashMap<String, (usize, Arc<dyn Array>)>;
+
 /// ValidationEngine - executes validation rules on Arrow RecordBatches.
 ///
 /// Independent of data source - works with any system that produces Arrow batches.
@@ -64,33 +63,41 @@ impl<'a> ValidationEngine<'a> {
         }
     }
 
+    /// Compute the statistics of every column with statistical rules.
+    ///
+    /// Computing them requires casting the columns, the casts are handed back per
+    /// batch so the validation pass reuses them instead of parsing the text again.
     fn compute_stats(
         &self,
         batches: &[Arc<RecordBatch>],
         columns: &[&ExecutableColumn],
-    ) -> HashMap<String, Stats> {
-        let index: Vec<usize> = columns
+    ) -> (HashMap<String, Stats>, Vec<CastedColumns>) {
+        // Columns missing from the file are skipped, each index stays with its column
+        let indexed: Vec<(usize, &ExecutableColumn)> = columns
             .iter()
-            .filter_map(|col| batches[0].schema().index_of(&col.get_name()).ok())
+            .filter_map(|col| Some((batches[0].schema().index_of(&col.get_name()).ok()?, *col)))
             .collect();
-        batches
+        let per_batch: Vec<(HashMap<String, Stats>, CastedColumns)> = batches
             .par_iter()
             .map(|batch| {
                 let mut local_accumulator = StatsAccumulator::default();
-                for (idx, exec_col) in index.iter().zip(columns.iter()) {
-                    let array = batch.column(*idx);
+                let mut casted_columns = CastedColumns::new();
+                for &(idx, exec_col) in &indexed {
+                    let array = batch.column(idx);
                     match exec_col {
                         ExecutableColumn::Integer { type_check, .. } => {
-                            let (_, typed_array) = if let Some(tc) = type_check {
+                            let typed_array = if let Some(tc) = type_check {
                                 if let Ok((res, typed_array)) = tc.validate(array) {
-                                    (res, typed_array)
+                                    casted_columns
+                                        .insert(exec_col.get_name(), (res, typed_array.clone()));
+                                    typed_array
                                 } else {
                                     // There was an error processing this batch
                                     // we can not safely compute any stats
                                     continue;
                                 }
                             } else {
-                                (0, array.clone())
+                                array.clone()
                             };
 
                             if let Some(int_array) = typed_array
@@ -101,16 +108,18 @@ impl<'a> ValidationEngine<'a> {
                             }
                         }
                         ExecutableColumn::Float { type_check, .. } => {
-                            let (_, typed_array) = if let Some(tc) = type_check {
+                            let typed_array = if let Some(tc) = type_check {
                                 if let Ok((res, typed_array)) = tc.validate(array) {
-                                    (res, typed_array)
+                                    casted_columns
+                                        .insert(exec_col.get_name(), (res, typed_array.clone()));
+                                    typed_array
                                 } else {
                                     // There was an error processing this batch
                                     // we can not safely compute any stats
                                     continue;
                                 }
                             } else {
-                                (0, array.clone())
+                                array.clone()
                             };
 
                             if let Some(float_array) = typed_array
@@ -123,18 +132,24 @@ impl<'a> ValidationEngine<'a> {
                         _ => {} // Date and String dont have stats rules yet
                     }
                 }
-                local_accumulator.columns
-            })
-            .reduce(HashMap::new, |mut acc1, acc2| {
-                for (colname, stats2) in acc2 {
-                    acc1.entry(colname)
-                        .and_modify(|stats1| {
-                            *stats1 = merge_stats(stats1.clone(), stats2.clone());
-                        })
-                        .or_insert(stats2);
-                }
-                acc1
+                (local_accumulator.columns, casted_columns)
             })
+            .collect();
+
+        let mut columns_stats: HashMap<String, Stats> = HashMap::new();
+        let mut casted_batches = Vec::with_capacity(per_batch.len());
+        for (batch_stats, casted_columns) in per_batch {
+            for (colname, stats2) in batch_stats {
+                columns_stats
+                    .entry(colname)
+                    .and_modify(|stats1| {
+                        *stats1 = merge_stats(stats1.clone(), stats2.clone());
+                    })
+                    .or_insert(stats2);
+            }
+            casted_batches.push(casted_columns);
+        }
+        (columns_stats, casted_batches)
     }
 
     /// Validate batches and produce a validation result.
@@ -144,147 +159,185 @@ impl<'a> ValidationEngine<'a> {
         table_name: String,
         batches: &[Arc<RecordBatch>],
     ) -> Result<ValidationResult, RuleError> {
-        let error_counter = AtomicUsize::new(0);
         let report = ResultAccumulator::new();
 
         let total_rows: usize = batches.iter().map(|batch| batch.num_rows()).sum();
         report.set_total_rows(total_rows);
 
         let unicity_accumulators = UnicityAccumulator::new(self.columns, total_rows);
+        let boundary_accumulator = BoundaryAccumulator::new(self.columns);
         let mut columns_stats: HashMap<String, Stats> = HashMap::new();
+        let mut casted_batches: Vec<CastedColumns> = Vec::new();
         if let Some(columns) = self.get_cols_with_stats() {
-            columns_stats = self.compute_stats(batches, &columns);
+            (columns_stats, casted_batches) = self.compute_stats(batches, &columns);
         }
-        batches.par_iter().for_each(|batch| {
-            // We keep in memory a reference to the casted array
-            let mut array_ref: HashMap<String, Arc<dyn Array>> = HashMap::new();
-            for executable_col in self.columns {
-                match executable_col {
-                    ExecutableColumn::String {
-                        name,
-                        rules,
-                        type_check,
-                        unicity_check,
-                        null_check,
-                    } => {
-                        if let Ok(col_index) = batch.schema().index_of(name) {
-                            let array = batch.column(col_index);
-                            let _ = validate_string_column(
+        // All batches share one schema, columns are looked up by name once
+        // instead of once per batch.
+        let column_indices: Vec<Option<usize>> = match batches.first() {
+            Some(batch) => {
+                let schema = batch.schema();
+                self.columns
+                    .iter()
+                    .map(|col| schema.index_of(&col.get_name()).ok())
+                    .collect()
+            }
+            None => Vec::new(),
+        };
+        batches
+            .par_iter()
+            .enumerate()
+            .for_each(|(batch_index, batch)| {
+                // Columns already cast while computing the stats
+                let casted_columns = casted_batches.get(batch_index);
+                // The columns of a batch are validated in parallel too, so a file
+                // read in fewer batches than there are threads still uses them all.
+                // We keep in memory a reference to the casted arrays for the relations
+                let array_ref: HashMap<String, Arc<dyn Array>> = self
+                    .columns
+                    .par_iter()
+                    .zip(column_indices.par_iter())
+                    .filter_map(|(executable_col, col_index)| {
+                        let array = batch.column((*col_index)?);
+                        match executable_col {
+                            ExecutableColumn::String {
                                 name,
                                 rules,
                                 type_check,
                                 unicity_check,
                                 null_check,
+                            } => {
+                                let _ = validate_string_column(
+                                    name,
+                                    rules,
+                                    type_check,
+                                    unicity_check,
+                                    null_check,
+                                    array,
+                                    &report,
+                                    &unicity_accumulators,
+                                );
+                                None
+                            }
+                            ExecutableColumn::Integer {
+                                name,
+                                domain_rules,
+                                statistical_rules,
+                                type_check,
+                                unicity_check,
+                                null_check,
+                            } => validate_numeric_column::<Int64Type>(
+                                name,
+                                domain_rules,
+                                statistical_rules,
+                                columns_stats.get(name),
+                                type_check,
+                                casted_columns.and_then(|c| c.get(name)).cloned(),
+                                unicity_check,
+                                null_check,
                                 array,
-                                &error_counter,
                                 &report,
                                 &unicity_accumulators,
-                            );
-                        }
-                    }
-                    ExecutableColumn::Integer {
-                        name,
-                        domain_rules,
-                        statistical_rules,
-                        type_check,
-                        unicity_check,
-                        null_check,
-                    } => {
-                        if let Ok(col_index) = batch.schema().index_of(name) {
-                            let array = batch.column(col_index);
-                            let stats = columns_stats.get(name);
-                            if let Ok(casted_array) = validate_numeric_column::<Int64Type>(
+                            )
+                            .ok()
+                            .map(|casted_array| {
+                                boundary_accumulator.record_boundaries(
+                                    name,
+                                    batch_index,
+                                    casted_array.as_ref(),
+                                );
+                                (name.clone(), casted_array)
+                            }),
+                            ExecutableColumn::Float {
+                                name,
+                                domain_rules,
+                                statistical_rules,
+                                type_check,
+                                unicity_check,
+                                null_check,
+                            } => validate_numeric_column::<Float64Type>(
                                 name,
                                 domain_rules,
                                 statistical_rules,
-                                stats,
+                                columns_stats.get(name),
                                 type_check,
+                                casted_columns.and_then(|c| c.get(name)).cloned(),
                                 unicity_check,
                                 null_check,
                                 array,
-                                &error_counter,
                                 &report,
                                 &unicity_accumulators,
-                            ) {
-                                println!("ok: {}", name.clone());
-                                array_ref.insert(name.clone(), casted_array);
-                            }
-                        }
-                    }
-                    ExecutableColumn::Float {
-                        name,
-                        domain_rules,
-                        statistical_rules,
-                        type_check,
-                        unicity_check,
-                        null_check,
-                    } => {
-                        if let Ok(col_index) = batch.schema().index_of(name) {
-                            let array = batch.column(col_index);
-                            let stats = columns_stats.get(name);
-                            if let Ok(casted_array) = validate_numeric_column::<Float64Type>(
+                            )
+                            .ok()
+                            .map(|casted_array| {
+                                boundary_accumulator.record_boundaries(
+                                    name,
+                                    batch_index,
+                                    casted_array.as_ref(),
+                                );
+                                (name.clone(), casted_array)
+                            }),
+                            ExecutableColumn::Date {
                                 name,
-                                domain_rules,
-                                statistical_rules,
-                                stats,
+                                rules,
+                                type_check,
+                                unicity_check,
+                                null_check,
+                            } => validate_date_column(
+                                name,
+                                rules,
                                 type_check,
                                 unicity_check,
                                 null_check,
                                 array,
-                                &error_counter,
                                 &report,
                                 &unicity_accumulators,
-                            ) {
-                                println!("ok: {}", name.clone());
-                                array_ref.insert(name.clone(), casted_array);
-                            }
+                            )
+                            .ok()
+                            .map(|casted_array| (name.clone(), casted_array)),
                         }
-                    }
-                    ExecutableColumn::Date {
-                        name,
-                        rules,
-                        type_check,
-                        unicity_check,
-                        null_check,
-                    } => {
-                        let Ok(col_index) = batch.schema().index_of(name) else {
-                            continue;
-                        };
-                        let array = batch.column(col_index);
-                        if let Ok(casted_array) = validate_date_column(
-                            name,
-                            rules,
-                            type_check,
-                            unicity_check,
-                            null_check,
-                            array,
-                            &error_counter,
-                            &report,
-                            &unicity_accumulators,
-                        ) {
-                            array_ref.insert(name.clone(), casted_array);
+                    })
+                    .collect();
+                if let Some(relations) = self.relations {
+                    for executable_relation in relations {
+                        // Since the array could not be added in case of type cast failure
+                        // We ensure that both key exist before running the validation
+                        if array_ref.contains_key(&executable_relation.names[0])
+                            && array_ref.contains_key(&executable_relation.names[1])
+                        {
+                            validate_relation(executable_relation, &array_ref, &report);
                         }
                     }
                 }
+            });
+
+        // Rules comparing neighbouring rows only saw the pairs inside each batch,
+        // we now check the pairs spanning two consecutive batches
+        for executable_col in self.columns {
+            match executable_col {
+                ExecutableColumn::Integer {
+                    name, domain_rules, ..
+                } => validate_boundaries::<Int64Type>(
+                    name,
+                    domain_rules,
+                    &boundary_accumulator,
+                    &report,
+                ),
+                ExecutableColumn::Float {
+                    name, domain_rules, ..
+                } => validate_boundaries::<Float64Type>(
+                    name,
+                    domain_rules,
+                    &boundary_accumulator,
+                    &report,
+                ),
+                _ => {}
             }
-            if let Some(relations) = self.relations {
-                for executable_relation in relations {
-                    // Since the array could not be added in case of type cast failure
-                    // We ensure that both key exist before running the validation
-                    if array_ref.contains_key(&executable_relation.names[0])
-                        && array_ref.contains_key(&executable_relation.names[1])
-                    {
-                        validate_relation(executable_relation, &array_ref, &error_counter, &report);
-                    }
-                }
-            }
-        });
+        }
 
         // We need to calculate the unicity errors now
         // We unwrap all lock should have been clearer from the earlier loop
         let unicity_errors = unicity_accumulators.finalize(total_rows);
         for (column_name, (unicity_error, threshold)) in unicity_errors {
-            error_counter.fetch_add(unicity_error, Ordering::Relaxed);
             report.record_column_result(
                 &column_name,
                 "Unicity".to_string(),
@@ -322,17 +375,15 @@ fn validate_null_check(
     }
 }
 
-/// Record validation result and update error count
+/// Record validation result
 fn record_validation_result(
     column_name: &str,
     rule_name: String,
     error_count_value: usize,
-    error_counter: &AtomicUsize,
     threshold: f64,
     report: &ResultAccumulator,
     is_col: bool,
 ) {
-    error_counter.fetch_add(error_count_value, Ordering::Relaxed);
     if is_col {
         report.record_column_result(column_name, rule_name, threshold, error_count_value);
     } else {
@@ -346,10 +397,8 @@ fn record_type_check_error(
     column_name: &str,
     type_check_name: String,
     threshold: f64,
-    error_counter: &AtomicUsize,
     report: &ResultAccumulator,
 ) {
-    error_counter.fetch_add(array_len, Ordering::Relaxed);
     report.record_column_result(column_name, type_check_name, threshold, array_len);
 }
 
@@ -370,7 +419,6 @@ fn validate_string_column(
     unicity_check: &Option<UnicityCheck>,
     null_check: &Option<NullCheck>,
     array: &dyn Array,
-    error_counter: &AtomicUsize,
     report: &ResultAccumulator,
     unicity_accumulators: &UnicityAccumulator,
 ) -> Result<(), RuleError> {
@@ -387,7 +435,6 @@ fn validate_string_column(
                     name,
                     type_rule.name(),
                     errors,
-                    error_counter,
                     type_rule.get_threshold(),
                     report,
                     true,
@@ -400,20 +447,8 @@ fn validate_string_column(
                 // Safety: casted_array is StringArray in Ok path
                 let string_array = casted_array.as_any().downcast_ref::<StringArray>().unwrap();
                 // We run all domain level rules
-                for rule in rules {
-                    if let Ok(count) = rule.validate(string_array, name.to_string()) {
-                        record_validation_result(
-                            name,
-                            rule.name(),
-                            count,
-                            error_counter,
-                            rule.get_threshold(),
-                            report,
-                            true,
-                        );
-                    }
-                }
-                // If we have a unicity rule in place, update the global hashset
+                validate_string_rules(name, rules, string_array, report);
+                // If we have a unicity rule in place, record the hashes globally
                 if let Some(unicity_rule) = unicity_check {
                     let (null_count, local_hash) = unicity_rule.validate_str(string_array);
                     unicity_accumulators.record_hashes(name, null_count, local_hash);
@@ -426,7 +461,6 @@ fn validate_string_column(
                     name,
                     type_rule.name(),
                     type_rule.get_threshold(),
-                    error_counter,
                     report,
                 );
                 Err(e)
@@ -439,20 +473,8 @@ fn validate_string_column(
         match res {
             Some(string_array) => {
                 // We run all domain level rules
-                for rule in rules {
-                    if let Ok(count) = rule.validate(string_array, name.to_string()) {
-                        record_validation_result(
-                            name,
-                            rule.name(),
-                            count,
-                            error_counter,
-                            rule.get_threshold(),
-                            report,
-                            true,
-                        );
-                    }
-                }
-                // If we have a unicity rule in place, update the global hashset
+                validate_string_rules(name, rules, string_array, report);
+                // If we have a unicity rule in place, record the hashes globally
                 if let Some(unicity_rule) = unicity_check {
                     let (null_count, local_hash) = unicity_rule.validate_str(string_array);
                     unicity_accumulators.record_hashes(name, null_count, local_hash);
@@ -466,17 +488,76 @@ fn validate_string_column(
     }
 }
 
+/// Run the domain rules of a string column on a batch.
+///
+/// When a rule prefers it and the batch has few distinct values, such as a currency
+/// or status column, the rule checks each distinct value once and weighs the result
+/// by its row count. Length rules read the offsets of the array only. The other
+/// rules share a single walk over the rows, so a batch is read once however many
+/// rules its column has.
+fn validate_string_rules(
+    name: &str,
+    rules: &[Box<dyn StringRule>],
+    array: &StringArray,
+    report: &ResultAccumulator,
+) {
+    let mut counts: Vec<Option<Result<usize, RuleError>>> = rules.iter().map(|_| None).collect();
+
+    let distinct = rules
+        .iter()
+        .any(|rule| rule.prefers_distinct_values())
+        .then(|| DistinctValues::collect(array))
+        .flatten();
+    if let Some(distinct) = &distinct {
+        for (rule, count) in rules.iter().zip(counts.iter_mut()) {
+            if rule.prefers_distinct_values() {
+                *count = Some(Ok(distinct.count_invalid(rule.as_ref())));
+            }
+        }
+    }
+
+    for (rule, count) in rules.iter().zip(counts.iter_mut()) {
+        if count.is_none() && rule.reads_length_only() {
+            *count = Some(rule.validate(array, name.to_string()));
+        }
+    }
+
+    let row_rules: Vec<usize> = (0..rules.len()).filter(|&i| counts[i].is_none()).collect();
+    if let [index] = row_rules[..] {
+        // A single rule keeps its own, specialized, walk
+        counts[index] = Some(rules[index].validate(array, name.to_string()));
+    } else if !row_rules.is_empty() {
+        let mut errors = vec![0; row_rules.len()];
+        for value in valid_values(array) {
+            for (&index, errors) in row_rules.iter().zip(errors.iter_mut()) {
+                *errors += !rules[index].is_valid(value) as usize;
+            }
+        }
+        for (index, errors) in row_rules.into_iter().zip(errors) {
+            counts[index] = Some(Ok(errors));
+        }
+    }
+
+    for (rule, count) in rules.iter().zip(counts) {
+        if let Some(Ok(count)) = count {
+            record_validation_result(name, rule.name(), count, rule.get_threshold(), report, true);
+        }
+    }
+}
+
 /// Validate a numeric column (generic over Int64Type and Float64Type)
+///
+/// `precast` is the type check result of this batch when it was already computed.
 fn validate_numeric_column<T: ArrowNumericType>(
     name: &str,
     rules: &[Box<dyn NumericRule<T>>],
     statistical_rules: &[Box<dyn NumericRule<T>>],
     stats: Option<&Stats>,
     type_check: &Option<TypeCheck>,
+    precast: Option<(usize, Arc<dyn Array>)>,
     unicity_check: &Option<UnicityCheck>,
     null_check: &Option<NullCheck>,
     array: &dyn Array,
-    error_counter: &AtomicUsize,
     report: &ResultAccumulator,
     unicity_accumulators: &UnicityAccumulator,
 ) -> Result<Arc<dyn Array>, RuleError> {
@@ -487,13 +568,16 @@ fn validate_numeric_column<T: ArrowNumericType>(
 
     // we only run a type check if the table is a CsvTable
     if let Some(type_rule) = type_check {
-        match type_rule.validate(array) {
+        let cast_result = match precast {
+            Some(precast) => Ok(precast),
+            None => type_rule.validate(array),
+        };
+        match cast_result {
             Ok((errors, casted_array)) => {
                 record_validation_result(
                     name,
                     type_rule.name(),
                     errors,
-                    error_counter,
                     type_rule.get_threshold(),
                     report,
                     true,
@@ -515,7 +599,6 @@ fn validate_numeric_column<T: ArrowNumericType>(
                             name,
                             rule.name(),
                             count,
-                            error_counter,
                             rule.get_threshold(),
                             report,
                             true,
@@ -530,13 +613,12 @@ fn validate_numeric_column<T: ArrowNumericType>(
                         name,
                         rule.name(),
                         count,
-                        error_counter,
                         rule.get_threshold(),
                         report,
                         true,
                     );
                 }
-                // If we have a unicity rule in place, update the global hashset
+                // If we have a unicity rule in place, record the hashes globally
                 if let Some(unicity_rule) = unicity_check {
                     let (null_count, local_hash) = unicity_rule.validate_numeric(numeric_array);
                     unicity_accumulators.record_hashes(name, null_count, local_hash);
@@ -549,7 +631,6 @@ fn validate_numeric_column<T: ArrowNumericType>(
                     name,
                     type_rule.name(),
                     type_rule.get_threshold(),
-                    error_counter,
                     report,
                 );
                 Err(e)
@@ -568,14 +649,13 @@ fn validate_numeric_column<T: ArrowNumericType>(
                             name,
                             rule.name(),
                             count,
-                            error_counter,
                             rule.get_threshold(),
                             report,
                             true,
                         );
                     }
                 }
-                // If we have a unicity rule in place, update the global hashset
+                // If we have a unicity rule in place, record the hashes globally
                 if let Some(unicity_rule) = unicity_check {
                     let (null_count, local_hash) = unicity_rule.validate_numeric(numeric_array);
                     unicity_accumulators.record_hashes(name, null_count, local_hash);
@@ -597,7 +677,6 @@ pub fn validate_date_column(
     unicity_check: &Option<UnicityCheck>,
     null_check: &Option<NullCheck>,
     array: &dyn Array,
-    error_counter: &AtomicUsize,
     report: &ResultAccumulator,
     unicity_accumulators: &UnicityAccumulator,
 ) -> Result<Arc<dyn Array>, RuleError> {
@@ -614,7 +693,6 @@ pub fn validate_date_column(
                     name,
                     type_rule.name(),
                     errors,
-                    error_counter,
                     type_rule.get_threshold(),
                     report,
                     true,
@@ -631,14 +709,13 @@ pub fn validate_date_column(
                             name,
                             rule.name(),
                             count,
-                            error_counter,
                             rule.get_threshold(),
                             report,
                             true,
                         );
                     }
                 }
-                // If we have a unicity rule in place, update the global hashset
+                // If we have a unicity rule in place, record the hashes globally
                 if let Some(unicity_rule) = unicity_check {
                     let (null_count, local_hash) = unicity_rule.validate_date(&date_array);
                     unicity_accumulators.record_hashes(name, null_count, local_hash);
@@ -651,7 +728,6 @@ pub fn validate_date_column(
                     name,
                     type_rule.name(),
                     type_rule.get_threshold(),
-                    error_counter,
                     report,
                 );
                 Err(RuleError::TypeCastError(
@@ -673,14 +749,13 @@ pub fn validate_date_column(
                             name,
                             rule.name(),
                             count,
-                            error_counter,
                             rule.get_threshold(),
                             report,
                             true,
                         );
                     }
                 }
-                // If we have a unicity rule in place, update the global hashset
+                // If we have a unicity rule in place, record the hashes globally
                 if let Some(unicity_rule) = unicity_check {
                     let (null_count, local_hash) = unicity_rule.validate_numeric(date_array);
                     unicity_accumulators.record_hashes(name, null_count, local_hash);
@@ -695,10 +770,30 @@ pub fn validate_date_column(
     }
 }
 
+/// Validate sequential rules on the pairs of values spanning two consecutive batches
+fn validate_boundaries<T: ArrowNumericType>(
+    name: &str,
+    rules: &[Box<dyn NumericRule<T>>],
+    boundary_accumulator: &BoundaryAccumulator,
+    report: &ResultAccumulator,
+) {
+    let pairs = boundary_accumulator.boundary_pairs(name);
+    if pairs.is_empty() {
+        return;
+    }
+    for rule in rules.iter().filter(|rule| rule.is_sequential()) {
+        let count = pairs
+            .iter()
+            .filter_map(|pair| pair.as_any().downcast_ref::<PrimitiveArray<T>>())
+            .filter_map(|pair| rule.validate(pair, name.to_string()).ok())
+            .sum();
+        record_validation_result(name, rule.name(), count, rule.get_threshold(), report, true);
+    }
+}
+
 fn validate_relation(
     executable_relation: &ExecutableRelation,
     array_ref: &HashMap<String, Arc<dyn Array>>,
-    error_counter: &AtomicUsize,
     report: &ResultAccumulator,
 ) {
     let lhs_name = executable_relation.names[0].as_str();
@@ -712,7 +807,6 @@ fn validate_relation(
                 format!("{} | {}", lhs_name, rhs_name).as_str(),
                 rule.name(),
                 count,
-                error_counter,
                 rule.get_threshold(),
                 report,
                 false,
@@ -1,15 +1,155 @@
 use arrow::csv::ReaderBuilder;
 use arrow::datatypes::{DataType, Field, Schema};
 use arrow::record_batch::RecordBatch;
+use memchr::memchr;
+use memmap2::Mmap;
 use rayon::prelude::*;
-use std::fs::File;
-use std::io::{self, BufRead, BufReader, Read, Seek, SeekFrom};
+use std::fs::{File, Metadata};
+use std::io::{self, BufRead, BufReader, Read};
+use std::ops::Deref;
 use std::sync::Arc;
+use std::time::SystemTime;
 
 use crate::readers::config::{calculate_chunk_size, ReaderConfig};
+use crate::readers::scanner::{ends_in_quotes, find_record_end};
 use crate::readers::BATCH_SIZE;
 
 const MIN_CHUNK_SIZE: u64 = 50 * 1024 * 1024; // 50MB minimum per chunk
+const MMAP_THRESHOLD: u64 = 1024 * 1024; // Files under 1MB are read into memory
+
+/// The raw bytes of a CSV file.
+///
+/// Large files are memory-mapped so every chunk parses straight out of the page
+/// cache, small ones are read into a single buffer where mapping isn't worth it.
+enum FileBytes {
+    Mapped(Mmap),
+    Buffered(Vec<u8>),
+}
+
+impl FileBytes {
+    fn from_file(mut file: File, file_size: u64) -> Result<Self, io::Error> {
+        if file_size < MMAP_THRESHOLD {
+            let mut buffer = Vec::with_capacity(file_size as usize);
+            file.read_to_end(&mut buffer)?;
+            return Ok(FileBytes::Buffered(buffer));
+        }
+        // SAFETY: the map is read-only and is dropped or re-created whenever the
+        // file changes between reads. Truncating the file while it is being read
+        // is not supported.
+        let mmap = unsafe { Mmap::map(&file)? };
+        // The file is scanned front to back right after mapping, let the kernel
+        // read ahead instead of faulting in one page at a time. Advice is only a
+        // hint, a failure does not prevent reading the map.
+        #[cfg(unix)]
+        {
+            let _ = mmap.advise(memmap2::Advice::Sequential);
+            let _ = mmap.advise(memmap2::Advice::WillNeed);
+        }
+        Ok(FileBytes::Mapped(mmap))
+    }
+}
+
+impl Deref for FileBytes {
+    type Target = [u8];
+
+    fn deref(&self) -> &[u8] {
+        match self {
+            FileBytes::Mapped(mmap) => mmap,
+            FileBytes::Buffered(buffer) => buffer,
+        }
+    }
+}
+
+/// Size and modification time, used to tell whether a file changed on disk.
+type Fingerprint = (u64, Option<SystemTime>);
+
+fn fingerprint(metadata: &Metadata) -> Fingerprint {
+    (metadata.len(), metadata.modified().ok())
+}
+
+/// A CSV file opened once and read many times.
+///
+/// The file bytes, header and schema are kept between reads, so validating the
+/// same file repeatedly only pays for parsing. The file is re-opened by
+/// [`CsvSource::refresh`] when its size or modification time changed.
+pub struct CsvSource {
+    path: String,
+    data: FileBytes,
+    header_len: usize,
+    schema: Arc<Schema>,
+    fingerprint: Fingerprint,
+}
+
+impl CsvSource {
+    /// Open a CSV file and parse its header
+    pub fn open(path: &str) -> Result<Self, io::Error> {
+        let file = File::open(path)?;
+        let fingerprint = fingerprint(&file.metadata()?);
+        let data = FileBytes::from_file(file, fingerprint.0)?;
+        let (header, header_len) = split_header(&data)?;
+        let schema = Arc::new(schema_from_header(header));
+        Ok(Self {
+            path: path.to_string(),
+            data,
+            header_len,
+            schema,
+            fingerprint,
+        })
+    }
+
+    /// Re-open the file if it changed on disk since it was opened
+    pub fn refresh(&mut self) -> Result<(), io::Error> {
+        let metadata = std::fs::metadata(&self.path)?;
+        if fingerprint(&metadata) != self.fingerprint {
+            *self = Self::open(&self.path)?;
+        }
+        Ok(())
+    }
+
+    /// The all-Utf8 schema built from the header
+    pub fn schema(&self) -> &Arc<Schema> {
+        &self.schema
+    }
+
+    /// Reads the requested columns in parallel, chunked according to `config`.
+    ///
+    /// Requested columns that are not present in the file are silently dismissed.
+    pub fn read(
+        &self,
+        cols: &[String],
+        config: &ReaderConfig,
+    ) -> Result<Vec<Arc<RecordBatch>>, io::Error> {
+        let num_threads = rayon::current_num_threads();
+        let chunk_size = calculate_chunk_size(
+            self.data.len() as u64,
+            self.header_len as u64,
+            num_threads,
+            config,
+        );
+        self.read_chunks(cols, chunk_size as usize, config.batch_size as usize)
+    }
+
+    fn read_chunks(
+        &self,
+        cols: &[String],
+        chunk_size: usize,
+        batch_size: usize,
+    ) -> Result<Vec<Arc<RecordBatch>>, io::Error> {
+        let cols: Vec<&str> = cols.iter().map(|v| v.as_str()).collect();
+        let projection = calculate_projection(&self.schema, &cols);
+        let data: &[u8] = &self.data;
+        let chunks = create_chunks(data, self.header_len, chunk_size);
+
+        let batches: Result<Vec<_>, _> = chunks
+            .into_par_iter()
+            .map(|(start, end)| {
+                parse_chunk(&data[start..end], &self.schema, &projection, batch_size)
+            })
+            .collect();
+
+        Ok(batches?.into_iter().flatten().collect())
+    }
+}
 
 /// Reads a CSV file in parallel using multiple threads.
 ///
@@ -31,31 +171,13 @@ pub fn read_csv_parallel(
     path: &str,
     cols: Vec<String>,
 ) -> Result<Vec<Arc<RecordBatch>>, io::Error> {
-    let cols: Vec<&str> = cols.iter().map(|v| v.as_str()).collect();
-    let file = File::open(path)?;
-    let file_size = file.metadata()?.len();
-
-    let schema = Arc::new(generate_utf_schema(path)?);
-    let cols = cols.as_slice();
-    let projection = calculate_projection(&schema, cols);
-
-    let mut header_reader = BufReader::new(File::open(path)?);
-    let mut header = String::new();
-    header_reader.read_line(&mut header)?;
-    let header_len = header.len() as u64;
+    let source = CsvSource::open(path)?;
 
     let num_threads = rayon::current_num_threads();
-    let data_size = file_size - header_len;
+    let data_size = (source.data.len() - source.header_len) as u64;
     let chunk_size = (data_size / num_threads as u64).max(MIN_CHUNK_SIZE);
 
-    let chunks = create_chunks(path, header_len, file_size, chunk_size)?;
-
-    let batches: Result<Vec<_>, _> = chunks
-        .into_par_iter()
-        .map(|(start, end)| parse_chunk(path, &schema, &projection, 256_000, &header, start, end))
-        .collect();
-
-    Ok(batches?.into_iter().flatten().collect())
+    source.read_chunks(&cols, chunk_size as usize, BATCH_SIZE)
 }
 
 /// Reads a CSV file in parallel using multiple threads.
@@ -80,39 +202,7 @@ pub fn read_csv_parallel_with_config(
     cols: Vec<String>,
     config: &ReaderConfig,
 ) -> Result<Vec<Arc<RecordBatch>>, io::Error> {
-    let cols: Vec<&str> = cols.iter().map(|v| v.as_str()).collect();
-    let file = File::open(path)?;
-    let file_size = file.metadata()?.len();
-
-    let schema = Arc::new(generate_utf_schema(path)?);
-    let cols = cols.as_slice();
-    let projection = calculate_projection(&schema, cols);
-
-    let mut header_reader = BufReader::new(File::open(path)?);
-    let mut header = String::new();
-    header_reader.read_line(&mut header)?;
-    let header_len = header.len() as u64;
-
-    let num_threads = rayon::current_num_threads();
-    let chunk_size = calculate_chunk_size(file_size, header_len, num_threads, config);
-    let chunks = create_chunks(path, header_len, file_size, chunk_size)?;
-
-    let batches: Result<Vec<_>, _> = chunks
-        .into_par_iter()
-        .map(|(start, end)| {
-            parse_chunk(
-                path,
-                &schema,
-                &projection,
-                config.batch_size as usize,
-                &header,
-                start,
-                end,
-            )
-        })
-        .collect();
-
-    Ok(batches?.into_iter().flatten().collect())
+    CsvSource::open(path)?.read(&cols, config)
 }
 
 /// Calculates column indices for projection based on requested column names.
@@ -133,70 +223,72 @@ fn calculate_projection(schema: &Schema, requested_cols: &[&str]) -> Vec<usize>
         .collect()
 }
 
-fn create_chunks(
-    path: &str,
-    header_len: u64,
-    file_size: u64,
-    chunk_size: u64,
-) -> Result<Vec<(u64, u64)>, io::Error> {
-    let mut file = File::open(path)?;
+/// Splits the header line off the file bytes.
+///
+/// Returns the header without its line terminator and the length in bytes of the
+/// header line, terminator included.
+fn split_header(data: &[u8]) -> Result<(&str, usize), io::Error> {
+    if data.is_empty() {
+        return Err(io::Error::new(
+            io::ErrorKind::InvalidData,
+            "CSV file is empty",
+        ));
+    }
+    let header_len = find_next_newline(data, 0);
+    let header = std::str::from_utf8(&data[..header_len])
+        .map_err(|e| io::Error::new(io::ErrorKind::InvalidData, e))?;
+    Ok((header.trim_end_matches(['\r', '\n']), header_len))
+}
+
+/// Splits the data after the header into chunks of whole records.
+///
+/// Boundaries are placed on the first newline after each target offset that is
+/// not inside a quoted field, so quoted multi-line values are never cut in two.
+fn create_chunks(data: &[u8], header_len: usize, chunk_size: usize) -> Vec<(usize, usize)> {
     let mut chunks = Vec::new();
     let mut current = header_len;
 
-    while current < file_size {
-        let target_end = (current + chunk_size).min(file_size);
+    while current < data.len() {
+        let target_end = (current + chunk_size.max(1)).min(data.len());
 
-        let actual_end = if target_end >= file_size {
-            file_size
+        let actual_end = if target_end >= data.len() {
+            data.len()
         } else {
-            find_next_newline(&mut file, target_end)?
+            // Chunks start on record boundaries, so only the quotes of this chunk
+            // decide whether the target offset lands inside a quoted field.
+            let in_quotes = ends_in_quotes(&data[current..target_end]);
+            find_record_end(data, target_end, in_quotes)
         };
 
         chunks.push((current, actual_end));
         current = actual_end;
     }
 
-    Ok(chunks)
+    chunks
 }
 
-fn find_next_newline(file: &mut File, pos: u64) -> Result<u64, io::Error> {
-    file.seek(SeekFrom::Start(pos))?;
-    let mut reader = BufReader::new(file.try_clone()?);
-    let mut offset = 0u64;
-    let mut buffer = Vec::new();
-
-    reader.read_until(b'\n', &mut buffer)?;
-    offset += buffer.len() as u64;
-
-    Ok(pos + offset)
+/// Returns the position right after the next newline at or after `pos`, or the
+/// end of the data if there is none.
+///
+/// `memchr` picks the widest vector instructions available at runtime (AVX2 /
+/// SSE2 / NEON), so skipping to the end of the header doesn't walk the bytes one
+/// by one.
+fn find_next_newline(data: &[u8], pos: usize) -> usize {
+    memchr(b'\n', &data[pos..]).map_or(data.len(), |offset| pos + offset + 1)
 }
 
+/// Parses a chunk of whole CSV records, borrowed straight from the file bytes.
 fn parse_chunk(
-    path: &str,
+    chunk: &[u8],
     schema: &Arc<Schema>,
     projection: &[usize],
     batch_size: usize,
-    header: &str,
-    start: u64,
-    end: u64,
 ) -> Result<Vec<Arc<RecordBatch>>, io::Error> {
-    let mut file = File::open(path)?;
-    file.seek(SeekFrom::Start(start))?;
-
-    let chunk_size = (end - start) as usize;
-    let mut buffer = Vec::with_capacity(chunk_size + header.len());
-
-    buffer.extend_from_slice(header.as_bytes());
-
-    let mut limited = file.take(end - start);
-    limited.read_to_end(&mut buffer)?;
-
-    let cursor = io::Cursor::new(buffer);
     let reader = ReaderBuilder::new(schema.clone())
-        .with_header(true)
+        .with_header(false)
         .with_projection(projection.to_vec())
         .with_batch_size(batch_size)
-        .build(cursor)
+        .build(chunk)
         .map_err(|e| io::Error::new(io::ErrorKind::InvalidData, e))?;
 
     let mut batches = Vec::new();
@@ -229,14 +321,16 @@ pub fn read_csv_sequential(
     cols: Vec<String>,
 ) -> Result<Vec<Arc<RecordBatch>>, io::Error> {
     let cols: Vec<&str> = cols.iter().map(|v| v.as_str()).collect();
-    let file = File::open(path)?;
-    let schema = Arc::new(generate_utf_schema(path)?);
+    // The header is read from the same buffered reader the records are parsed
+    // from, the file is opened once
+    let mut file = BufReader::new(File::open(path)?);
+    let schema = Arc::new(generate_utf_schema(&mut file)?);
     let cols = cols.as_slice();
     let projection = calculate_projection(&schema, cols);
     let mut batches = Vec::new();
 
     let reader = ReaderBuilder::new(schema)
-        .with_header(true)
+        .with_header(false)
         .with_projection(projection.to_vec())
         .with_batch_size(BATCH_SIZE)
         .build(file)
@@ -250,24 +344,24 @@ pub fn read_csv_sequential(
     Ok(batches)
 }
 
-fn generate_utf_schema(path: &str) -> Result<Schema, io::Error> {
-    let file = File::open(path)?;
-    let reader = BufReader::new(file);
-    let mut lines = reader.lines();
-    if let Some(first) = lines.next() {
-        let header = first?;
-        let all_columns: Vec<&str> = header.split(',').collect();
-        let fields: Vec<Field> = all_columns
-            .iter()
-            .map(|c| Field::new(c.trim(), DataType::Utf8, true))
-            .collect();
-        Ok(Schema::new(fields))
-    } else {
-        Err(io::Error::new(
+/// Reads the header line off `reader` and builds the all-Utf8 schema from it.
+fn generate_utf_schema(reader: &mut impl BufRead) -> Result<Schema, io::Error> {
+    let mut header = String::new();
+    if reader.read_line(&mut header)? == 0 {
+        return Err(io::Error::new(
             io::ErrorKind::InvalidData,
             "CSV file is empty",
-        ))
+        ));
     }
+    Ok(schema_from_header(header.trim_end_matches(['\r', '\n'])))
+}
+
+fn schema_from_header(header: &str) -> Schema {
+    let fields: Vec<Field> = header
+        .split(',')
+        .map(|c| Field::new(c.trim(), DataType::Utf8, true))
+        .collect();
+    Schema::new(fields)
 }
 
 #[cfg(test)]
@@ -282,7 +376,8 @@ mod tests {
         writeln!(file, "name,age,city").unwrap();
         writeln!(file, "Alice,30,New York").unwrap();
 
-        let schema = generate_utf_schema(file.path().to_str().unwrap()).unwrap();
+        let schema =
+            generate_utf_schema(&mut BufReader::new(File::open(file.path()).unwrap())).unwrap();
         assert_eq!(schema.fields().len(), 3);
         assert_eq!(schema.field(0).name(), "name");
         assert_eq!(schema.field(1).name(), "age");
@@ -295,7 +390,8 @@ mod tests {
         writeln!(file, "name,age,city").unwrap();
         writeln!(file, "Alice,30,New York").unwrap();
 
-        let schema = generate_utf_schema(file.path().to_str().unwrap()).unwrap();
+        let schema =
+            generate_utf_schema(&mut BufReader::new(File::open(file.path()).unwrap())).unwrap();
         assert_eq!(schema.fields().len(), 3);
         assert_eq!(schema.field(0).name(), "name");
         assert_eq!(schema.field(1).name(), "age");
@@ -305,7 +401,7 @@ mod tests {
     #[test]
     fn test_generate_utf_schema_empty_file() {
         let file = NamedTempFile::new().unwrap();
-        let result = generate_utf_schema(file.path().to_str().unwrap());
+        let result = generate_utf_schema(&mut BufReader::new(File::open(file.path()).unwrap()));
         assert!(result.is_err());
         assert_eq!(result.unwrap_err().kind(), io::ErrorKind::InvalidData);
     }
@@ -348,4 +444,64 @@ mod tests {
         assert!(result.is_err());
         assert_eq!(result.unwrap_err().kind(), io::ErrorKind::NotFound);
     }
+
+    #[test]
+    fn test_read_csv_parallel_with_config_valid() {
+        let mut file = NamedTempFile::new().unwrap();
+        writeln!(file, "name,age,city").unwrap();
+        writeln!(file, "Alice,30,New York").unwrap();
+        writeln!(file, "Bob,25,Paris").unwrap();
+
+        let batches = read_csv_parallel_with_config(
+            file.path().to_str().unwrap(),
+            vec!["name".to_string(), "city".to_string()],
+            &ReaderConfig::default(),
+        )
+        .unwrap();
+        let rows: usize = batches.iter().map(|b| b.num_rows()).sum();
+        assert_eq!(rows, 2);
+        assert_eq!(batches[0].num_columns(), 2);
+    }
+
+    #[test]
+    fn test_create_chunks_end_on_newline() {
+        let data = b"a,b\n1,2\n3,4\n5,6\n";
+        let chunks = create_chunks(data, 4, 3);
+        assert_eq!(chunks, vec![(4, 8), (8, 12), (12, 16)]);
+    }
+
+    #[test]
+    fn test_create_chunks_keeps_quoted_newlines() {
+        let data = b"a,b\n1,\"x\ny\"\n2,z\n";
+        let chunks = create_chunks(data, 4, 3);
+        assert_eq!(chunks, vec![(4, 12), (12, 16)]);
+    }
+
+    #[test]
+    fn test_csv_source_refresh_reopens_changed_file() {
+        let mut file = NamedTempFile::new().unwrap();
+        writeln!(file, "name,age").unwrap();
+        writeln!(file, "Alice,30").unwrap();
+
+        let cols = vec!["name".to_string()];
+        let config = ReaderConfig::default();
+        let mut source = CsvSource::open(file.path().to_str().unwrap()).unwrap();
+        let rows: usize = source
+            .read(&cols, &config)
+            .unwrap()
+            .iter()
+            .map(|b| b.num_rows())
+            .sum();
+        assert_eq!(rows, 1);
+
+        writeln!(file, "Bob,25").unwrap();
+        source.refresh().unwrap();
+        let rows: usize = source
+            .read(&cols, &config)
+            .unwrap()
+            .iter()
+            .map(|b| b.num_rows())
+            .sum();
+        assert_eq!(rows, 2);
+    }
 }
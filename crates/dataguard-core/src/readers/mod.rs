@@ -1,6 +1,7 @@
 mod config;
 pub mod csv_reader;
 pub mod parquet_reader;
+mod scanner;
 
 pub use config::ReaderConfig;
 pub use parquet_reader::read_parquet_parallel;
@@ -0,0 +1,157 @@
+//! Quote-aware scanning of raw CSV bytes.
+//!
+//! Chunk boundaries must land between records, so a newline inside a quoted
+//! field is not a valid split point. The quoted state is tracked 64 bytes at a
+//! time with a prefix XOR over the quote bitmask instead of a byte-by-byte state
+//! machine.
+
+use memchr::memchr_iter;
+
+const BLOCK_SIZE: usize = 64;
+
+/// Computes the prefix XOR of `x`: bit `i` of the result is the XOR of bits `0..=i`.
+///
+/// This is what a carry-less multiplication by an all-ones operand produces;
+/// the shift cascade computes it portably in six steps without `pclmulqdq`.
+#[inline]
+fn prefix_xor(mut x: u64) -> u64 {
+    x ^= x << 1;
+    x ^= x << 2;
+    x ^= x << 4;
+    x ^= x << 8;
+    x ^= x << 16;
+    x ^= x << 32;
+    x
+}
+
+const LOW_BITS: u64 = 0x7F7F_7F7F_7F7F_7F7F;
+const HIGH_BITS: u64 = 0x8080_8080_8080_8080;
+/// Gathers bits 0, 8, ..., 56 of a word into its top byte.
+const GATHER: u64 = 0x0102_0408_1020_4080;
+
+/// Builds a bitmask with bit `i` set when `block[i] == byte`.
+///
+/// A full block is compared 8 bytes per step: the matching bytes of a word are
+/// flagged on their high bit, then packed into 8 mask bits by one multiplication.
+#[inline]
+fn byte_mask(block: &[u8], byte: u8) -> u64 {
+    if block.len() < BLOCK_SIZE {
+        return block
+            .iter()
+            .enumerate()
+            .fold(0, |mask, (i, &b)| mask | (((b == byte) as u64) << i));
+    }
+    let pattern = u64::from_ne_bytes([byte; 8]);
+    block
+        .chunks_exact(8)
+        .enumerate()
+        .fold(0, |mask, (i, chunk)| {
+            // Safety of the unwrap: chunks_exact yields 8-byte slices
+            let diff = u64::from_le_bytes(chunk.try_into().unwrap()) ^ pattern;
+            // The high bit of a byte is set when the byte is not zero, without carries
+            let nonzero = ((diff & LOW_BITS) + LOW_BITS) | diff;
+            let equal = !nonzero & HIGH_BITS;
+            mask | (((equal >> 7).wrapping_mul(GATHER) >> 56) << (8 * i))
+        })
+}
+
+/// Returns `true` when `data` contains an odd number of quotes, i.e. a quoted
+/// field opened in `data` is still open at its end.
+pub(crate) fn ends_in_quotes(data: &[u8]) -> bool {
+    memchr_iter(b'"', data).count() % 2 == 1
+}
+
+/// Returns the position right after the first newline at or after `pos` that is
+/// not inside a quoted field, or the end of the data if there is none.
+///
+/// `in_quotes` tells whether `pos` itself sits inside a quoted field. Escaped
+/// quotes (`""`) toggle the state twice and are handled without special casing.
+pub(crate) fn find_record_end(data: &[u8], pos: usize, mut in_quotes: bool) -> usize {
+    let mut offset = pos;
+    for block in data[pos..].chunks(BLOCK_SIZE) {
+        let mut quoted = prefix_xor(byte_mask(block, b'"'));
+        if in_quotes {
+            quoted = !quoted;
+        }
+        let newlines = byte_mask(block, b'\n') & !quoted;
+        if newlines != 0 {
+            return offset + newlines.trailing_zeros() as usize + 1;
+        }
+        in_quotes = (quoted >> (block.len() - 1)) & 1 == 1;
+        offset += block.len();
+    }
+    data.len()
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_prefix_xor() {
+        assert_eq!(prefix_xor(0), 0);
+        assert_eq!(prefix_xor(0b1), u64::MAX);
+        assert_eq!(prefix_xor(0b1001), 0b0111);
+    }
+
+    #[test]
+    fn test_byte_mask() {
+        let mut block = [b'a'; BLOCK_SIZE];
+        for i in [0, 7, 8, 30, 63] {
+            block[i] = b'"';
+        }
+        block[12] = b'"' | 0x80;
+        let expected = (1 << 0) | (1 << 7) | (1 << 8) | (1 << 30) | (1 << 63);
+        assert_eq!(byte_mask(&block, b'"'), expected);
+        assert_eq!(
+            byte_mask(&block[..10], b'"'),
+            (1 << 0) | (1 << 7) | (1 << 8)
+        );
+        assert_eq!(byte_mask(&block, b'\n'), 0);
+    }
+
+    #[test]
+    fn test_find_record_end_unquoted() {
+        let data = b"a,b\nc,d\n";
+        assert_eq!(find_record_end(data, 0, false), 4);
+        assert_eq!(find_record_end(data, 4, false), 8);
+    }
+
+    #[test]
+    fn test_find_record_end_skips_quoted_newline() {
+        let data = b"1,\"Home\nKitchen\"\n2,x\n";
+        assert_eq!(find_record_end(data, 0, false), 17);
+    }
+
+    #[test]
+    fn test_find_record_end_starting_in_quotes() {
+        let data = b"Kitchen\",a\n2,x\n";
+        assert_eq!(find_record_end(data, 0, true), 11);
+    }
+
+    #[test]
+    fn test_find_record_end_across_blocks() {
+        let mut data = vec![b'"'];
+        data.extend(std::iter::repeat_n(b'\n', 100));
+        data.extend_from_slice(b"\",a\nb\n");
+        assert_eq!(find_record_end(&data, 0, false), 105);
+    }
+
+    #[test]
+    fn test_find_record_end_escaped_quotes() {
+        let data = b"\"say \"\"hi\"\"\n\",1\n";
+        assert_eq!(find_record_end(data, 0, false), 16);
+    }
+
+    #[test]
+    fn test_find_record_end_no_newline() {
+        let data = b"a,b";
+        assert_eq!(find_record_end(data, 0, false), 3);
+    }
+
+    #[test]
+    fn test_ends_in_quotes() {
+        assert!(!ends_in_quotes(b"a,\"b\""));
+        assert!(ends_in_quotes(b"a,\"b"));
+    }
+}
@@ -1,8 +1,8 @@
 use arrow::datatypes::DataType;
 use arrow_array::{Array, Date32Array, StringArray};
-use chrono::{Datelike, Duration, NaiveDate, Weekday};
+use chrono::NaiveDate;
 
-use crate::{utils::date_parser::parse_date_column, RuleError};
+use crate::{rules::numeric::count_violations, utils::date_parser::parse_date_column, RuleError};
 
 pub struct DateTypeCheck {
     // Those two field are not needed now as we dont need the expected
@@ -98,16 +98,11 @@ impl DateRule for DateBoundaryCheck {
     }
 
     fn validate(&self, array: &Date32Array, _column: String) -> Result<usize, RuleError> {
-        let mut counter = 0;
-        for day in array.iter().flatten() {
-            if self.after {
-                if day <= self.days {
-                    counter += 1;
-                }
-            } else if day >= self.days {
-                counter += 1;
-            }
-        }
+        let days = self.days;
+        let counter = match self.after {
+            true => count_violations(array, |day| day <= days),
+            false => count_violations(array, |day| day >= days),
+        };
         Ok(counter)
     }
 }
@@ -144,24 +139,11 @@ impl DateRule for WeekDayCheck {
     }
 
     fn validate(&self, array: &Date32Array, _column: String) -> Result<usize, RuleError> {
-        let epoch = NaiveDate::from_ymd_opt(1970, 1, 1).unwrap();
-        let mut violations = 0;
-
-        for day in array.iter().flatten() {
-            let date = epoch + Duration::days(day as i64);
-            match date.weekday() {
-                Weekday::Sun | Weekday::Sat => {
-                    if self.is_week {
-                        violations += 1
-                    }
-                }
-                _ => {
-                    if !self.is_week {
-                        violations += 1
-                    }
-                }
-            }
-        }
+        // 1970-01-01 is a Thursday, day 3 of a week starting on Monday, Saturday is day 5
+        let is_week = self.is_week;
+        let violations = count_violations(array, |day| {
+            ((day as i64 + 3).rem_euclid(7) >= 5) == is_week
+        });
         Ok(violations)
     }
 }
@@ -971,4 +953,19 @@ mod tests {
         // 2 violations: Monday and Wednesday
         assert_eq!(rule.validate(&array, "col".to_string()).unwrap(), 2);
     }
+
+    #[test]
+    fn test_weekday_check_before_epoch_with_null() {
+        let rule = WeekDayCheck::new("weekday_test".to_string(), 0.0, true);
+
+        let array = Date32Array::from(vec![
+            Some(date_to_days(1969, 12, 27)), // Saturday (violation)
+            Some(date_to_days(1969, 12, 29)), // Monday (ok)
+            None,                             // Null (ignored)
+            Some(date_to_days(1900, 1, 7)),   // Sunday (violation)
+            Some(date_to_days(1970, 1, 1)),   // Thursday (ok)
+        ]);
+
+        assert_eq!(rule.validate(&array, "col".to_string()).unwrap(), 2);
+    }
 }
@@ -3,11 +3,11 @@ use arrow::{
     compute::{self},
     datatypes::{DataType, ToByteSlice},
 };
-use arrow_array::{ArrowPrimitiveType, Date32Array, PrimitiveArray, StringArray};
-use std::{collections::HashSet, sync::Arc};
+use arrow_array::{ArrowPrimitiveType, Date32Array, Int64Array, PrimitiveArray, StringArray};
+use std::sync::Arc;
 use xxhash_rust::xxh3::xxh3_64;
 
-use crate::{errors::RuleError, utils::hasher::Xxh3Builder};
+use crate::{errors::RuleError, rules::string::valid_values, utils::swar::parse_i64};
 
 pub struct NullCheck {
     threshold: f64,
@@ -22,6 +22,8 @@ impl NullCheck {
         "NullCheck".to_string()
     }
 
+    /// Counts the nulls of `array`, kept alongside its validity bitmap, without
+    /// visiting the rows.
     pub fn validate(&self, array: &dyn Array) -> usize {
         array.null_count()
     }
@@ -61,6 +63,17 @@ impl TypeCheck {
     }
 
     pub fn validate(&self, array: &dyn Array) -> Result<(usize, Arc<dyn Array>), RuleError> {
+        // Text to integer is the hot cast for CSV tables, we parse it with SWAR digit checks
+        if self.expected == DataType::Int64 {
+            if let Some(string_array) = array.as_any().downcast_ref::<StringArray>() {
+                let casted_array: Int64Array = string_array
+                    .iter()
+                    .map(|v| v.and_then(|s| parse_i64(s.as_bytes())))
+                    .collect();
+                let errors = casted_array.null_count() - array.null_count();
+                return Ok((errors, Arc::new(casted_array)));
+            }
+        }
         match compute::cast(array, &self.expected) {
             Ok(casted_array) => {
                 let errors = casted_array.null_count() - array.null_count();
@@ -95,41 +108,41 @@ impl UnicityCheck {
         "UnicityCheck".to_string()
     }
 
-    pub fn validate_str(&self, array: &StringArray) -> (usize, HashSet<u64, Xxh3Builder>) {
-        let mut local_hash = HashSet::with_capacity_and_hasher(array.len(), Xxh3Builder);
-        array.iter().for_each(|v_option| {
-            if let Some(v) = v_option {
-                let hash = xxh3_64(v.as_bytes());
-                let _ = local_hash.insert(hash);
-            }
-        });
-        (array.null_count(), local_hash)
+    pub fn validate_str(&self, array: &StringArray) -> (usize, Vec<u64>) {
+        let hashes = valid_values(array).map(|v| xxh3_64(v.as_bytes())).collect();
+        (array.null_count(), distinct(hashes))
     }
 
     pub fn validate_numeric<T: ArrowPrimitiveType>(
         &self,
         array: &PrimitiveArray<T>,
-    ) -> (usize, HashSet<u64, Xxh3Builder>) {
-        let mut local_hash = HashSet::with_capacity_and_hasher(array.len(), Xxh3Builder);
-        array.iter().for_each(|v_option| {
-            if let Some(v) = v_option {
-                let hash = xxh3_64(v.to_byte_slice());
-                let _ = local_hash.insert(hash);
-            }
-        });
-        (array.null_count(), local_hash)
+    ) -> (usize, Vec<u64>) {
+        let hashes = array
+            .iter()
+            .flatten()
+            .map(|v| xxh3_64(v.to_byte_slice()))
+            .collect();
+        (array.null_count(), distinct(hashes))
+    }
+
+    pub fn validate_date(&self, array: &Date32Array) -> (usize, Vec<u64>) {
+        let hashes = array
+            .iter()
+            .flatten()
+            .map(|v| xxh3_64(v.to_byte_slice()))
+            .collect();
+        (array.null_count(), distinct(hashes))
     }
+}
 
-    pub fn validate_date(&self, array: &Date32Array) -> (usize, HashSet<u64, Xxh3Builder>) {
-        let mut local_hash = HashSet::with_capacity_and_hasher(array.len(), Xxh3Builder);
-        array.iter().for_each(|v_option| {
-            if let Some(v) = v_option {
-                let hash = xxh3_64(v.to_byte_slice());
-                let _ = local_hash.insert(hash);
-            }
-        });
-        (array.null_count(), local_hash)
-    }
+/// Sort the hashes and drop the repeated ones.
+///
+/// Sorting a flat `Vec<u64>` stays in contiguous memory, where inserting in a
+/// hash set probes random buckets once the set outgrows the cache.
+fn distinct(mut hashes: Vec<u64>) -> Vec<u64> {
+    hashes.sort_unstable();
+    hashes.dedup();
+    hashes
 }
 
 #[cfg(test)]
@@ -137,8 +150,8 @@ mod tests {
     use super::*;
     use rayon::prelude::*;
 
-    // DashSet and Arc are no longer directly used in tests for UnicityCheck
-    // as the validate method now returns a HashSet.
+    // The validate methods return the sorted distinct hashes of the batch, merging
+    // batches requires deduplicating again.
 
     #[test]
     fn test_unicity_sequential_happy() {
@@ -163,14 +176,14 @@ mod tests {
 
         let (null_count, final_set) = arrays
             .par_iter()
-            .map(|array| rule.validate_str(array)) // Each map call returns a HashSet for its array
+            .map(|array| rule.validate_str(array)) // Each map call returns the hashes of its array
             .reduce(
-                || (0, HashSet::with_hasher(Xxh3Builder)), // Identity for reduce
+                || (0, Vec::new()), // Identity for reduce
                 |(mut null_count, mut acc_set), (batch_count, batch_set)| {
                     // Accumulator for reduce
                     acc_set.extend(batch_set);
                     null_count += batch_count;
-                    (null_count, acc_set)
+                    (null_count, distinct(acc_set))
                 },
             );
 
@@ -209,12 +222,12 @@ mod tests {
             .par_iter()
             .map(|array| rule.validate_str(array))
             .reduce(
-                || (0, HashSet::with_hasher(Xxh3Builder)), // Identity for reduce
+                || (0, Vec::new()), // Identity for reduce
                 |(mut null_count, mut acc_set), (batch_count, batch_set)| {
                     // Accumulator for reduce
                     acc_set.extend(batch_set);
                     null_count += batch_count;
-                    (null_count, acc_set)
+                    (null_count, distinct(acc_set))
                 },
             );
 
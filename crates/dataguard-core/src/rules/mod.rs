@@ -7,4 +7,4 @@ pub mod string;
 pub use date::{DateBoundaryCheck, DateRule, WeekDayCheck};
 pub use generic::{NullCheck, TypeCheck, UnicityCheck};
 pub use numeric::{Monotonicity, NumericRule, Range};
-pub use string::{IsInCheck, RegexMatch, StringLengthCheck, StringRule};
+pub use string::{DistinctValues, IsInCheck, RegexMatch, StringLengthCheck, StringRule};
@@ -4,7 +4,12 @@ use arrow_ord::cmp::{gt, lt};
 use num_traits::Num;
 use std::{fmt::Debug, marker::PhantomData};
 
-use crate::{columns::NumericType, engine::Stats, errors::RuleError};
+use crate::{
+    columns::NumericType,
+    engine::Stats,
+    errors::RuleError,
+    utils::bitmask::{count_valid, pack_bits},
+};
 
 pub trait NumericRule<T: ArrowNumericType>: Send + Sync {
     /// Returns the name of the rule.
@@ -15,6 +20,11 @@ pub trait NumericRule<T: ArrowNumericType>: Send + Sync {
     fn validate(&self, array: &PrimitiveArray<T>, column: String) -> Result<usize, RuleError>;
     /// Validates an Arrow `Array`, by statistics
     fn validate_with_stats(&self, array: &PrimitiveArray<T>, stats: &Stats) -> usize;
+    /// Returns true if the rule compares neighbouring values, and so must also
+    /// be checked across batch boundaries
+    fn is_sequential(&self) -> bool {
+        false
+    }
 }
 
 pub struct Range<N: Num + PartialOrd + Copy + Debug> {
@@ -52,24 +62,14 @@ where
     }
 
     fn validate(&self, array: &PrimitiveArray<T>, _column: String) -> Result<usize, RuleError> {
-        let mut counter: usize = 0;
-        for value in array.iter() {
-            match value {
-                Some(i) => {
-                    if let Some(min) = self.min {
-                        if i < min {
-                            counter += 1
-                        }
-                    }
-                    if let Some(max) = self.max {
-                        if i > max {
-                            counter += 1
-                        }
-                    }
-                }
-                None => counter += 0, // Null doesnt count as error
-            }
-        }
+        // Bounds are matched once, so the loops below stay branch free and can be
+        // auto-vectorized. Null doesnt count as error.
+        let counter = match (self.min, self.max) {
+            (Some(min), Some(max)) => count_violations(array, |v| (v < min) | (v > max)),
+            (Some(min), None) => count_violations(array, |v| v < min),
+            (None, Some(max)) => count_violations(array, |v| v > max),
+            (None, None) => 0,
+        };
         Ok(counter)
     }
 
@@ -80,6 +80,24 @@ where
     }
 }
 
+/// Count the non-null values of `array` for which `is_violation` holds.
+///
+/// Runs over the raw values buffer and masks nulls with the validity bitmap,
+/// 64 rows at a time, instead of branching on each `Option`.
+pub(crate) fn count_violations<T, F>(array: &PrimitiveArray<T>, is_violation: F) -> usize
+where
+    T: ArrowNumericType,
+    F: Fn(T::Native) -> bool,
+{
+    let values = array.values();
+    match array.nulls().filter(|nulls| nulls.null_count() > 0) {
+        None => values.iter().map(|v| is_violation(*v) as usize).sum(),
+        Some(nulls) => count_valid(nulls, |start, len| {
+            pack_bits(values[start..start + len].iter().map(|v| is_violation(*v)))
+        }),
+    }
+}
+
 pub struct Monotonicity<N> {
     name: String,
     threshold: f64,
@@ -151,6 +169,10 @@ where
         // It it's happen we panic and fix this case
         unreachable!()
     }
+
+    fn is_sequential(&self) -> bool {
+        true
+    }
 }
 
 pub struct StdDevCheck<N: NumericType> {
@@ -308,6 +330,14 @@ mod tests {
         assert_eq!(rule.validate(&array, "test_col".to_string()).unwrap(), 3);
     }
 
+    #[test]
+    fn test_range_float_with_null() {
+        let rule = Range::new("range_test".to_string(), 0.0, Some(0.5f64), Some(2.5f64));
+        let array = Float64Array::from(vec![Some(0.1), Some(1.0), None, Some(3.0), Some(2.5)]);
+        // We expect 2 errors here index 0, 3
+        assert_eq!(rule.validate(&array, "test_col".to_string()).unwrap(), 2);
+    }
+
     #[test]
     fn test_monotonicity_asc_valid() {
         let rule = Monotonicity::<i64>::default();
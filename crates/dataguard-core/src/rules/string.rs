@@ -1,14 +1,23 @@
-use std::collections::HashSet;
-
-use arrow::{
-    array::{Int32Array, StringArray},
-    compute::{self},
+use std::{
+    collections::{HashMap, HashSet},
+    ops::Range,
+    sync::{Arc, Mutex},
 };
+
+use arrow::array::StringArray;
 use arrow_array::Array;
-use arrow_string::length::length;
-use xxhash_rust::xxh3::xxh3_64;
+use once_cell::sync::Lazy;
+use regex::Regex;
 
-use crate::{errors::RuleError, utils::hasher::Xxh3Builder};
+use crate::{
+    errors::RuleError,
+    utils::{
+        bitmask::{count_valid, pack_bits},
+        formats::{is_email, is_url},
+        hasher::Xxh3Builder,
+        swar::{is_uuid, AsciiClass},
+    },
+};
 
 /// A trait for defining validation rules on Arrow arrays.
 pub trait StringRule: Send + Sync {
@@ -17,6 +26,88 @@ pub trait StringRule: Send + Sync {
     fn get_threshold(&self) -> f64;
     /// Validates an Arrow `Array`.
     fn validate(&self, array: &StringArray, column: String) -> Result<usize, RuleError>;
+    /// Checks a single value.
+    fn is_valid(&self, value: &str) -> bool;
+    /// Returns `true` when checking a value costs more than hashing it. On a batch
+    /// with few distinct values, such a rule checks each of them once with
+    /// [`StringRule::is_valid`] instead of validating every row.
+    fn prefers_distinct_values(&self) -> bool {
+        false
+    }
+    /// Returns `true` when the rule only reads the byte length of the values. Such
+    /// a rule validates from the offsets of the array, without the string bytes, so
+    /// it is left out of the walk shared by the other rules.
+    fn reads_length_only(&self) -> bool {
+        false
+    }
+}
+
+/// Returns the non-null values of `array`.
+///
+/// The validity bitmap is skipped when the array holds no null, and otherwise
+/// scanned 64 bits at a time to jump to the next valid slot, where
+/// `StringArray::iter` tests one bit per row.
+pub(crate) fn valid_values(array: &StringArray) -> impl Iterator<Item = &str> + '_ {
+    let indices = match array.nulls().filter(|nulls| nulls.null_count() > 0) {
+        None => ValidIndices::All(0..array.len()),
+        Some(nulls) => ValidIndices::Valid(nulls.valid_indices()),
+    };
+    indices.map(|i| array.value(i))
+}
+
+/// Indices of the non-null slots of an array, see [`valid_values`].
+enum ValidIndices<I> {
+    All(Range<usize>),
+    Valid(I),
+}
+
+impl<I: Iterator<Item = usize>> Iterator for ValidIndices<I> {
+    type Item = usize;
+
+    #[inline]
+    fn next(&mut self) -> Option<usize> {
+        match self {
+            ValidIndices::All(indices) => indices.next(),
+            ValidIndices::Valid(indices) => indices.next(),
+        }
+    }
+}
+
+/// Maximum share of distinct values, one per 16 rows, for a batch to be
+/// validated once per distinct value.
+const MAX_DISTINCT_RATIO: usize = 16;
+
+/// The distinct non-null values of a `StringArray` with the number of rows
+/// holding each.
+pub struct DistinctValues<'a> {
+    values: Vec<(&'a str, usize)>,
+}
+
+impl<'a> DistinctValues<'a> {
+    /// Counts the distinct values of `array`, giving up with `None` as soon as
+    /// there are more than one per 16 rows.
+    pub fn collect(array: &'a StringArray) -> Option<Self> {
+        let max_distinct = array.len() / MAX_DISTINCT_RATIO;
+        let mut counts: HashMap<&str, usize, Xxh3Builder> = HashMap::with_hasher(Xxh3Builder);
+        for value in valid_values(array) {
+            *counts.entry(value).or_insert(0) += 1;
+            if counts.len() > max_distinct {
+                return None;
+            }
+        }
+        Some(Self {
+            values: counts.into_iter().collect(),
+        })
+    }
+
+    /// Returns the number of rows whose value fails `rule`.
+    pub fn count_invalid(&self, rule: &dyn StringRule) -> usize {
+        self.values
+            .iter()
+            .filter(|(value, _)| !rule.is_valid(value))
+            .map(|(_, count)| count)
+            .sum()
+    }
 }
 
 /// A rule to check the length of strings in a `StringArray`.
@@ -47,56 +138,434 @@ impl StringRule for StringLengthCheck {
         self.threshold
     }
 
-    fn validate(&self, array: &StringArray, column: String) -> Result<usize, RuleError> {
-        let res = length(array);
-        match res {
-            Ok(dyn_array) => {
-                let len_array =
-                    dyn_array
-                        .as_any()
-                        .downcast_ref::<Int32Array>()
-                        .ok_or_else(|| {
-                            RuleError::ValidationError(format!(
-                                "StringLengthCheck applied to a non-string column '{}'",
-                                column
-                            ))
-                        })?;
-                let mut counter: u32 = 0;
-                for i in len_array.iter().flatten() {
-                    if let Some(min) = self.min {
-                        if i < min as i32 {
-                            counter += 1
-                        }
-                    }
-                    if let Some(max) = self.max {
-                        if i > max as i32 {
-                            counter += 1
-                        }
+    fn validate(&self, array: &StringArray, _column: String) -> Result<usize, RuleError> {
+        // Byte lengths are read from the offsets, a single pass over 4 bytes per row
+        // that never touches the string bytes nor allocates a length array. Offsets
+        // are i32, so a length fits a u32 and `min <= len <= max` is one unsigned
+        // compare, `len - min <= max - min`, 8 rows to a 256 bit register.
+        let min = u32::try_from(self.min.unwrap_or(0)).unwrap_or(u32::MAX);
+        let max = u32::try_from(self.max.unwrap_or(usize::MAX)).unwrap_or(u32::MAX);
+        let nulls = array.nulls().filter(|nulls| nulls.null_count() > 0);
+        if min > max {
+            return Ok(array.len() - nulls.map_or(0, |nulls| nulls.null_count()));
+        }
+        let span = max - min;
+        let offsets = array.value_offsets();
+        let outside = |w: &[i32]| ((w[1] - w[0]) as u32).wrapping_sub(min) > span;
+        let errors = match nulls {
+            None => offsets.windows(2).map(|w| outside(w) as usize).sum(),
+            Some(nulls) => count_valid(nulls, |start, len| {
+                pack_bits(offsets[start..=start + len].windows(2).map(outside))
+            }),
+        };
+        Ok(errors)
+    }
+
+    fn is_valid(&self, value: &str) -> bool {
+        let len = value.len();
+        self.min.is_none_or(|min| len >= min) && self.max.is_none_or(|max| len <= max)
+    }
+
+    fn reads_length_only(&self) -> bool {
+        true
+    }
+}
+
+/// How a [`RegexMatch`] tests each value.
+enum Matcher {
+    /// A `^literal$` pattern only matches one exact string, equality is enough.
+    Literal(Literal),
+    /// A pattern repeating an ASCII character class checks the length, then the
+    /// bytes 8 at a time.
+    CharClass(CharClassMatch),
+    /// Same as `CharClass` for ASCII values, the class also holds non-ASCII
+    /// characters (`\s`, `\d`) that the regex checks.
+    CharClassOrRegex(CharClassMatch, Regex),
+    /// A fixed-length pattern checks the bytes allowed at each position.
+    FixedShape(FixedShape),
+    /// Same as `FixedShape` for ASCII values, for a pattern with `\s` or `\d`.
+    FixedShapeOrRegex(FixedShape, Regex),
+    /// [`UUID_PATTERN`] has a fixed shape, checked without the regex engine.
+    Uuid,
+    /// [`EMAIL_PATTERN`] and [`URL_PATTERN`] are checked by a hand-written scan.
+    Email,
+    Url,
+    Regex(Regex),
+}
+
+impl Matcher {
+    fn new(pattern: String, flag: Option<String>) -> Result<Self, RuleError> {
+        if flag.is_none() {
+            if let Some(literal) = anchored_literal(&pattern) {
+                return Ok(Matcher::Literal(Literal::new(literal)));
+            }
+            match pattern.as_str() {
+                UUID_PATTERN => return Ok(Matcher::Uuid),
+                EMAIL_PATTERN => return Ok(Matcher::Email),
+                URL_PATTERN => return Ok(Matcher::Url),
+                _ => {}
+            }
+            if let Some(char_class) = char_class_match(&pattern) {
+                if pattern.contains(r"\s") || pattern.contains(r"\d") {
+                    let regex = compile_regex(&pattern)?;
+                    return Ok(Matcher::CharClassOrRegex(char_class, regex));
+                }
+                return Ok(Matcher::CharClass(char_class));
+            }
+            if let Some(shape) = fixed_shape(&pattern) {
+                if pattern.contains(r"\s") || pattern.contains(r"\d") {
+                    let regex = compile_regex(&pattern)?;
+                    return Ok(Matcher::FixedShapeOrRegex(shape, regex));
+                }
+                return Ok(Matcher::FixedShape(shape));
+            }
+        }
+        let full_pattern = match flag {
+            Some(flag) => format!("(?{}){}", flag, pattern),
+            None => pattern,
+        };
+        Ok(Matcher::Regex(compile_regex(&full_pattern)?))
+    }
+
+    #[inline]
+    fn is_match(&self, value: &str) -> bool {
+        match self {
+            Matcher::Literal(literal) => literal.is_match(value),
+            Matcher::CharClass(char_class) => char_class.is_match(value.as_bytes()),
+            Matcher::CharClassOrRegex(char_class, regex) => {
+                char_class.is_match(value.as_bytes())
+                    || (!value.is_ascii() && regex.is_match(value))
+            }
+            Matcher::FixedShape(shape) => shape.is_match(value.as_bytes()),
+            Matcher::FixedShapeOrRegex(shape, regex) => {
+                shape.is_match(value.as_bytes()) || (!value.is_ascii() && regex.is_match(value))
+            }
+            Matcher::Uuid => is_uuid(value.as_bytes()),
+            Matcher::Email => is_email(value.as_bytes()),
+            Matcher::Url => is_url(value.as_bytes()),
+            Matcher::Regex(regex) => regex.is_match(value),
+        }
+    }
+}
+
+/// Checks that `pattern`, with its `flags`, can be compiled into a matcher.
+///
+/// Builders call it when a rule is added: a pattern that needs the regex engine
+/// is compiled exactly as the rule will use it, flags included, so the compiler
+/// finds it in the cache. Patterns matched without the regex engine are not
+/// compiled at all.
+pub(crate) fn check_pattern(pattern: &str, flags: Option<&str>) -> Result<(), RuleError> {
+    Matcher::new(pattern.to_string(), flags.map(str::to_string)).map(|_| ())
+}
+
+/// Maximum number of distinct patterns kept by [`compile_regex`].
+const REGEX_CACHE_CAPACITY: usize = 256;
+
+/// Regexes already compiled, keyed by their full pattern.
+static REGEX_CACHE: Lazy<Mutex<HashMap<String, Regex>>> = Lazy::new(|| Mutex::new(HashMap::new()));
+
+/// Compiles `pattern`, reusing the regex compiled for it earlier if any.
+///
+/// A `Regex` clone shares its compiled program, so builders checking a pattern
+/// and every table compiling the same rule pay for the compilation only once.
+pub(crate) fn compile_regex(pattern: &str) -> Result<Regex, RuleError> {
+    let mut cache = REGEX_CACHE.lock().unwrap_or_else(|e| e.into_inner());
+    if let Some(regex) = cache.get(pattern) {
+        return Ok(regex.clone());
+    }
+    let regex = Regex::new(pattern).map_err(|e| {
+        RuleError::ValidationError(format!("Invalid regex pattern '{}': {}", pattern, e))
+    })?;
+    if cache.len() >= REGEX_CACHE_CAPACITY {
+        cache.clear();
+    }
+    cache.insert(pattern.to_string(), regex.clone());
+    Ok(regex)
+}
+
+/// An exact string to compare against, with the fingerprint of its first
+/// 16 bytes.
+///
+/// Values of the right length are first compared on their fingerprint, a
+/// single 128-bit comparison, and only the bytes past the first 16 are compared
+/// when it matches.
+struct Literal {
+    bytes: Box<[u8]>,
+    prefix: u128,
+}
+
+impl Literal {
+    fn new(literal: &str) -> Self {
+        Self {
+            bytes: literal.as_bytes().into(),
+            prefix: fingerprint(literal.as_bytes()),
+        }
+    }
+
+    #[inline]
+    fn is_match(&self, value: &str) -> bool {
+        let value = value.as_bytes();
+        value.len() == self.bytes.len()
+            && fingerprint(value) == self.prefix
+            && value.get(16..) == self.bytes.get(16..)
+    }
+}
+
+/// Packs the first 16 bytes of `bytes`, zero padded, into an integer.
+#[inline]
+fn fingerprint(bytes: &[u8]) -> u128 {
+    let mut block = [0u8; 16];
+    let len = bytes.len().min(16);
+    block[..len].copy_from_slice(&bytes[..len]);
+    u128::from_le_bytes(block)
+}
+
+/// Returns the literal of a `^literal$` pattern, if the literal holds no regex
+/// metacharacter.
+fn anchored_literal(pattern: &str) -> Option<&str> {
+    let literal = pattern.strip_prefix('^')?.strip_suffix('$')?;
+    let is_plain = !literal.contains([
+        '\\', '.', '+', '*', '?', '(', ')', '|', '[', ']', '{', '}', '^', '$',
+    ]);
+    is_plain.then_some(literal)
+}
+
+/// The pattern of the `is_uuid` rule, a hyphenated UUID in any case.
+pub(crate) const UUID_PATTERN: &str =
+    r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$";
+
+/// The pattern of the `is_email` rule.
+pub(crate) const EMAIL_PATTERN: &str = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$";
+
+/// The pattern of the `is_url` rule, only the start of the value is checked.
+pub(crate) const URL_PATTERN: &str = r"^https?://[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}";
+
+/// Character class spellings with a SWAR check.
+const ASCII_CLASSES: [(&str, AsciiClass); 10] = [
+    ("[0-9]", AsciiClass::Digit),
+    (r"\d", AsciiClass::Digit),
+    ("[a-zA-Z]", AsciiClass::Alpha),
+    ("[A-Za-z]", AsciiClass::Alpha),
+    ("[a-zA-Z0-9]", AsciiClass::Alphanumeric),
+    ("[A-Za-z0-9]", AsciiClass::Alphanumeric),
+    ("[0-9a-zA-Z]", AsciiClass::Alphanumeric),
+    (r"[a-z0-9\s-]", AsciiClass::LowerCase),
+    (r"[A-Z0-9\s-]", AsciiClass::UpperCase),
+    ("[0-9a-fA-F]", AsciiClass::HexDigit),
+];
+
+/// A `^[class]{min,max}$` pattern over an ASCII class.
+///
+/// Every byte of a match is ASCII, so the byte length is the number of
+/// repetitions: a value of the wrong length is rejected without reading it, the
+/// others take a single pass over their bytes.
+#[derive(Debug, PartialEq, Eq)]
+struct CharClassMatch {
+    class: AsciiClass,
+    min: usize,
+    max: usize,
+}
+
+impl CharClassMatch {
+    #[inline]
+    fn is_match(&self, value: &[u8]) -> bool {
+        (self.min..=self.max).contains(&value.len())
+            && (value.is_empty() || self.class.matches_all(value))
+    }
+}
+
+/// Returns the class and length bounds of a `^[class]+$`, `^[class]*$`,
+/// `^[class]{n}$`, `^[class]{m,}$` or `^[class]{m,n}$` pattern, for the classes
+/// in [`ASCII_CLASSES`].
+fn char_class_match(pattern: &str) -> Option<CharClassMatch> {
+    let body = pattern.strip_prefix('^')?.strip_suffix('$')?;
+    let (class, repetition) = ASCII_CLASSES
+        .iter()
+        .find_map(|(spelling, class)| Some((*class, body.strip_prefix(spelling)?)))?;
+    let (min, max) = match repetition {
+        "+" => (1, usize::MAX),
+        "*" => (0, usize::MAX),
+        _ => {
+            let bounds = repetition.strip_prefix('{')?.strip_suffix('}')?;
+            match bounds.split_once(',') {
+                None => {
+                    let len = bounds.parse().ok()?;
+                    (len, len)
+                }
+                Some((min, "")) => (min.parse().ok()?, usize::MAX),
+                Some((min, max)) => (min.parse().ok()?, max.parse().ok()?),
+            }
+        }
+    };
+    (min <= max).then_some(CharClassMatch { class, min, max })
+}
+
+/// Longest value matched by a [`FixedShape`].
+const FIXED_SHAPE_MAX_LEN: usize = 64;
+
+/// Characters a regex may escape to match them literally.
+const ESCAPABLE: &[u8] = br"\.+*?()|[]{}^$#&-~";
+
+/// A `^...$` pattern of ASCII characters and classes, each repeated a fixed
+/// number of times, such as `^[A-Z]{3}-\d{3}$`.
+///
+/// Every match has the same byte length, so the pattern unrolls into the set of
+/// ASCII bytes allowed at each position, bit `b` of a `u128` standing for byte
+/// `b`. A value of another length is rejected without reading it, the others take
+/// one shift per byte and no branch.
+#[derive(Debug, PartialEq, Eq)]
+struct FixedShape {
+    positions: Box<[u128]>,
+}
+
+impl FixedShape {
+    #[inline]
+    fn is_match(&self, value: &[u8]) -> bool {
+        value.len() == self.positions.len()
+            && value
+                .iter()
+                .zip(self.positions.iter())
+                .fold(true, |matched, (&b, &allowed)| {
+                    // Shifting by a non-ASCII byte overflows, no position allows it
+                    matched & (allowed.checked_shr(b as u32).unwrap_or(0) & 1 == 1)
+                })
+    }
+}
+
+/// The bytes of `lo..=hi` as a position set.
+fn byte_range(lo: u8, hi: u8) -> u128 {
+    (lo..=hi).fold(0, |set, b| set | 1u128 << b)
+}
+
+/// Returns the bytes matched by the escape `\c`, for `\d`, `\s` and escaped
+/// metacharacters.
+fn shape_escape(c: u8) -> Option<u128> {
+    match c {
+        b'd' => Some(byte_range(b'0', b'9')),
+        b's' => Some(byte_range(b'\t', b'\r') | 1u128 << b' '),
+        _ if ESCAPABLE.contains(&c) => Some(1u128 << c),
+        _ => None,
+    }
+}
+
+/// Parses a bracketed class, `class` starting after its `[`, into the bytes it
+/// matches and the rest of the pattern.
+///
+/// Only ASCII characters, ranges between them, `\d`, `\s` and escaped
+/// metacharacters are accepted, `-` being literal as the first or last item.
+fn shape_class(class: &[u8]) -> Option<(u128, &[u8])> {
+    if matches!(class.first(), Some(b'^' | b']')) {
+        return None;
+    }
+    let mut set = 0;
+    let mut i = 0;
+    loop {
+        let item = match *class.get(i)? {
+            b']' => return (set != 0).then_some((set, &class[i + 1..])),
+            b'[' | b'&' | b'~' => return None,
+            b'\\' => {
+                i += 2;
+                shape_escape(*class.get(i - 1)?)?
+            }
+            b'-' if i == 0 || class.get(i + 1) == Some(&b']') => {
+                i += 1;
+                1u128 << b'-'
+            }
+            c if c.is_ascii() && c != b'-' => {
+                i += 1;
+                if class.get(i) == Some(&b'-') && class.get(i + 1) != Some(&b']') {
+                    let hi = *class.get(i + 1)?;
+                    if !hi.is_ascii() || hi < c || matches!(hi, b'\\' | b'[' | b'-' | b'&' | b'~') {
+                        return None;
                     }
+                    i += 2;
+                    byte_range(c, hi)
+                } else {
+                    1u128 << c
                 }
-                Ok(counter as usize)
             }
-            Err(e) => Err(RuleError::ArrowError(e)),
+            _ => return None,
+        };
+        set |= item;
+    }
+}
+
+/// Parses the next character or class of a pattern.
+fn shape_atom(pattern: &[u8]) -> Option<(u128, &[u8])> {
+    match *pattern.first()? {
+        b'[' => shape_class(&pattern[1..]),
+        b'\\' => Some((shape_escape(*pattern.get(1)?)?, &pattern[2..])),
+        c if c.is_ascii() && !ESCAPABLE.contains(&c) || matches!(c, b'&' | b'-' | b'~' | b'#') => {
+            Some((1u128 << c, &pattern[1..]))
+        }
+        _ => None,
+    }
+}
+
+/// Parses an optional `{n}` repetition, the only one with a fixed length.
+fn shape_repetition(pattern: &[u8]) -> Option<(usize, &[u8])> {
+    match pattern.first() {
+        Some(b'{') => {
+            let end = pattern.iter().position(|&b| b == b'}')?;
+            let count = &pattern[1..end];
+            if count.is_empty() || !count.iter().all(u8::is_ascii_digit) {
+                return None;
+            }
+            Some((
+                std::str::from_utf8(count).ok()?.parse().ok()?,
+                &pattern[end + 1..],
+            ))
+        }
+        Some(b'+' | b'*' | b'?') => None,
+        _ => Some((1, pattern)),
+    }
+}
+
+/// Returns the per-position byte sets of a fixed-length `^...$` pattern, see
+/// [`FixedShape`].
+fn fixed_shape(pattern: &str) -> Option<FixedShape> {
+    let mut body = pattern.strip_prefix('^')?.strip_suffix('$')?.as_bytes();
+    let mut positions = Vec::new();
+    while !body.is_empty() {
+        let (allowed, rest) = shape_atom(body)?;
+        let (count, rest) = shape_repetition(rest)?;
+        if count > FIXED_SHAPE_MAX_LEN - positions.len() {
+            return None;
         }
+        positions.extend(std::iter::repeat(allowed).take(count));
+        body = rest;
     }
+    (!positions.is_empty()).then(|| FixedShape {
+        positions: positions.into(),
+    })
 }
 
 /// A rule to check if strings in a `StringArray` match a regex pattern.
+///
+/// The pattern is compiled once when the rule is built, so validating a batch
+/// never pays for regex compilation. Anchored literal patterns such as
+/// `^Home & Kitchen$` skip the regex engine and compare strings directly, and
+/// repeated ASCII classes such as `^[0-9]{13}$` check the length, then the
+/// bytes with SWAR. Other fixed-length patterns such as `^[A-Z]{3}-\d{3}$` check
+/// each byte against the set allowed at its position.
 pub struct RegexMatch {
     name: String,
     threshold: f64,
-    pattern: String,
-    flag: Option<String>,
+    matcher: Matcher,
 }
 
 impl RegexMatch {
-    pub fn new(name: String, threshold: f64, pattern: String, flag: Option<String>) -> Self {
-        Self {
+    pub fn new(
+        name: String,
+        threshold: f64,
+        pattern: String,
+        flag: Option<String>,
+    ) -> Result<Self, RuleError> {
+        Ok(Self {
             name,
             threshold,
-            pattern,
-            flag,
-        }
+            matcher: Matcher::new(pattern, flag)?,
+        })
     }
 }
 
@@ -109,38 +578,126 @@ impl StringRule for RegexMatch {
         self.threshold
     }
 
-    fn validate(&self, array: &StringArray, column: String) -> Result<usize, RuleError> {
-        let flag = self.flag.as_deref();
-        if let Ok(match_array) = compute::regexp_is_match_scalar(array, self.pattern.as_str(), flag)
-        {
-            let n = match_array.len();
-            let null_value = match_array.null_count();
-            let true_count = match_array.true_count();
-            let violations = n - true_count - null_value;
-            Ok(violations)
+    fn validate(&self, array: &StringArray, _column: String) -> Result<usize, RuleError> {
+        let violations = valid_values(array)
+            .filter(|v| !self.matcher.is_match(v))
+            .count();
+        Ok(violations)
+    }
+
+    fn is_valid(&self, value: &str) -> bool {
+        self.matcher.is_match(value)
+    }
+
+    fn prefers_distinct_values(&self) -> bool {
+        // The other matchers are single scans, about the cost of hashing the value
+        matches!(
+            self.matcher,
+            Matcher::Regex(_) | Matcher::CharClassOrRegex(..) | Matcher::FixedShapeOrRegex(..)
+        )
+    }
+}
+
+/// Largest member list, and longest member, compared on fingerprints.
+const SMALL_SET_MAX_MEMBERS: usize = 16;
+const SMALL_SET_MAX_LEN: usize = 16;
+
+/// The allowed values of an `is_in` rule.
+enum MemberSet {
+    /// Up to 16 members of at most 16 bytes, such as currency or status codes,
+    /// stored as their [`fingerprint`] and bucketed by length: the members of
+    /// length `n` are `fingerprints[offsets[n]..offsets[n + 1]]`. A value is only
+    /// compared against the members of its own length, with no hashing and no
+    /// false positive.
+    Small {
+        offsets: [u8; SMALL_SET_MAX_LEN + 2],
+        fingerprints: Box<[u128]>,
+    },
+    /// The members themselves, so a value whose hash collides with a member's is
+    /// still rejected.
+    Hashed(HashSet<Box<[u8]>, Xxh3Builder>),
+}
+
+impl MemberSet {
+    fn new(members: &[String]) -> Self {
+        let is_small = members.len() <= SMALL_SET_MAX_MEMBERS
+            && members.iter().all(|m| m.len() <= SMALL_SET_MAX_LEN);
+        if is_small {
+            let mut sorted: Vec<&[u8]> = members.iter().map(|m| m.as_bytes()).collect();
+            sorted.sort_unstable_by_key(|m| m.len());
+            let mut offsets = [0u8; SMALL_SET_MAX_LEN + 2];
+            for (len, offset) in offsets.iter_mut().enumerate() {
+                *offset = sorted.partition_point(|m| m.len() < len) as u8;
+            }
+            MemberSet::Small {
+                offsets,
+                fingerprints: sorted.into_iter().map(fingerprint).collect(),
+            }
         } else {
-            Err(RuleError::ValidationError(column))
+            MemberSet::Hashed(members.iter().map(|m| m.as_bytes().into()).collect())
+        }
+    }
+
+    #[inline]
+    fn contains(&self, value: &[u8]) -> bool {
+        match self {
+            MemberSet::Small {
+                offsets,
+                fingerprints,
+            } => {
+                let len = value.len();
+                if len > SMALL_SET_MAX_LEN {
+                    return false;
+                }
+                let bucket = &fingerprints[offsets[len] as usize..offsets[len + 1] as usize];
+                if bucket.is_empty() {
+                    return false;
+                }
+                let key = fingerprint(value);
+                bucket.iter().any(|&member| member == key)
+            }
+            MemberSet::Hashed(members) => members.contains(value),
         }
     }
 }
 
+/// Maximum number of distinct member lists kept by [`intern_members`].
+const MEMBER_SETS_CAPACITY: usize = 256;
+
+/// Member sets already built, keyed by their member list.
+static MEMBER_SETS: Lazy<Mutex<HashMap<Arc<[String]>, Arc<MemberSet>>>> =
+    Lazy::new(|| Mutex::new(HashMap::new()));
+
+/// Returns the hashed set of `members`, building it only the first time a
+/// given member list is seen.
+///
+/// The same allowlists tend to be reused across columns and tables, they now
+/// share one set instead of hashing every member again on each compile.
+fn intern_members(members: &[String]) -> Arc<MemberSet> {
+    let mut sets = MEMBER_SETS.lock().unwrap_or_else(|e| e.into_inner());
+    if let Some(set) = sets.get(members) {
+        return Arc::clone(set);
+    }
+    let set = Arc::new(MemberSet::new(members));
+    if sets.len() >= MEMBER_SETS_CAPACITY {
+        sets.clear();
+    }
+    sets.insert(members.into(), Arc::clone(&set));
+    set
+}
+
 pub struct IsInCheck {
     name: String,
     threshold: f64,
-    members: HashSet<u64, Xxh3Builder>,
+    members: Arc<MemberSet>,
 }
 
 impl IsInCheck {
-    pub fn new(name: String, threshold: f64, members: Vec<String>) -> Self {
-        let mut hashset = HashSet::with_hasher(Xxh3Builder);
-        members.into_iter().for_each(|m| {
-            let hash = xxh3_64(m.as_bytes());
-            let _ = hashset.insert(hash);
-        });
+    pub fn new(name: String, threshold: f64, members: impl AsRef<[String]>) -> Self {
         Self {
             name,
             threshold,
-            members: hashset,
+            members: intern_members(members.as_ref()),
         }
     }
 }
@@ -155,23 +712,15 @@ impl StringRule for IsInCheck {
     }
 
     fn validate(&self, array: &StringArray, _column: String) -> Result<usize, RuleError> {
-        let errors = array
-            .iter()
-            .map(|v| {
-                if let Some(s) = v {
-                    let s_hash = xxh3_64(s.as_bytes());
-                    if !self.members.contains(&s_hash) {
-                        1
-                    } else {
-                        0
-                    }
-                } else {
-                    0
-                }
-            })
-            .sum();
+        let errors = valid_values(array)
+            .filter(|s| !self.members.contains(s.as_bytes()))
+            .count();
         Ok(errors)
     }
+
+    fn is_valid(&self, value: &str) -> bool {
+        self.members.contains(value.as_bytes())
+    }
 }
 
 #[cfg(test)]
@@ -214,6 +763,81 @@ mod tests {
         assert_eq!(rule.validate(&array, "test_col".to_string()).unwrap(), 2);
     }
 
+    #[test]
+    fn test_string_length_check_with_null() {
+        let rule = StringLengthCheck::new("string_length_test".to_string(), 0.0, Some(2), Some(3));
+        let array = StringArray::from(vec![Some("a"), None, Some("abc"), Some("abcd"), None]);
+        // "a" (len 1, <2) -> 1 error
+        // "abcd" (len 4, >3) -> 1 error
+        assert_eq!(rule.validate(&array, "test_col".to_string()).unwrap(), 2);
+    }
+
+    #[test]
+    fn test_string_length_check_sliced() {
+        let rule = StringLengthCheck::new("string_length_test".to_string(), 0.0, Some(2), None);
+        let array = StringArray::from(vec!["a", "abc", "b", "cd"]).slice(1, 2);
+        // Only "abc" and "b" are in the slice, "b" -> 1 error
+        assert_eq!(rule.validate(&array, "test_col".to_string()).unwrap(), 1);
+    }
+
+    #[test]
+    fn test_string_length_check_bounds() {
+        let array = StringArray::from(vec![Some(""), Some("ab"), None, Some("abcd")]);
+        // min above max, every value is an error
+        let rule = StringLengthCheck::new("string_length_test".to_string(), 0.0, Some(3), Some(2));
+        assert_eq!(rule.validate(&array, "test_col".to_string()).unwrap(), 3);
+        let rule = StringLengthCheck::new("string_length_test".to_string(), 0.0, Some(0), Some(0));
+        assert_eq!(rule.validate(&array, "test_col".to_string()).unwrap(), 2);
+        let rule = StringLengthCheck::new(
+            "string_length_test".to_string(),
+            0.0,
+            Some(usize::MAX),
+            None,
+        );
+        assert_eq!(rule.validate(&array, "test_col".to_string()).unwrap(), 3);
+    }
+
+    #[test]
+    fn test_distinct_values() {
+        let mut values = vec![Some("EUR"); 40];
+        values.extend([Some("USD"); 10]);
+        values.extend([Some("eur"), None, None]);
+        let array = StringArray::from(values);
+        let distinct = DistinctValues::collect(&array).unwrap();
+        assert_eq!(distinct.values.len(), 3);
+
+        let rule = RegexMatch::new(
+            "regex_match_test".to_string(),
+            0.0,
+            "^[A-Z]{3}$|^GBP$".to_string(),
+            None,
+        )
+        .unwrap();
+        assert!(rule.prefers_distinct_values());
+        assert_eq!(distinct.count_invalid(&rule), 1);
+        assert_eq!(
+            distinct.count_invalid(&rule),
+            rule.validate(&array, "test_col".to_string()).unwrap()
+        );
+    }
+
+    #[test]
+    fn test_distinct_values_high_cardinality() {
+        let values: Vec<String> = (0..64).map(|i| format!("value-{}", i % 8)).collect();
+        let array = StringArray::from(values);
+        assert!(DistinctValues::collect(&array).is_none());
+    }
+
+    #[test]
+    fn test_valid_values() {
+        let array = StringArray::from(vec![Some("a"), None, Some("b"), None, None, Some("c")]);
+        assert_eq!(valid_values(&array).collect::<Vec<_>>(), ["a", "b", "c"]);
+        let sliced = array.slice(1, 3);
+        assert_eq!(valid_values(&sliced).collect::<Vec<_>>(), ["b"]);
+        let no_null = StringArray::from(vec!["a", "b"]);
+        assert_eq!(valid_values(&no_null).collect::<Vec<_>>(), ["a", "b"]);
+    }
+
     #[test]
     fn test_regex_match() {
         let rule = RegexMatch::new(
@@ -221,7 +845,8 @@ mod tests {
             0.0,
             r"^\d{3}$".to_string(),
             None,
-        ); // Expects exactly 3 digits
+        )
+        .unwrap(); // Expects exactly 3 digits
         let array = StringArray::from(vec![
             Some("123"),  // ok
             Some("abc"),  // error
@@ -243,7 +868,8 @@ mod tests {
             0.0,
             "abc".to_string(),
             Some("i".to_string()),
-        );
+        )
+        .unwrap();
         let array = StringArray::from(vec![
             Some("ABC"), // ok
             Some("def"), // error
@@ -252,6 +878,360 @@ mod tests {
         assert_eq!(rule.validate(&array, "test_col".to_string()).unwrap(), 1);
     }
 
+    #[test]
+    fn test_regex_match_anchored_literal() {
+        let rule = RegexMatch::new(
+            "regex_match_test".to_string(),
+            0.0,
+            "^Home & Kitchen$".to_string(),
+            None,
+        )
+        .unwrap();
+        assert!(matches!(rule.matcher, Matcher::Literal(_)));
+        let array = StringArray::from(vec![
+            Some("Home & Kitchen"),     // ok
+            Some("Home & Kitchen Pro"), // error
+            Some("home & kitchen"),     // error
+            None,                       // ok
+        ]);
+        assert_eq!(rule.validate(&array, "test_col".to_string()).unwrap(), 2);
+    }
+
+    #[test]
+    fn test_anchored_literal() {
+        assert_eq!(anchored_literal("^Home & Kitchen$"), Some("Home & Kitchen"));
+        assert_eq!(anchored_literal("^$"), Some(""));
+        assert_eq!(anchored_literal("Home$"), None);
+        assert_eq!(anchored_literal("^Home"), None);
+        assert_eq!(anchored_literal(r"^\d+$"), None);
+        assert_eq!(anchored_literal("^a.c$"), None);
+    }
+
+    #[test]
+    fn test_regex_match_ascii_class() {
+        let rule = RegexMatch::new(
+            "regex_match_test".to_string(),
+            0.0,
+            "^[0-9]+$".to_string(),
+            None,
+        )
+        .unwrap();
+        assert!(matches!(rule.matcher, Matcher::CharClass(_)));
+        let array = StringArray::from(vec![
+            Some("4006381333931"),  // ok
+            Some("400638133393X"),  // error
+            Some(""),               // error
+            Some("\u{663}\u{664}"), // error, not ASCII digits
+            None,                   // ok
+        ]);
+        assert_eq!(rule.validate(&array, "test_col".to_string()).unwrap(), 3);
+    }
+
+    #[test]
+    fn test_regex_match_char_class_with_length() {
+        let rule = RegexMatch::new(
+            "regex_match_test".to_string(),
+            0.0,
+            "^[0-9]{13}$".to_string(),
+            None,
+        )
+        .unwrap();
+        let array = StringArray::from(vec![
+            Some("4006381333931"),  // ok
+            Some("400638133393"),   // error, too short
+            Some("40063813339310"), // error, too long
+            Some("400638133393X"),  // error
+            None,                   // ok
+        ]);
+        assert_eq!(rule.validate(&array, "test_col".to_string()).unwrap(), 3);
+    }
+
+    #[test]
+    fn test_char_class_match() {
+        let digits = |min, max| {
+            Some(CharClassMatch {
+                class: AsciiClass::Digit,
+                min,
+                max,
+            })
+        };
+        assert_eq!(char_class_match("^[0-9]+$"), digits(1, usize::MAX));
+        assert_eq!(char_class_match("^[0-9]*$"), digits(0, usize::MAX));
+        assert_eq!(char_class_match("^[0-9]{13}$"), digits(13, 13));
+        assert_eq!(char_class_match("^[0-9]{2,}$"), digits(2, usize::MAX));
+        assert_eq!(char_class_match("^[0-9]{2,5}$"), digits(2, 5));
+        assert_eq!(
+            char_class_match("^[a-zA-Z0-9]+$").map(|m| m.class),
+            Some(AsciiClass::Alphanumeric)
+        );
+        assert_eq!(char_class_match(r"^\d+$"), digits(1, usize::MAX));
+        assert_eq!(char_class_match("^[0-9]{5,2}$"), None);
+        assert_eq!(char_class_match("^[0-9]{,2}$"), None);
+        assert_eq!(char_class_match("^[0-9]+-[0-9]+$"), None);
+        assert_eq!(char_class_match("[0-9]+"), None);
+    }
+
+    #[test]
+    fn test_regex_match_case_class() {
+        let rule = RegexMatch::new(
+            "regex_match_test".to_string(),
+            0.0,
+            r"^[a-z0-9\s-]+$".to_string(),
+            None,
+        )
+        .unwrap();
+        assert!(matches!(rule.matcher, Matcher::CharClassOrRegex(..)));
+        let array = StringArray::from(vec![
+            Some("hello world-42"),   // ok
+            Some("hello\u{a0}world"), // ok, non-breaking space is whitespace
+            Some("Hello world"),      // error
+            Some("h\u{e9}llo"),       // error
+            None,                     // ok
+        ]);
+        assert_eq!(rule.validate(&array, "test_col".to_string()).unwrap(), 2);
+    }
+
+    #[test]
+    fn test_regex_match_uuid() {
+        let rule = RegexMatch::new(
+            "regex_match_test".to_string(),
+            0.0,
+            UUID_PATTERN.to_string(),
+            None,
+        )
+        .unwrap();
+        assert!(matches!(rule.matcher, Matcher::Uuid));
+        let regex = Regex::new(UUID_PATTERN).unwrap();
+        let values = [
+            "123e4567-e89b-12d3-a456-426614174000",
+            "123E4567-E89B-12D3-A456-426614174000",
+            "123e4567-e89b-12d3-a456-42661417400",
+            "123e4567e89b12d3a456426614174000",
+            "123e4567-e89b-12d3-a456-42661417400z",
+            "",
+        ];
+        for value in values {
+            assert_eq!(
+                rule.matcher.is_match(value),
+                regex.is_match(value),
+                "{value}"
+            );
+        }
+    }
+
+    #[test]
+    fn test_regex_match_email_and_url() {
+        let email = Matcher::new(EMAIL_PATTERN.to_string(), None).unwrap();
+        let url = Matcher::new(URL_PATTERN.to_string(), None).unwrap();
+        assert!(matches!(email, Matcher::Email));
+        assert!(matches!(url, Matcher::Url));
+        let email_regex = Regex::new(EMAIL_PATTERN).unwrap();
+        let url_regex = Regex::new(URL_PATTERN).unwrap();
+        let values = [
+            "test@example.com",
+            "first.last+tag@sub.example.co",
+            "test@example",
+            "@example.com",
+            "test@example.c0m",
+            "https://example.com/path",
+            "http://example",
+            "ftp://example.com",
+            "https://.com",
+            "",
+        ];
+        for value in values {
+            assert_eq!(
+                email.is_match(value),
+                email_regex.is_match(value),
+                "{value}"
+            );
+            assert_eq!(url.is_match(value), url_regex.is_match(value), "{value}");
+        }
+    }
+
+    #[test]
+    fn test_regex_match_unicode_digits() {
+        let rule = RegexMatch::new(
+            "regex_match_test".to_string(),
+            0.0,
+            r"^\d+$".to_string(),
+            None,
+        )
+        .unwrap();
+        assert!(matches!(rule.matcher, Matcher::CharClassOrRegex(..)));
+        let array = StringArray::from(vec![
+            Some("4006381333931"),  // ok
+            Some("\u{663}\u{664}"), // ok, Arabic-Indic digits
+            Some("12a"),            // error
+            Some(""),               // error
+            None,                   // ok
+        ]);
+        assert_eq!(rule.validate(&array, "test_col".to_string()).unwrap(), 2);
+    }
+
+    #[test]
+    fn test_fixed_shape() {
+        let shape = fixed_shape(r"^[A-Z]{3}-\d{3}$").unwrap();
+        assert_eq!(shape.positions.len(), 7);
+        assert!(shape.is_match(b"ABC-123"));
+        assert!(!shape.is_match(b"abc-123"));
+        assert!(!shape.is_match(b"ABC_123"));
+        assert!(!shape.is_match(b"ABC-12"));
+        assert!(!shape.is_match(b"ABC-1234"));
+        assert!(!shape.is_match("AB\u{c9}-123".as_bytes()));
+
+        let shape = fixed_shape(r"^[a-c-]\.x{2}[-0]$").unwrap();
+        assert!(shape.is_match(b"-.xx0"));
+        assert!(shape.is_match(b"b.xx-"));
+        assert!(!shape.is_match(b"b-xx-"));
+
+        assert_eq!(fixed_shape("^[A-Z]+-[0-9]{3}$"), None);
+        assert_eq!(fixed_shape("^[A-Z]{2,3}$"), None);
+        assert_eq!(fixed_shape("^[^A-Z]{3}$"), None);
+        assert_eq!(fixed_shape(r"^\w{3}$"), None);
+        assert_eq!(fixed_shape("^(AB|CD)$"), None);
+        assert_eq!(fixed_shape("^[a-c-e]$"), None);
+        assert_eq!(fixed_shape("^[0-9]{65}$"), None);
+        assert_eq!(fixed_shape("[A-Z]{3}"), None);
+    }
+
+    #[test]
+    fn test_regex_match_fixed_shape() {
+        let rule = RegexMatch::new(
+            "regex_match_test".to_string(),
+            0.0,
+            r"^[A-Z]{3}-\d{3}$".to_string(),
+            None,
+        )
+        .unwrap();
+        assert!(matches!(rule.matcher, Matcher::FixedShapeOrRegex(..)));
+        let array = StringArray::from(vec![
+            Some("ABC-123"),                   // ok
+            Some("ABC-\u{663}\u{664}\u{665}"), // ok, Arabic-Indic digits
+            Some("AB-123"),                    // error
+            Some("abc-123"),                   // error
+            None,                              // ok
+        ]);
+        assert_eq!(rule.validate(&array, "test_col".to_string()).unwrap(), 2);
+
+        let rule = RegexMatch::new(
+            "regex_match_test".to_string(),
+            0.0,
+            "^[A-Z]{2}[0-9]{2}-[a-z]$".to_string(),
+            None,
+        )
+        .unwrap();
+        assert!(matches!(rule.matcher, Matcher::FixedShape(_)));
+        assert!(rule.is_valid("FR75-a"));
+        assert!(!rule.is_valid("FR75a"));
+    }
+
+    #[test]
+    fn test_char_class_match_empty() {
+        let optional = char_class_match("^[a-zA-Z]*$").unwrap();
+        assert!(optional.is_match(b""));
+        assert!(optional.is_match(b"abc"));
+        assert!(!optional.is_match(b"ab1"));
+        let required = char_class_match("^[a-zA-Z]+$").unwrap();
+        assert!(!required.is_match(b""));
+    }
+
+    #[test]
+    fn test_check_pattern() {
+        assert!(check_pattern(r"^[A-Z]{3}-\d{3}$", None).is_ok());
+        assert!(check_pattern("abc", Some("i")).is_ok());
+        assert!(check_pattern("[a-", None).is_err());
+        assert!(check_pattern("abc", Some("z")).is_err());
+    }
+
+    #[test]
+    fn test_compile_regex_cached() {
+        let first = compile_regex(r"^[A-Z]{3}-\d{3}$").unwrap();
+        let second = compile_regex(r"^[A-Z]{3}-\d{3}$").unwrap();
+        assert_eq!(first.as_str(), second.as_str());
+        assert!(second.is_match("ABC-123"));
+        assert!(compile_regex("[a-").is_err());
+    }
+
+    #[test]
+    fn test_literal_fingerprint() {
+        let short = Literal::new("Home & Kitchen");
+        assert!(short.is_match("Home & Kitchen"));
+        assert!(!short.is_match("Home & Kitchens"));
+        assert!(!short.is_match("Home & Kitchem"));
+        assert!(!short.is_match(""));
+
+        let long = Literal::new("Home & Kitchen Appliances");
+        assert!(long.is_match("Home & Kitchen Appliances"));
+        assert!(!long.is_match("Home & Kitchen Appliancez"));
+        assert!(!long.is_match("Home & Kitchen"));
+    }
+
+    #[test]
+    fn test_intern_members_shares_sets() {
+        let a = IsInCheck::new(
+            "a".to_string(),
+            0.0,
+            vec!["EUR".to_string(), "USD".to_string()],
+        );
+        let b = IsInCheck::new(
+            "b".to_string(),
+            0.0,
+            vec!["EUR".to_string(), "USD".to_string()],
+        );
+        let c = IsInCheck::new("c".to_string(), 0.0, vec!["EUR".to_string()]);
+        assert!(Arc::ptr_eq(&a.members, &b.members));
+        assert!(!Arc::ptr_eq(&a.members, &c.members));
+    }
+
+    #[test]
+    fn test_member_set_small() {
+        let members = vec!["EUR".to_string(), "USD".to_string(), "".to_string()];
+        let set = MemberSet::new(&members);
+        assert!(matches!(set, MemberSet::Small { .. }));
+        assert!(set.contains(b"EUR"));
+        assert!(set.contains(b""));
+        assert!(!set.contains(b"EU"));
+        assert!(!set.contains(b"EUR\0"));
+        assert!(!set.contains(b"EURO"));
+        assert!(!set.contains(b"EUR EUR EUR EUR EUR"));
+    }
+
+    #[test]
+    fn test_member_set_small_length_buckets() {
+        let members = vec![
+            "banana".to_string(),
+            "fig".to_string(),
+            "apple".to_string(),
+            "kiwi".to_string(),
+            "sixteen bytes!!!".to_string(),
+            "pear".to_string(),
+        ];
+        let set = MemberSet::new(&members);
+        for member in &members {
+            assert!(set.contains(member.as_bytes()));
+        }
+        assert!(!set.contains(b"plum"));
+        assert!(!set.contains(b"fi"));
+        assert!(!set.contains(b"figs"));
+        assert!(!set.contains(b"sixteen bytes!!?"));
+    }
+
+    #[test]
+    fn test_member_set_hashed() {
+        let long = vec!["a member longer than sixteen bytes".to_string()];
+        let set = MemberSet::new(&long);
+        assert!(matches!(set, MemberSet::Hashed(_)));
+        assert!(set.contains(b"a member longer than sixteen bytes"));
+        assert!(!set.contains(b"a member"));
+
+        let many: Vec<String> = (0..20).map(|i| i.to_string()).collect();
+        let set = MemberSet::new(&many);
+        assert!(matches!(set, MemberSet::Hashed(_)));
+        assert!(set.contains(b"19"));
+        assert!(!set.contains(b"20"));
+    }
+
     #[test]
     fn test_is_in_check_basic() {
         let members = vec!["apple".to_string(), "banana".to_string()];
@@ -2,7 +2,7 @@ use std::collections::HashMap;
 
 use crate::columns::{relation_builder::RelationBuilder, ColumnBuilder};
 use crate::errors::RuleError;
-use crate::readers::csv_reader::read_csv_parallel_with_config;
+use crate::readers::csv_reader::CsvSource;
 use crate::readers::ReaderConfig;
 use crate::tables::Table;
 use crate::validator::{ExecutableColumn, ExecutableRelation};
@@ -13,6 +13,7 @@ pub struct CsvTable {
     table_name: String,
     executable_columns: Box<[ExecutableColumn]>,
     executable_relations: Option<Box<[ExecutableRelation]>>,
+    source: Option<CsvSource>,
 }
 
 impl CsvTable {
@@ -23,6 +24,7 @@ impl CsvTable {
             table_name,
             executable_columns: Box::new([]),
             executable_relations: None,
+            source: None,
         })
     }
 }
@@ -61,15 +63,17 @@ impl Table for CsvTable {
             .map(|v| v.get_name())
             .collect();
         let config = ReaderConfig::default();
-        let batches = read_csv_parallel_with_config(self.path.as_str(), needed_cols, &config)?;
-        //let batches = read_csv_parallel(self.path.as_str(), needed_cols)?;
-        // What should i do with this!
-        let _existing_cols = self
-            .executable_columns
-            .iter()
-            .filter(|exec| batches[0].schema().index_of(&exec.get_name()).is_ok())
-            .collect::<Vec<&ExecutableColumn>>()
-            .into_boxed_slice();
+        // The file is opened on the first run and kept for the following ones
+        let source = match self.source.take() {
+            Some(mut source) => {
+                source.refresh()?;
+                source
+            }
+            None => CsvSource::open(self.path.as_str())?,
+        };
+        let batches = source.read(&needed_cols, &config);
+        self.source = Some(source);
+        let batches = batches?;
         let engine =
             engine::ValidationEngine::new(&self.executable_columns, &self.executable_relations);
         engine.validate_batches(self.table_name.clone(), &batches)
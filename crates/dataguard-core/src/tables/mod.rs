@@ -8,7 +8,8 @@ use crate::{
 pub mod csv_table;
 pub mod parquet_table;
 
-pub trait Table {
+/// A validated data source. Tables are `Send` so several can be validated in parallel.
+pub trait Table: Send {
     fn validate(&mut self) -> Result<ValidationResult, RuleError>;
     fn prepare(
         &mut self,
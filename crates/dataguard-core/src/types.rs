@@ -1,13 +1,13 @@
 use std::{
-    collections::{HashMap, HashSet},
+    collections::HashMap,
     sync::{atomic::AtomicUsize, Arc, Mutex},
 };
 
-use crate::{utils::hasher::Xxh3Builder, RuleResult};
+use crate::RuleResult;
 
 pub type Batch = arrow::record_batch::RecordBatch;
 pub type Batches = Vec<Batch>;
-pub type UnicityRecord = (AtomicUsize, Arc<Mutex<HashSet<u64, Xxh3Builder>>>, f64);
+pub type UnicityRecord = (AtomicUsize, Arc<Mutex<Vec<u64>>>, f64);
 
 /// Maps column names to their valid row counts
 pub type ValidValueMap = HashMap<String, usize>;
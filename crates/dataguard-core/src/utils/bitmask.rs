@@ -0,0 +1,59 @@
+//! Counting rule violations 64 rows at a time against the validity bitmap.
+
+use arrow::buffer::NullBuffer;
+
+/// Packs up to 64 booleans into a `u64`, the first one in the lowest bit.
+#[inline]
+pub fn pack_bits(bits: impl Iterator<Item = bool>) -> u64 {
+    bits.enumerate()
+        .fold(0, |word, (i, bit)| word | (bit as u64) << i)
+}
+
+/// Counts the valid rows, according to `nulls`, for which `rows` sets a bit.
+///
+/// `rows(start, len)` returns the bits of rows `start..start + len`, `len` being
+/// at most 64, packed with [`pack_bits`]. Each word is AND-ed with the matching
+/// word of the validity bitmap and counted with `count_ones`, so nulls cost
+/// neither a branch nor a bit by bit walk of the bitmap.
+pub fn count_valid(nulls: &NullBuffer, rows: impl Fn(usize, usize) -> u64) -> usize {
+    let chunks = nulls.inner().bit_chunks();
+    let full: usize = chunks
+        .iter()
+        .enumerate()
+        .map(|(i, valid)| (rows(i * 64, 64) & valid).count_ones() as usize)
+        .sum();
+    let remainder = match chunks.remainder_len() {
+        0 => 0,
+        len => (rows(chunks.chunk_len() * 64, len) & chunks.remainder_bits()).count_ones(),
+    };
+    full + remainder as usize
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use arrow::buffer::BooleanBuffer;
+
+    #[test]
+    fn test_pack_bits() {
+        assert_eq!(pack_bits([true, false, true].into_iter()), 0b101);
+        assert_eq!(pack_bits(std::iter::repeat(true).take(64)), u64::MAX);
+        assert_eq!(pack_bits(std::iter::empty()), 0);
+    }
+
+    #[test]
+    fn test_count_valid() {
+        // Every third row is null, odd rows are set: 150 rows span two words and a remainder
+        let validity: Vec<bool> = (0..150).map(|i| i % 3 != 0).collect();
+        let expected = (0..150).filter(|i| i % 3 != 0 && i % 2 == 1).count();
+        let nulls = NullBuffer::from(validity.clone());
+        let odd = |start: usize, len: usize| pack_bits((start..start + len).map(|i| i % 2 == 1));
+        assert_eq!(count_valid(&nulls, odd), expected);
+
+        // A sliced bitmap does not start on a word boundary
+        let sliced = NullBuffer::new(BooleanBuffer::from(validity).slice(5, 100));
+        let expected = (5..105).filter(|i| i % 3 != 0 && i % 2 == 0).count();
+        let odd = |start: usize, len: usize| pack_bits((start..start + len).map(|i| i % 2 == 1));
+        assert_eq!(count_valid(&sliced, odd), expected);
+    }
+}
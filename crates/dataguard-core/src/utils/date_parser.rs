@@ -1,19 +1,61 @@
 use arrow_array::{Date32Array, StringArray};
-use chrono::NaiveDate;
+use chrono::{
+    format::{parse, Parsed, StrftimeItems},
+    Datelike, NaiveDate,
+};
 
+/// `num_days_from_ce` of 1970-01-01, where 0001-01-01 is day 1.
+const UNIX_EPOCH_DAYS_FROM_CE: i32 = 719_163;
+
+/// Parses every value of `array` with `format`, values that do not match are null.
+///
+/// The format is parsed once for the whole column, not once per value as
+/// `NaiveDate::parse_from_str` does. An invalid format matches no value.
 pub fn parse_date_column(array: &StringArray, format: &str) -> Date32Array {
+    let Ok(items) = StrftimeItems::new(format).parse() else {
+        return Date32Array::new_null(array.len());
+    };
     array
         .iter()
-        .map(|opt_str| opt_str.and_then(|str_date| parse_date(str_date, format)))
+        .map(|opt_str| {
+            opt_str.and_then(|str_date| {
+                let mut parsed = Parsed::new();
+                parse(&mut parsed, str_date, items.iter()).ok()?;
+                parsed.to_naive_date().ok().map(days_since_epoch)
+            })
+        })
         .collect()
 }
 
-fn parse_date(str_date: &str, format: &str) -> Option<i32> {
-    NaiveDate::parse_from_str(str_date, format)
-        .ok()
-        .map(|date| {
-            // We can safely unwrap as 1970-01-01 is a valid existing date
-            date.signed_duration_since(NaiveDate::from_ymd_opt(1970, 1, 1).unwrap())
-                .num_days() as i32
-        })
+fn days_since_epoch(date: NaiveDate) -> i32 {
+    date.num_days_from_ce() - UNIX_EPOCH_DAYS_FROM_CE
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use arrow_array::Array;
+
+    #[test]
+    fn test_parse_date_column() {
+        let array = StringArray::from(vec![
+            Some("1970-01-01"),
+            Some("1969-12-31"),
+            Some("2025-01-06"),
+            Some("2025-02-30"),
+            Some("06/01/2025"),
+            None,
+        ]);
+        let dates = parse_date_column(&array, "%Y-%m-%d");
+        let expected = Date32Array::from(vec![Some(0), Some(-1), Some(20094), None, None, None]);
+        assert_eq!(dates, expected);
+    }
+
+    #[test]
+    fn test_parse_date_column_invalid_format() {
+        let array = StringArray::from(vec![Some("2025-01-06"), None]);
+        let dates = parse_date_column(&array, "%Y-%Q");
+        assert_eq!(dates.len(), 2);
+        assert_eq!(dates.null_count(), 2);
+    }
 }
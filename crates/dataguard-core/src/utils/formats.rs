@@ -0,0 +1,104 @@
+//! Hand-written checks for the fixed patterns of the `is_email` and `is_url` rules.
+//!
+//! Each check makes a single pass over the value and accepts exactly the strings
+//! its regex matches.
+
+use memchr::{memchr, memrchr};
+
+/// Returns `true` for the bytes of `[a-zA-Z0-9.-]`, the host name characters.
+#[inline]
+fn is_host_byte(b: u8) -> bool {
+    b.is_ascii_alphanumeric() || b == b'.' || b == b'-'
+}
+
+/// Returns `true` for the bytes of `[a-zA-Z0-9._%+-]`, the email local part characters.
+#[inline]
+fn is_local_byte(b: u8) -> bool {
+    is_host_byte(b) || b == b'_' || b == b'%' || b == b'+'
+}
+
+/// Matches `^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$`.
+///
+/// None of the classes holds `@`, so the value splits on its only `@`, found with
+/// `memchr`. The top-level domain holds no `.` either, so it starts after the last
+/// `.` of the domain.
+pub fn is_email(bytes: &[u8]) -> bool {
+    let Some(at) = memchr(b'@', bytes) else {
+        return false;
+    };
+    let (local, domain) = (&bytes[..at], &bytes[at + 1..]);
+    if local.is_empty() || !local.iter().all(|&b| is_local_byte(b)) {
+        return false;
+    }
+    if !domain.iter().all(|&b| is_host_byte(b)) {
+        return false;
+    }
+    match memrchr(b'.', domain) {
+        Some(dot) => {
+            let tld = &domain[dot + 1..];
+            dot > 0 && tld.len() >= 2 && tld.iter().all(u8::is_ascii_alphabetic)
+        }
+        None => false,
+    }
+}
+
+/// Matches `^https?://[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}`, anything may follow.
+///
+/// The host must hold a `.`, not at its start, followed by two letters.
+pub fn is_url(bytes: &[u8]) -> bool {
+    let Some(rest) = bytes
+        .strip_prefix(b"https://")
+        .or_else(|| bytes.strip_prefix(b"http://"))
+    else {
+        return false;
+    };
+    let host_len = rest.iter().take_while(|&&b| is_host_byte(b)).count();
+    let host = &rest[..host_len];
+    // Letters are host bytes, the two letters after the dot are part of the host
+    host.windows(3)
+        .skip(1)
+        .any(|w| w[0] == b'.' && w[1].is_ascii_alphabetic() && w[2].is_ascii_alphabetic())
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_is_email() {
+        assert!(is_email(b"test@example.com"));
+        assert!(is_email(b"first.last+tag@sub.example.co"));
+        assert!(is_email(b"a_b%c@x-y.z.io"));
+        assert!(is_email(b"a@b.cd"));
+        assert!(is_email(b"a@..cd"));
+        assert!(!is_email(b"test.example.com"));
+        assert!(!is_email(b"@example.com"));
+        assert!(!is_email(b"test@.com"));
+        assert!(!is_email(b"test@example.c"));
+        assert!(!is_email(b"test@example.c0m"));
+        assert!(!is_email(b"test@example"));
+        assert!(!is_email(b"test@exa_mple.com"));
+        assert!(!is_email(b"te st@example.com"));
+        assert!(!is_email(b"test@example@example.com"));
+        assert!(!is_email("t\u{e9}st@example.com".as_bytes()));
+        assert!(!is_email(b""));
+    }
+
+    #[test]
+    fn test_is_url() {
+        assert!(is_url(b"http://example.com"));
+        assert!(is_url(b"https://sub.example.org/path?q=1"));
+        assert!(is_url(b"https://a.bc"));
+        assert!(is_url(b"https://example.com:8080"));
+        assert!(is_url(b"http://1.2.3.ab"));
+        assert!(!is_url(b"ftp://example.com"));
+        assert!(!is_url(b"https://.com"));
+        assert!(!is_url(b"https://example"));
+        assert!(!is_url(b"https://example.c"));
+        assert!(!is_url(b"https://example.c0m"));
+        assert!(!is_url(b"https://exa_mple.com"));
+        assert!(!is_url(b"HTTPS://example.com"));
+        assert!(!is_url(b"https:/example.com"));
+        assert!(!is_url(b""));
+    }
+}
@@ -1,3 +1,6 @@
+pub mod bitmask;
 pub mod date_parser;
+pub mod formats;
 pub mod hasher;
 pub mod operator;
+pub mod swar;
@@ -0,0 +1,348 @@
+//! SWAR (SIMD within a register) helpers working on 8 bytes at a time.
+
+const ZEROS: u64 = 0x3030_3030_3030_3030;
+const HIGH_NIBBLES: u64 = 0xF0F0_F0F0_F0F0_F0F0;
+const ADD_SIX: u64 = 0x0606_0606_0606_0606;
+const HIGH_BITS: u64 = 0x8080_8080_8080_8080;
+const LOWER_CASE_BIT: u64 = 0x2020_2020_2020_2020;
+
+/// Longest digit run parsed without overflow checks: 10^18 - 1 fits in an `i64`.
+const MAX_FAST_DIGITS: usize = 18;
+
+/// Returns `true` when all 8 bytes of `word` are ASCII digits.
+#[inline]
+fn is_eight_digits(word: u64) -> bool {
+    // '0'..='9' is 0x30..=0x39: the high nibble is 3, and adding 6 must not carry into it
+    (word & HIGH_NIBBLES) == ZEROS && (word.wrapping_add(ADD_SIX) & HIGH_NIBBLES) == ZEROS
+}
+
+/// Converts 8 ASCII digits, loaded little-endian, to their value.
+#[inline]
+fn parse_eight_digits(word: u64) -> u64 {
+    const MASK: u64 = 0x0000_00FF_0000_00FF;
+    const MUL1: u64 = 100 + (1_000_000 << 32);
+    const MUL2: u64 = 1 + (10_000 << 32);
+    let mut word = word - ZEROS;
+    word = word.wrapping_mul(10) + (word >> 8);
+    (word & MASK)
+        .wrapping_mul(MUL1)
+        .wrapping_add(((word >> 16) & MASK).wrapping_mul(MUL2))
+        >> 32
+}
+
+/// Parses a decimal `i64` with an optional `+`/`-` sign.
+///
+/// Up to 18 digits are validated and converted 8 at a time without branching per
+/// byte. Longer inputs go through `str::parse`, which also handles overflow.
+pub fn parse_i64(bytes: &[u8]) -> Option<i64> {
+    let (negative, digits) = match bytes.first() {
+        Some(b'-') => (true, &bytes[1..]),
+        Some(b'+') => (false, &bytes[1..]),
+        _ => (false, bytes),
+    };
+    if digits.is_empty() {
+        return None;
+    }
+    if digits.len() > MAX_FAST_DIGITS {
+        return std::str::from_utf8(bytes).ok()?.parse().ok();
+    }
+
+    let mut value: u64 = 0;
+    let mut chunks = digits.chunks_exact(8);
+    for chunk in &mut chunks {
+        // Safety of the unwrap: chunks_exact yields 8-byte slices
+        let word = u64::from_le_bytes(chunk.try_into().unwrap());
+        if !is_eight_digits(word) {
+            return None;
+        }
+        value = value * 100_000_000 + parse_eight_digits(word);
+    }
+    for &b in chunks.remainder() {
+        let digit = b.wrapping_sub(b'0');
+        if digit > 9 {
+            return None;
+        }
+        value = value * 10 + digit as u64;
+    }
+
+    let value = value as i64;
+    Some(if negative { -value } else { value })
+}
+
+/// Repeats `byte` in the 8 bytes of a word.
+#[inline]
+const fn splat(byte: u8) -> u64 {
+    byte as u64 * 0x0101_0101_0101_0101
+}
+
+/// Sets the high bit of every byte of `word` within `lo..=hi`, all bytes must be ASCII.
+#[inline]
+fn in_range(word: u64, lo: u8, hi: u8) -> u64 {
+    // An ASCII byte plus at most 0x80 stays below 0x100, no carry reaches the next byte.
+    // Other bytes may carry, the callers reject such words on their high bits anyway.
+    let at_least_lo = word.wrapping_add(splat(0x80 - lo));
+    let above_hi = word.wrapping_add(splat(0x7F - hi));
+    at_least_lo & !above_hi & HIGH_BITS
+}
+
+/// Sets the high bit of every digit, ASCII whitespace or `-` byte of an ASCII `word`.
+#[inline]
+fn separators(word: u64) -> u64 {
+    in_range(word, b'0', b'9')
+        | in_range(word, b'\t', b'\r')
+        | in_range(word, b' ', b' ')
+        | in_range(word, b'-', b'-')
+}
+
+/// ASCII character classes checked 8 bytes at a time.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum AsciiClass {
+    /// `0-9`
+    Digit,
+    /// `a-z` and `A-Z`
+    Alpha,
+    /// `a-z`, `A-Z` and `0-9`
+    Alphanumeric,
+    /// `a-z`, `0-9`, ASCII whitespace and `-`
+    LowerCase,
+    /// `A-Z`, `0-9`, ASCII whitespace and `-`
+    UpperCase,
+    /// `0-9`, `a-f` and `A-F`
+    HexDigit,
+}
+
+impl AsciiClass {
+    /// Sets the high bit of every byte of an ASCII `word` within the class.
+    #[inline]
+    fn word_mask(self, word: u64) -> u64 {
+        // Setting the 0x20 bit folds 'A'..='Z' onto 'a'..='z', and no other byte onto them
+        match self {
+            AsciiClass::Digit => in_range(word, b'0', b'9'),
+            AsciiClass::Alpha => in_range(word | LOWER_CASE_BIT, b'a', b'z'),
+            AsciiClass::Alphanumeric => {
+                in_range(word, b'0', b'9') | in_range(word | LOWER_CASE_BIT, b'a', b'z')
+            }
+            AsciiClass::LowerCase => in_range(word, b'a', b'z') | separators(word),
+            AsciiClass::UpperCase => in_range(word, b'A', b'Z') | separators(word),
+            AsciiClass::HexDigit => {
+                in_range(word, b'0', b'9') | in_range(word | LOWER_CASE_BIT, b'a', b'f')
+            }
+        }
+    }
+
+    #[cfg(test)]
+    fn contains(self, byte: u8) -> bool {
+        match self {
+            AsciiClass::Digit => byte.is_ascii_digit(),
+            AsciiClass::Alpha => byte.is_ascii_alphabetic(),
+            AsciiClass::Alphanumeric => byte.is_ascii_alphanumeric(),
+            AsciiClass::LowerCase => {
+                matches!(byte, b'a'..=b'z' | b'0'..=b'9' | b'\t'..=b'\r' | b' ' | b'-')
+            }
+            AsciiClass::UpperCase => {
+                matches!(byte, b'A'..=b'Z' | b'0'..=b'9' | b'\t'..=b'\r' | b' ' | b'-')
+            }
+            AsciiClass::HexDigit => byte.is_ascii_hexdigit(),
+        }
+    }
+
+    /// A byte of the class, padding the last word of a value.
+    #[inline]
+    fn filler(self) -> u8 {
+        match self {
+            AsciiClass::Alpha => b'a',
+            _ => b'0',
+        }
+    }
+
+    /// Sets the high bit of every byte of `word` outside the class.
+    #[inline]
+    fn outside(self, word: u64) -> u64 {
+        (word | !self.word_mask(word)) & HIGH_BITS
+    }
+
+    /// Returns `true` when `bytes` is not empty and every byte belongs to the class.
+    ///
+    /// The bytes outside the class are OR-ed together over all words, the last one
+    /// padded with a byte of the class, and tested once at the end: there is no
+    /// branch per byte or per word for mixed-case or mixed-class values to mispredict.
+    pub fn matches_all(self, bytes: &[u8]) -> bool {
+        if bytes.is_empty() {
+            return false;
+        }
+        let mut chunks = bytes.chunks_exact(8);
+        let mut outside = 0;
+        for chunk in &mut chunks {
+            // Safety of the unwrap: chunks_exact yields 8-byte slices
+            outside |= self.outside(u64::from_le_bytes(chunk.try_into().unwrap()));
+        }
+        let remainder = chunks.remainder();
+        let mut last = [self.filler(); 8];
+        last[..remainder.len()].copy_from_slice(remainder);
+        outside |= self.outside(u64::from_le_bytes(last));
+        outside == 0
+    }
+}
+
+/// Positions of the dashes in a `8-4-4-4-12` UUID.
+const UUID_DASHES: [usize; 4] = [8, 13, 18, 23];
+
+/// Returns `true` when `bytes` is a hyphenated UUID, 32 hex digits in `8-4-4-4-12` groups.
+///
+/// Past the length, there is no branch: the four dashes are compared as a single
+/// `u32`, and the value is copied in a 40-byte block with hex digits over the dashes
+/// and the padding, which is checked 8 bytes at a time.
+pub fn is_uuid(bytes: &[u8]) -> bool {
+    let Ok(uuid) = <&[u8; 36]>::try_from(bytes) else {
+        return false;
+    };
+    let dashes = u32::from_le_bytes(UUID_DASHES.map(|i| uuid[i]));
+    let mut block = [b'0'; 40];
+    block[..36].copy_from_slice(uuid);
+    for i in UUID_DASHES {
+        block[i] = b'0';
+    }
+    (dashes == u32::from_le_bytes(*b"----")) & AsciiClass::HexDigit.matches_all(&block)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_is_eight_digits() {
+        assert!(is_eight_digits(u64::from_le_bytes(*b"01234567")));
+        assert!(is_eight_digits(u64::from_le_bytes(*b"99999999")));
+        assert!(!is_eight_digits(u64::from_le_bytes(*b"0123456a")));
+        assert!(!is_eight_digits(u64::from_le_bytes(*b"0123 567")));
+        assert!(!is_eight_digits(u64::from_le_bytes(*b"/1234567")));
+        assert!(!is_eight_digits(u64::from_le_bytes(*b"1234567:")));
+    }
+
+    #[test]
+    fn test_parse_eight_digits() {
+        assert_eq!(
+            parse_eight_digits(u64::from_le_bytes(*b"12345678")),
+            12_345_678
+        );
+        assert_eq!(parse_eight_digits(u64::from_le_bytes(*b"00000001")), 1);
+        assert_eq!(
+            parse_eight_digits(u64::from_le_bytes(*b"99999999")),
+            99_999_999
+        );
+    }
+
+    #[test]
+    fn test_parse_i64_valid() {
+        assert_eq!(parse_i64(b"0"), Some(0));
+        assert_eq!(parse_i64(b"42"), Some(42));
+        assert_eq!(parse_i64(b"+42"), Some(42));
+        assert_eq!(parse_i64(b"-42"), Some(-42));
+        assert_eq!(parse_i64(b"0012345678"), Some(12_345_678));
+        assert_eq!(
+            parse_i64(b"123456789012345678"),
+            Some(123_456_789_012_345_678)
+        );
+        assert_eq!(parse_i64(b"9223372036854775807"), Some(i64::MAX));
+        assert_eq!(parse_i64(b"-9223372036854775808"), Some(i64::MIN));
+    }
+
+    #[test]
+    fn test_parse_i64_invalid() {
+        assert_eq!(parse_i64(b""), None);
+        assert_eq!(parse_i64(b"-"), None);
+        assert_eq!(parse_i64(b"+-1"), None);
+        assert_eq!(parse_i64(b"12a"), None);
+        assert_eq!(parse_i64(b"1234567a9"), None);
+        assert_eq!(parse_i64(b" 12"), None);
+        assert_eq!(parse_i64(b"1.5"), None);
+        assert_eq!(parse_i64(b"9223372036854775808"), None);
+    }
+
+    #[test]
+    fn test_ascii_class_word_mask() {
+        let word = u64::from_le_bytes(*b"09/:aAzZ");
+        assert_eq!(AsciiClass::Digit.word_mask(word), 0x0000_0000_0000_8080);
+        assert_eq!(AsciiClass::Alpha.word_mask(word), 0x8080_8080_0000_0000);
+        let word = u64::from_le_bytes(*b"@[`{0a9Z");
+        assert_eq!(AsciiClass::Alpha.word_mask(word), 0x8000_8000_0000_0000);
+        assert_eq!(
+            AsciiClass::Alphanumeric.word_mask(word),
+            0x8080_8080_0000_0000
+        );
+    }
+
+    #[test]
+    fn test_ascii_class_matches_all() {
+        assert!(AsciiClass::Digit.matches_all(b"4006381333931"));
+        assert!(AsciiClass::Digit.matches_all(b"7"));
+        assert!(!AsciiClass::Digit.matches_all(b""));
+        assert!(!AsciiClass::Digit.matches_all(b"400638133393a"));
+        assert!(!AsciiClass::Digit.matches_all(b"4006381a33931"));
+        assert!(!AsciiClass::Digit.matches_all("1234567\u{663}".as_bytes()));
+        assert!(AsciiClass::Alpha.matches_all(b"HelloWorld"));
+        assert!(!AsciiClass::Alpha.matches_all(b"Hello World"));
+        assert!(!AsciiClass::Alpha.matches_all("Caf\u{e9}Caf\u{e9}".as_bytes()));
+        assert!(AsciiClass::Alphanumeric.matches_all(b"XYZ123abc"));
+        assert!(!AsciiClass::Alphanumeric.matches_all(b"XYZ123ab-"));
+        assert!(AsciiClass::LowerCase.matches_all(b"hello world-42\tok"));
+        assert!(!AsciiClass::LowerCase.matches_all(b"hello World"));
+        assert!(!AsciiClass::LowerCase.matches_all(b"hello_world"));
+        assert!(AsciiClass::UpperCase.matches_all(b"HELLO WORLD-42"));
+        assert!(!AsciiClass::UpperCase.matches_all(b"HELLO WORLd"));
+    }
+
+    #[test]
+    fn test_ascii_class_matches_all_bytes() {
+        for byte in 0..=u8::MAX {
+            let word = [byte; 8];
+            for class in [
+                AsciiClass::Digit,
+                AsciiClass::Alpha,
+                AsciiClass::Alphanumeric,
+                AsciiClass::LowerCase,
+                AsciiClass::UpperCase,
+                AsciiClass::HexDigit,
+            ] {
+                assert_eq!(class.matches_all(&word), class.contains(byte), "{byte}");
+            }
+        }
+    }
+
+    #[test]
+    fn test_is_uuid() {
+        assert!(is_uuid(b"123e4567-e89b-12d3-a456-426614174000"));
+        assert!(is_uuid(b"123E4567-E89B-12D3-A456-426614174000"));
+        assert!(!is_uuid(b"123e4567-e89b-12d3-a456-42661417400"));
+        assert!(!is_uuid(b"123e4567-e89b-12d3-a456-4266141740000"));
+        assert!(!is_uuid(b"123e4567e89b-12d3-a456-4266141740000"));
+        assert!(!is_uuid(b"123e4567-e89b-12d3-a456-42661417400g"));
+        assert!(!is_uuid(b"123e4567-e89b-12d3-a456_426614174000"));
+        assert!(!is_uuid(b"123e4567-e89b-12d3-a456-4266141740-0"));
+        assert!(!is_uuid(b""));
+    }
+
+    #[test]
+    fn test_ascii_class_matches_all_tail() {
+        for class in [
+            AsciiClass::Digit,
+            AsciiClass::Alpha,
+            AsciiClass::Alphanumeric,
+            AsciiClass::LowerCase,
+            AsciiClass::UpperCase,
+            AsciiClass::HexDigit,
+        ] {
+            let member = class.filler();
+            for len in 1..20 {
+                for bad in 0..len {
+                    let mut value = vec![member; len];
+                    assert!(class.matches_all(&value));
+                    value[bad] = b'~';
+                    assert!(!class.matches_all(&value), "{class:?} {len} {bad}");
+                    value[bad] = 0xC3;
+                    assert!(!class.matches_all(&value), "{class:?} {len} {bad}");
+                }
+            }
+        }
+    }
+}
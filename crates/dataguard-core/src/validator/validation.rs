@@ -13,6 +13,7 @@ use crate::rules::string::StringRule;
 use crate::rules::NullCheck;
 use crate::{Table, ValidationResult};
 use arrow::datatypes::{Float64Type, Int64Type};
+use rayon::prelude::*;
 use std::collections::HashMap;
 
 /// Compiled, executable validation rules for a column.
@@ -109,6 +110,23 @@ impl ExecutableColumn {
             ExecutableColumn::Date { unicity_check, .. } => unicity_check.is_some(),
         }
     }
+
+    /// Check if this column has rules comparing neighbouring rows.
+    ///
+    /// Used by the validation engine to determine which columns need their batch
+    /// boundaries checked once all batches are validated.
+    pub fn has_sequential_rules(&self) -> bool {
+        match self {
+            ExecutableColumn::Integer { domain_rules, .. } => {
+                domain_rules.iter().any(|rule| rule.is_sequential())
+            }
+            ExecutableColumn::Float { domain_rules, .. } => {
+                domain_rules.iter().any(|rule| rule.is_sequential())
+            }
+            _ => false,
+        }
+    }
+
     /// Get the unicity threshold if this column has a uniqueness constraint.
     ///
     /// Returns the configured threshold, or 0.0 as default if no unicity check exists.
@@ -189,6 +207,14 @@ impl Validator {
         let _ = self.tables.insert(name, table);
     }
 
+    /// Remove every table, keeping the validator for reuse.
+    ///
+    /// The table map keeps its allocation, so a long lived validator can be
+    /// refilled without being rebuilt.
+    pub fn reset(&mut self) {
+        self.tables.clear();
+    }
+
     /// Validate a specific table by name.
     ///
     /// # Arguments
@@ -210,20 +236,20 @@ impl Validator {
 
     /// Validate all tables in the validator.
     ///
-    /// Validates each table sequentially and collects results.
-    /// If any table fails to validate, the error is propagated immediately
-    /// and remaining tables are not validated.
+    /// Tables are validated in parallel, each on its own rayon task.
+    /// Every table is validated even if another one fails, the first
+    /// error found is then returned.
     ///
     /// # Returns
     ///
     /// * `Ok(Vec<ValidationResult>)` - All tables validated
     /// * `Err(RuleError)` - First error encountered
     pub fn validate_all(&mut self) -> Result<Vec<ValidationResult>, RuleError> {
-        let mut results = Vec::new();
-        for (_name, table) in self.tables.iter_mut() {
-            let result = table.validate()?;
-            results.push(result);
-        }
-        Ok(results)
+        self.tables
+            .par_iter_mut()
+            .map(|(_name, table)| table.validate())
+            .collect::<Vec<_>>()
+            .into_iter()
+            .collect()
     }
 }
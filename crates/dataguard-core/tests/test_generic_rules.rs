@@ -1,4 +1,4 @@
-use arrow::array::{Array, StringArray};
+use arrow::array::{Array, Int64Array, StringArray};
 use arrow::datatypes::DataType;
 use dataguard_core::rules::generic::{TypeCheck, UnicityCheck};
 
@@ -34,6 +34,26 @@ fn test_type_check_mixed_type() {
     assert_eq!(errors, 1);
 }
 
+#[test]
+fn test_type_check_int64_from_strings() {
+    let rule = TypeCheck::new("col".to_string(), DataType::Int64, 0.0);
+    let array = StringArray::from(vec![
+        Some("42"),
+        Some("-7"),
+        Some("+3"),
+        Some("123456789012"),
+        Some("12a"),                 // error
+        Some("9223372036854775808"), // error, overflows i64
+        None,
+    ]);
+    let array_ref: &dyn Array = &array;
+    let (errors, casted) = rule.validate(array_ref).unwrap();
+    assert_eq!(errors, 2);
+    let casted = casted.as_any().downcast_ref::<Int64Array>().unwrap();
+    assert_eq!(casted.value(1), -7);
+    assert_eq!(casted.value(3), 123456789012);
+}
+
 #[test]
 fn test_unicity_check_all_unique() {
     let rule = UnicityCheck::new(0.0);
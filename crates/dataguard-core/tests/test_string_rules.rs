@@ -35,7 +35,8 @@ fn test_regex_match_email() {
         0.0,
         r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$".to_string(),
         None,
-    );
+    )
+    .unwrap();
     let array = StringArray::from(vec![
         Some("test@example.com"),
         Some("invalid-email"),
@@ -54,7 +55,8 @@ fn test_regex_match_case_insensitive() {
         0.0,
         "^HELLO$".to_string(),
         Some("i".to_string()),
-    );
+    )
+    .unwrap();
     let array = StringArray::from(vec![
         Some("hello"),
         Some("HELLO"),
@@ -130,7 +132,8 @@ fn test_regex_match_url_pattern() {
         0.0,
         r"^https?://[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}".to_string(),
         None,
-    );
+    )
+    .unwrap();
     let array = StringArray::from(vec![
         Some("https://example.com"),
         Some("http://test.org"),
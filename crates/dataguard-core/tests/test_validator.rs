@@ -29,6 +29,18 @@ fn test_validator_add_multiple_tables() {
     // HashMap should contain all three tables
 }
 
+#[test]
+fn test_validator_reset_removes_tables() {
+    let mut validator = Validator::new();
+    let table = CsvTable::new("path/to/users.csv".to_string(), "stdout".to_string()).unwrap();
+    validator.add_table("users".to_string(), Box::new(table));
+
+    validator.reset();
+
+    let result = validator.validate_table("users".to_string());
+    assert!(result.is_err());
+}
+
 #[test]
 fn test_validator_validate_nonexistent_table() {
     let mut validator = Validator::new();
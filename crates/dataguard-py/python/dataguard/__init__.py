@@ -26,6 +26,7 @@ from .dataguard import (
     # Table types
     CsvTable,
     ParquetTable,
+    validate_many,
     # Column builder functions
     string_column,
     integer_column,
@@ -45,6 +46,7 @@ __all__ = [
     # Tables
     "CsvTable",
     "ParquetTable",
+    "validate_many",
     # Column builder functions
     "string_column",
     "integer_column",
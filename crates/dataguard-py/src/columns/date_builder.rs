@@ -6,7 +6,7 @@ use pyo3::prelude::*;
 /// Python wrapper for DateColumnBuilder from dataguard-core.
 ///
 /// A builder for defining validation rules on date columns.
-#[pyclass(name = "DateColumnBuilder")]
+#[pyclass(name = "DateColumnBuilder", freelist = 64)]
 #[derive(Clone)]
 pub struct DateColumnBuilder {
     inner: CoreDateColumnBuilder,
@@ -30,9 +30,9 @@ impl DateColumnBuilder {
     ///
     /// Returns:
     ///     DateColumnBuilder: Self for method chaining.
-    pub fn with_type_threshold(&mut self, threshold: f64) -> Self {
-        self.inner = self.inner.clone().with_type_threshold(threshold);
-        self.clone()
+    pub fn with_type_threshold(mut slf: PyRefMut<'_, Self>, threshold: f64) -> PyRefMut<'_, Self> {
+        slf.inner = slf.inner.clone().with_type_threshold(threshold);
+        slf
     }
 
     /// Get the date format string.
@@ -51,9 +51,9 @@ impl DateColumnBuilder {
     /// Returns:
     ///     DateColumnBuilder: Self for method chaining.
     #[pyo3(signature = (threshold=0.0))]
-    pub fn is_not_null(&mut self, threshold: f64) -> Self {
-        self.inner.is_not_null(threshold);
-        self.clone()
+    pub fn is_not_null(mut slf: PyRefMut<'_, Self>, threshold: f64) -> PyRefMut<'_, Self> {
+        slf.inner.is_not_null(threshold);
+        slf
     }
 
     /// Add uniqueness constraint.
@@ -64,9 +64,9 @@ impl DateColumnBuilder {
     /// Returns:
     ///     DateColumnBuilder: Self for method chaining.
     #[pyo3(signature = (threshold=0.0))]
-    pub fn is_unique(&mut self, threshold: f64) -> Self {
-        self.inner.is_unique(threshold);
-        self.clone()
+    pub fn is_unique(mut slf: PyRefMut<'_, Self>, threshold: f64) -> PyRefMut<'_, Self> {
+        slf.inner.is_unique(threshold);
+        slf
     }
 
     /// Set a limit - the date should be before the given date.
@@ -81,14 +81,14 @@ impl DateColumnBuilder {
     ///     DateColumnBuilder: Self for method chaining.
     #[pyo3(signature = (year, month=None, day=None, threshold=0.0))]
     pub fn is_before(
-        &mut self,
+        mut slf: PyRefMut<'_, Self>,
         year: usize,
         month: Option<usize>,
         day: Option<usize>,
         threshold: f64,
-    ) -> Self {
-        self.inner.is_before(year, month, day, threshold);
-        self.clone()
+    ) -> PyRefMut<'_, Self> {
+        slf.inner.is_before(year, month, day, threshold);
+        slf
     }
 
     /// Set a limit - the date should be after the given date.
@@ -103,14 +103,14 @@ impl DateColumnBuilder {
     ///     DateColumnBuilder: Self for method chaining.
     #[pyo3(signature = (year, month=None, day=None, threshold=0.0))]
     pub fn is_after(
-        &mut self,
+        mut slf: PyRefMut<'_, Self>,
         year: usize,
         month: Option<usize>,
         day: Option<usize>,
         threshold: f64,
-    ) -> Self {
-        self.inner.is_after(year, month, day, threshold);
-        self.clone()
+    ) -> PyRefMut<'_, Self> {
+        slf.inner.is_after(year, month, day, threshold);
+        slf
     }
 
     /// Check that all dates are not in the future (before today).
@@ -121,9 +121,9 @@ impl DateColumnBuilder {
     /// Returns:
     ///     DateColumnBuilder: Self for method chaining.
     #[pyo3(signature = (threshold=0.0))]
-    pub fn is_not_futur(&mut self, threshold: f64) -> Self {
-        self.inner.is_not_futur(threshold);
-        self.clone()
+    pub fn is_not_futur(mut slf: PyRefMut<'_, Self>, threshold: f64) -> PyRefMut<'_, Self> {
+        slf.inner.is_not_futur(threshold);
+        slf
     }
 
     /// Check that all dates are not in the past (after today).
@@ -134,9 +134,9 @@ impl DateColumnBuilder {
     /// Returns:
     ///     DateColumnBuilder: Self for method chaining.
     #[pyo3(signature = (threshold=0.0))]
-    pub fn is_not_past(&mut self, threshold: f64) -> Self {
-        self.inner.is_not_past(threshold);
-        self.clone()
+    pub fn is_not_past(mut slf: PyRefMut<'_, Self>, threshold: f64) -> PyRefMut<'_, Self> {
+        slf.inner.is_not_past(threshold);
+        slf
     }
 
     /// Check that dates fall on weekdays (Monday-Friday).
@@ -147,9 +147,9 @@ impl DateColumnBuilder {
     /// Returns:
     ///     DateColumnBuilder: Self for method chaining.
     #[pyo3(signature = (threshold=0.0))]
-    pub fn is_weekday(&mut self, threshold: f64) -> Self {
-        self.inner.is_weekday(threshold);
-        self.clone()
+    pub fn is_weekday(mut slf: PyRefMut<'_, Self>, threshold: f64) -> PyRefMut<'_, Self> {
+        slf.inner.is_weekday(threshold);
+        slf
     }
 
     /// Check that dates fall on weekends (Saturday-Sunday).
@@ -160,9 +160,9 @@ impl DateColumnBuilder {
     /// Returns:
     ///     DateColumnBuilder: Self for method chaining.
     #[pyo3(signature = (threshold=0.0))]
-    pub fn is_weekend(&mut self, threshold: f64) -> Self {
-        self.inner.is_weekend(threshold);
-        self.clone()
+    pub fn is_weekend(mut slf: PyRefMut<'_, Self>, threshold: f64) -> PyRefMut<'_, Self> {
+        slf.inner.is_weekend(threshold);
+        slf
     }
 }
 
@@ -4,7 +4,7 @@ use pyo3::prelude::*;
 /// Python wrapper for FloatColumnBuilder from dataguard-core.
 ///
 /// A builder for defining validation rules on float (f64) columns.
-#[pyclass(name = "FloatColumnBuilder")]
+#[pyclass(name = "FloatColumnBuilder", freelist = 64)]
 #[derive(Clone)]
 pub struct FloatColumnBuilder {
     inner: CoreNumericColumnBuilder<f64>,
@@ -28,9 +28,9 @@ impl FloatColumnBuilder {
     ///
     /// Returns:
     ///     FloatColumnBuilder: Self for method chaining.
-    pub fn with_type_threshold(&mut self, threshold: f64) -> Self {
-        self.inner = self.inner.clone().with_type_threshold(threshold);
-        self.clone()
+    pub fn with_type_threshold(mut slf: PyRefMut<'_, Self>, threshold: f64) -> PyRefMut<'_, Self> {
+        slf.inner = slf.inner.clone().with_type_threshold(threshold);
+        slf
     }
 
     /// Add a not-null constraint.
@@ -41,9 +41,9 @@ impl FloatColumnBuilder {
     /// Returns:
     ///     FloatColumnBuilder: Self for method chaining.
     #[pyo3(signature = (threshold=0.0))]
-    pub fn is_not_null(&mut self, threshold: f64) -> Self {
-        self.inner.is_not_null(threshold);
-        self.clone()
+    pub fn is_not_null(mut slf: PyRefMut<'_, Self>, threshold: f64) -> PyRefMut<'_, Self> {
+        slf.inner.is_not_null(threshold);
+        slf
     }
 
     /// Add uniqueness constraint.
@@ -54,9 +54,9 @@ impl FloatColumnBuilder {
     /// Returns:
     ///     FloatColumnBuilder: Self for method chaining.
     #[pyo3(signature = (threshold=0.0))]
-    pub fn is_unique(&mut self, threshold: f64) -> Self {
-        self.inner.is_unique(threshold);
-        self.clone()
+    pub fn is_unique(mut slf: PyRefMut<'_, Self>, threshold: f64) -> PyRefMut<'_, Self> {
+        slf.inner.is_unique(threshold);
+        slf
     }
 
     /// Set numeric range (both min and max).
@@ -69,9 +69,14 @@ impl FloatColumnBuilder {
     /// Returns:
     ///     FloatColumnBuilder: Self for method chaining.
     #[pyo3(signature = (min, max, threshold=0.0))]
-    pub fn between(&mut self, min: f64, max: f64, threshold: f64) -> Self {
-        self.inner.between(min, max, threshold);
-        self.clone()
+    pub fn between(
+        mut slf: PyRefMut<'_, Self>,
+        min: f64,
+        max: f64,
+        threshold: f64,
+    ) -> PyRefMut<'_, Self> {
+        slf.inner.between(min, max, threshold);
+        slf
     }
 
     /// Set minimum value.
@@ -83,9 +88,9 @@ impl FloatColumnBuilder {
     /// Returns:
     ///     FloatColumnBuilder: Self for method chaining.
     #[pyo3(signature = (min, threshold=0.0))]
-    pub fn min(&mut self, min: f64, threshold: f64) -> Self {
-        self.inner.min(min, threshold);
-        self.clone()
+    pub fn min(mut slf: PyRefMut<'_, Self>, min: f64, threshold: f64) -> PyRefMut<'_, Self> {
+        slf.inner.min(min, threshold);
+        slf
     }
 
     /// Set maximum value.
@@ -97,9 +102,9 @@ impl FloatColumnBuilder {
     /// Returns:
     ///     FloatColumnBuilder: Self for method chaining.
     #[pyo3(signature = (max, threshold=0.0))]
-    pub fn max(&mut self, max: f64, threshold: f64) -> Self {
-        self.inner.max(max, threshold);
-        self.clone()
+    pub fn max(mut slf: PyRefMut<'_, Self>, max: f64, threshold: f64) -> PyRefMut<'_, Self> {
+        slf.inner.max(max, threshold);
+        slf
     }
 
     /// Check if values are positive (> 0).
@@ -110,9 +115,9 @@ impl FloatColumnBuilder {
     /// Returns:
     ///     FloatColumnBuilder: Self for method chaining.
     #[pyo3(signature = (threshold=0.0))]
-    pub fn is_positive(&mut self, threshold: f64) -> Self {
-        self.inner.is_positive(threshold);
-        self.clone()
+    pub fn is_positive(mut slf: PyRefMut<'_, Self>, threshold: f64) -> PyRefMut<'_, Self> {
+        slf.inner.is_positive(threshold);
+        slf
     }
 
     /// Check if values are negative (< 0).
@@ -123,9 +128,9 @@ impl FloatColumnBuilder {
     /// Returns:
     ///     FloatColumnBuilder: Self for method chaining.
     #[pyo3(signature = (threshold=0.0))]
-    pub fn is_negative(&mut self, threshold: f64) -> Self {
-        self.inner.is_negative(threshold);
-        self.clone()
+    pub fn is_negative(mut slf: PyRefMut<'_, Self>, threshold: f64) -> PyRefMut<'_, Self> {
+        slf.inner.is_negative(threshold);
+        slf
     }
 
     /// Check if values are non-negative (>= 0).
@@ -136,9 +141,9 @@ impl FloatColumnBuilder {
     /// Returns:
     ///     FloatColumnBuilder: Self for method chaining.
     #[pyo3(signature = (threshold=0.0))]
-    pub fn is_non_negative(&mut self, threshold: f64) -> Self {
-        self.inner.is_non_negative(threshold);
-        self.clone()
+    pub fn is_non_negative(mut slf: PyRefMut<'_, Self>, threshold: f64) -> PyRefMut<'_, Self> {
+        slf.inner.is_non_negative(threshold);
+        slf
     }
 
     /// Check if values are non-positive (<= 0).
@@ -149,9 +154,9 @@ impl FloatColumnBuilder {
     /// Returns:
     ///     FloatColumnBuilder: Self for method chaining.
     #[pyo3(signature = (threshold=0.0))]
-    pub fn is_non_positive(&mut self, threshold: f64) -> Self {
-        self.inner.is_non_positive(threshold);
-        self.clone()
+    pub fn is_non_positive(mut slf: PyRefMut<'_, Self>, threshold: f64) -> PyRefMut<'_, Self> {
+        slf.inner.is_non_positive(threshold);
+        slf
     }
 
     /// Check if values are monotonically increasing.
@@ -162,9 +167,12 @@ impl FloatColumnBuilder {
     /// Returns:
     ///     FloatColumnBuilder: Self for method chaining.
     #[pyo3(signature = (threshold=0.0))]
-    pub fn is_monotonically_increasing(&mut self, threshold: f64) -> Self {
-        self.inner.is_monotonically_increasing(threshold);
-        self.clone()
+    pub fn is_monotonically_increasing(
+        mut slf: PyRefMut<'_, Self>,
+        threshold: f64,
+    ) -> PyRefMut<'_, Self> {
+        slf.inner.is_monotonically_increasing(threshold);
+        slf
     }
 
     /// Check if values are monotonically decreasing.
@@ -175,9 +183,12 @@ impl FloatColumnBuilder {
     /// Returns:
     ///     FloatColumnBuilder: Self for method chaining.
     #[pyo3(signature = (threshold=0.0))]
-    pub fn is_monotonically_decreasing(&mut self, threshold: f64) -> Self {
-        self.inner.is_monotonically_decreasing(threshold);
-        self.clone()
+    pub fn is_monotonically_decreasing(
+        mut slf: PyRefMut<'_, Self>,
+        threshold: f64,
+    ) -> PyRefMut<'_, Self> {
+        slf.inner.is_monotonically_decreasing(threshold);
+        slf
     }
 
     /// Check if values are within N standard deviations from the mean.
@@ -189,9 +200,13 @@ impl FloatColumnBuilder {
     /// Returns:
     ///     FloatColumnBuilder: Self for method chaining.
     #[pyo3(signature = (max_std_dev, threshold=0.0))]
-    pub fn std_dev_check(&mut self, max_std_dev: f64, threshold: f64) -> Self {
-        self.inner.std_dev_check(threshold, max_std_dev);
-        self.clone()
+    pub fn std_dev_check(
+        mut slf: PyRefMut<'_, Self>,
+        max_std_dev: f64,
+        threshold: f64,
+    ) -> PyRefMut<'_, Self> {
+        slf.inner.std_dev_check(threshold, max_std_dev);
+        slf
     }
 
     /// Check if values deviate from mean by more than a percentage.
@@ -203,9 +218,13 @@ impl FloatColumnBuilder {
     /// Returns:
     ///     FloatColumnBuilder: Self for method chaining.
     #[pyo3(signature = (max_variance_percent, threshold=0.0))]
-    pub fn mean_variance(&mut self, max_variance_percent: f64, threshold: f64) -> Self {
-        self.inner.mean_variance(threshold, max_variance_percent);
-        self.clone()
+    pub fn mean_variance(
+        mut slf: PyRefMut<'_, Self>,
+        max_variance_percent: f64,
+        threshold: f64,
+    ) -> PyRefMut<'_, Self> {
+        slf.inner.mean_variance(threshold, max_variance_percent);
+        slf
     }
 }
 
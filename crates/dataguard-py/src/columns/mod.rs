@@ -7,3 +7,36 @@ pub use date_builder::{date_column, DateColumnBuilder};
 pub use float_builder::{float_column, FloatColumnBuilder};
 pub use integer_builder::{integer_column, IntegerColumnBuilder};
 pub use string_builder::{string_column, StringColumnBuilder};
+
+use dataguard_core::columns::ColumnBuilder;
+use pyo3::{exceptions::PyIOError, prelude::*};
+
+/// Convert a Python column builder to a core ColumnBuilder trait object.
+///
+/// The builder class is matched with a plain type check, so trying the
+/// classes in turn never builds a Python exception for the misses.
+pub fn core_column_builder(py_col: &Bound<'_, PyAny>) -> PyResult<Box<dyn ColumnBuilder>> {
+    let builder = if py_col.is_instance_of::<StringColumnBuilder>() {
+        py_col
+            .extract::<PyRef<StringColumnBuilder>>()?
+            .to_core_column_builder()
+    } else if py_col.is_instance_of::<IntegerColumnBuilder>() {
+        py_col
+            .extract::<PyRef<IntegerColumnBuilder>>()?
+            .to_core_column_builder()
+    } else if py_col.is_instance_of::<FloatColumnBuilder>() {
+        py_col
+            .extract::<PyRef<FloatColumnBuilder>>()?
+            .to_core_column_builder()
+    } else if py_col.is_instance_of::<DateColumnBuilder>() {
+        py_col
+            .extract::<PyRef<DateColumnBuilder>>()?
+            .to_core_column_builder()
+    } else {
+        return Err(PyIOError::new_err(format!(
+            "Invalid column type: {:?}",
+            py_col
+        )));
+    };
+    builder.map_err(|e| PyIOError::new_err(e.to_string()))
+}
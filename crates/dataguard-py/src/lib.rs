@@ -34,5 +34,8 @@ fn dataguard(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(columns::date_column, m)?)?;
     m.add_function(wrap_pyfunction!(relations::relation, m)?)?;
 
+    // Register table functions
+    m.add_function(wrap_pyfunction!(tables::validate_many, m)?)?;
+
     Ok(())
 }
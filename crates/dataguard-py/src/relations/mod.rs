@@ -7,7 +7,7 @@ use pyo3::prelude::*;
 /// Python wrapper for RelationBuilder from dataguard-core.
 ///
 /// A builder for defining validation rules between two columns.
-#[pyclass(name = "RelationBuilder")]
+#[pyclass(name = "RelationBuilder", freelist = 64)]
 pub struct RelationBuilder {
     inner: CoreRelationBuilder,
 }
@@ -49,19 +49,27 @@ impl RelationBuilder {
     /// Returns:
     ///     RelationBuilder: Self for method chaining.
     #[pyo3(signature = (operator, threshold=0.0))]
-    pub fn date_comparaison(&mut self, operator: &str, threshold: f64) -> PyResult<Self> {
+    pub fn date_comparaison(
+        mut slf: PyRefMut<'_, Self>,
+        operator: &str,
+        threshold: f64,
+    ) -> PyResult<PyRefMut<'_, Self>> {
         let op = CompOperator::try_from(operator)
             .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))?;
-        self.inner.date_comparaison(op, threshold);
-        Ok(self.clone())
+        slf.inner.date_comparaison(op, threshold);
+        Ok(slf)
     }
 
     #[pyo3(signature = (operator, threshold=0.0))]
-    pub fn numeric_comparaison(&mut self, operator: &str, threshold: f64) -> PyResult<Self> {
+    pub fn numeric_comparaison(
+        mut slf: PyRefMut<'_, Self>,
+        operator: &str,
+        threshold: f64,
+    ) -> PyResult<PyRefMut<'_, Self>> {
         let op = CompOperator::try_from(operator)
             .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))?;
-        self.inner.numeric_comparaison(op, threshold);
-        Ok(self.clone())
+        slf.inner.numeric_comparaison(op, threshold);
+        Ok(slf)
     }
 }
 
@@ -1,10 +1,9 @@
 use dataguard_core::{CsvTable as CoreCsvTable, Table as CoreTable};
 use pyo3::{exceptions::PyIOError, prelude::*, types::PyAny};
 
-use crate::columns::{
-    DateColumnBuilder, FloatColumnBuilder, IntegerColumnBuilder, StringColumnBuilder,
-};
+use crate::columns::core_column_builder;
 use crate::relations::RelationBuilder;
+use crate::tables::result_to_dict;
 
 /// Python wrapper for CsvTable from dataguard-core.
 ///
@@ -52,26 +51,7 @@ impl CsvTable {
             let mut core_columns: Vec<Box<dyn dataguard_core::columns::ColumnBuilder>> = Vec::new();
 
             for py_col in columns {
-                let builder: Box<dyn dataguard_core::columns::ColumnBuilder> =
-                    if let Ok(col) = py_col.extract::<StringColumnBuilder>() {
-                        col.to_core_column_builder()
-                            .map_err(|e| PyIOError::new_err(e.to_string()))?
-                    } else if let Ok(col) = py_col.extract::<IntegerColumnBuilder>() {
-                        col.to_core_column_builder()
-                            .map_err(|e| PyIOError::new_err(e.to_string()))?
-                    } else if let Ok(col) = py_col.extract::<FloatColumnBuilder>() {
-                        col.to_core_column_builder()
-                            .map_err(|e| PyIOError::new_err(e.to_string()))?
-                    } else if let Ok(col) = py_col.extract::<DateColumnBuilder>() {
-                        col.to_core_column_builder()
-                            .map_err(|e| PyIOError::new_err(e.to_string()))?
-                    } else {
-                        return Err(PyIOError::new_err(format!(
-                            "Invalid column type: {:?}",
-                            py_col
-                        )));
-                    };
-                core_columns.push(builder);
+                core_columns.push(core_column_builder(&py_col)?);
             }
 
             // Convert Python relation builders to Rust RelationBuilder
@@ -84,9 +64,10 @@ impl CsvTable {
                     })
                     .collect();
 
-            // Call prepare on the core table
-            self.inner
-                .prepare(core_columns, core_relations)
+            // Compiling the rules needs no Python object, other Python threads can
+            // run meanwhile
+            let inner = &mut self.inner;
+            py.detach(|| inner.prepare(core_columns, core_relations))
                 .map_err(|e| PyIOError::new_err(e.to_string()))
         })
     }
@@ -98,19 +79,26 @@ impl CsvTable {
     ///         - 'table_name': Name of the table
     ///         - 'total_rows': Total number of rows processed
     ///         - 'passed': Tuple of (passed_rules, total_rules)
-    pub fn validate(&mut self) -> PyResult<Py<PyAny>> {
-        let result = self
-            .inner
-            .validate()
+    pub fn validate(&mut self, py: Python<'_>) -> PyResult<Py<PyAny>> {
+        // Reading and validating the file runs without the GIL
+        let inner = &mut self.inner;
+        let result = py
+            .detach(|| inner.validate())
             .map_err(|e| PyIOError::new_err(e.to_string()))?;
 
-        Python::attach(|py| {
-            let dict = pyo3::types::PyDict::new(py);
-            dict.set_item("table_name", &result.table_name)?;
-            dict.set_item("total_rows", result.total_rows)?;
-            let (passed, total) = result.is_passed();
-            dict.set_item("passed", (passed, total))?;
-            Ok(dict.into())
-        })
+        result_to_dict(py, &result)
+    }
+
+    /// Validate the CSV file and only return the rule counts.
+    ///
+    /// Same validation as `validate()`, without building the result dictionary.
+    ///
+    /// Returns:
+    ///     tuple: (passed_rules, total_rules)
+    pub fn validate_passed(&mut self, py: Python<'_>) -> PyResult<(u8, u8)> {
+        let inner = &mut self.inner;
+        py.detach(|| inner.validate())
+            .map(|result| result.is_passed())
+            .map_err(|e| PyIOError::new_err(e.to_string()))
     }
 }
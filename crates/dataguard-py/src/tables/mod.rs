@@ -3,3 +3,82 @@ pub mod parquet_table;
 
 pub use csv_table::CsvTable;
 pub use parquet_table::ParquetTable;
+
+use dataguard_core::{Table as CoreTable, ValidationResult};
+use pyo3::{exceptions::PyIOError, prelude::*, types::PyDict};
+use rayon::prelude::*;
+
+/// Convert a validation result to the dictionary returned to Python.
+pub(crate) fn result_to_dict(py: Python<'_>, result: &ValidationResult) -> PyResult<Py<PyAny>> {
+    let dict = PyDict::new(py);
+    dict.set_item("table_name", &result.table_name)?;
+    dict.set_item("total_rows", result.total_rows)?;
+    let (passed, total) = result.is_passed();
+    dict.set_item("passed", (passed, total))?;
+    Ok(dict.into())
+}
+
+/// A borrowed Python table, kept alive while its core table is validated.
+enum TableRef<'py> {
+    Csv(PyRefMut<'py, CsvTable>),
+    Parquet(PyRefMut<'py, ParquetTable>),
+}
+
+impl TableRef<'_> {
+    fn core(&mut self) -> &mut dyn CoreTable {
+        match self {
+            TableRef::Csv(table) => &mut table.inner,
+            TableRef::Parquet(table) => &mut table.inner,
+        }
+    }
+}
+
+/// Validate several prepared tables in parallel.
+///
+/// The GIL is released for the whole batch and each table is validated on its
+/// own thread.
+///
+/// Args:
+///     tables (list): Prepared tables (CsvTable or ParquetTable).
+///
+/// Returns:
+///     list: One result dictionary per table, in the order given, with keys:
+///         - 'table_name': Name of the table
+///         - 'total_rows': Total number of rows processed
+///         - 'passed': Tuple of (passed_rules, total_rules)
+#[pyfunction]
+pub fn validate_many(py: Python<'_>, tables: Vec<Bound<'_, PyAny>>) -> PyResult<Vec<Py<PyAny>>> {
+    let mut borrowed = tables
+        .iter()
+        .map(|table| {
+            if table.is_instance_of::<CsvTable>() {
+                Ok(TableRef::Csv(table.extract::<PyRefMut<CsvTable>>()?))
+            } else if table.is_instance_of::<ParquetTable>() {
+                Ok(TableRef::Parquet(
+                    table.extract::<PyRefMut<ParquetTable>>()?,
+                ))
+            } else {
+                Err(PyIOError::new_err(format!(
+                    "Invalid table type: {:?}",
+                    table
+                )))
+            }
+        })
+        .collect::<PyResult<Vec<_>>>()?;
+    let cores: Vec<&mut dyn CoreTable> = borrowed.iter_mut().map(TableRef::core).collect();
+
+    let results = py.detach(|| {
+        cores
+            .into_par_iter()
+            .map(|table| table.validate())
+            .collect::<Vec<_>>()
+    });
+
+    results
+        .into_iter()
+        .map(|result| {
+            let result = result.map_err(|e| PyIOError::new_err(e.to_string()))?;
+            result_to_dict(py, &result)
+        })
+        .collect()
+}
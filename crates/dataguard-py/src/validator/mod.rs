@@ -1,6 +0,0 @@
-pub mod validation;
-
-// Re-export ExecutableColumn from dataguard-core
-pub use dataguard_core::validator::ExecutableColumn;
-// Export the PyO3 Validator wrapper
-pub use self::validation::Validator;
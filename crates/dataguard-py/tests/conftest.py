@@ -0,0 +1,23 @@
+import csv
+
+import pytest
+
+
+@pytest.fixture
+def write_csv(tmp_path):
+    """Return a helper writing a dict of columns to a CSV file.
+
+    None values are written as empty fields, like pandas' to_csv does.
+    """
+
+    def _write(data):
+        csv_path = tmp_path / "test.csv"
+        with csv_path.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(data.keys())
+            writer.writerows(
+                ["" if v is None else v for v in row] for row in zip(*data.values())
+            )
+        return csv_path
+
+    return _write
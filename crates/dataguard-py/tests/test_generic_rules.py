@@ -1,15 +1,13 @@
 import dataguard
-import pandas as pd
 
 
-def test_unicity(tmp_path):
+def test_unicity(write_csv):
     data = {"unique_col": ["1", "2", "3", "1", "2", None, None]}
     # Expected errors: 1 (duplicate), 2 (duplicate), None, None
     # None values are ignored for unicity check
     # Since we have 4 violations out of 7 rows, and threshold is 0.0, all 4 should be caught
 
-    csv_path = tmp_path / "test.csv"
-    pd.DataFrame(data).to_csv(csv_path, index=False)
+    csv_path = write_csv(data)
 
     # Create column with unicity rule
     col = dataguard.string_column("unique_col").is_unique()
@@ -26,13 +24,12 @@ def test_unicity(tmp_path):
     assert passed < total, f"Expected validation to fail but got {passed}/{total}"
 
 
-def test_unicity_all_unique_with_none(tmp_path):
+def test_unicity_all_unique_with_none(write_csv):
     data = {"unique_col": ["1", "2", "3", None]}
     # All values are unique, but we have one None
     # With threshold 0.0, null values might cause failure
 
-    csv_path = tmp_path / "test.csv"
-    pd.DataFrame(data).to_csv(csv_path, index=False)
+    csv_path = write_csv(data)
 
     col = dataguard.string_column("unique_col").is_unique()
 
@@ -45,12 +42,11 @@ def test_unicity_all_unique_with_none(tmp_path):
     print(f"Result: {result}")
 
 
-def test_unicity_all_unique(tmp_path):
+def test_unicity_all_unique(write_csv):
     data = {"unique_col": ["1", "2", "3", "4"]}
     # All values are unique, no nulls
 
-    csv_path = tmp_path / "test.csv"
-    pd.DataFrame(data).to_csv(csv_path, index=False)
+    csv_path = write_csv(data)
 
     col = dataguard.string_column("unique_col").is_unique()
 
@@ -64,12 +60,11 @@ def test_unicity_all_unique(tmp_path):
     assert passed == total, f"Expected all rules to pass but got {passed}/{total}"
 
 
-def test_unicity_all_duplicates(tmp_path):
+def test_unicity_all_duplicates(write_csv):
     data = {"unique_col": ["1", "1", "1", None, None]}
     # All non-null values are duplicates
 
-    csv_path = tmp_path / "test.csv"
-    pd.DataFrame(data).to_csv(csv_path, index=False)
+    csv_path = write_csv(data)
 
     col = dataguard.string_column("unique_col").is_unique()
 
@@ -81,3 +76,33 @@ def test_unicity_all_duplicates(tmp_path):
     # Should fail validation
     passed, total = result["passed"]
     assert passed < total, f"Expected validation to fail but got {passed}/{total}"
+
+
+def test_builder_chaining_returns_same_builder():
+    col = dataguard.string_column("name")
+    assert col.is_not_null().with_min_length(2) is col
+
+
+def test_validate_many(write_csv):
+    csv_path = write_csv({"unique_col": ["1", "2", "2"]})
+
+    tables = []
+    for name in ("first", "second"):
+        table = dataguard.CsvTable(str(csv_path), name)
+        table.prepare([dataguard.string_column("unique_col").is_unique()])
+        tables.append(table)
+
+    results = dataguard.validate_many(tables)
+
+    assert [r["table_name"] for r in results] == ["first", "second"]
+    for result in results:
+        passed, total = result["passed"]
+        assert passed < total
+
+
+def test_validate_passed(write_csv):
+    csv_path = write_csv({"unique_col": ["1", "2", "2"]})
+    table = dataguard.CsvTable(str(csv_path), "test_table")
+    table.prepare([dataguard.string_column("unique_col").is_unique()])
+
+    assert table.validate_passed() == table.validate()["passed"]
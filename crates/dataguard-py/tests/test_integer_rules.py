@@ -1,15 +1,11 @@
 import dataguard
-import pandas as pd
 
 
-def test_between_integer(tmp_path):
+def test_between_integer(write_csv):
     data = {"col": [1, 2, 3, 5, 6, None]}
     # Violations: 1 (too low), 6 (too high), None (null).
     # With new API, we check if validation failed
-    csv_path = tmp_path / "test.csv"
-    pd.DataFrame({"col": pd.Series(data["col"], dtype="Int64")}).to_csv(
-        csv_path, index=False
-    )
+    csv_path = write_csv(data)
 
     col = dataguard.integer_column("col").between(2, 5)
     table = dataguard.CsvTable(str(csv_path), "test_table")
@@ -21,13 +17,10 @@ def test_between_integer(tmp_path):
     assert passed < total
 
 
-def test_min_integer(tmp_path):
+def test_min_integer(write_csv):
     data = {"col": [1, 2, 3, 5, None]}
     # Violations: 1 (too low), 2 (too low), None (null).
-    csv_path = tmp_path / "test.csv"
-    pd.DataFrame({"col": pd.Series(data["col"], dtype="Int64")}).to_csv(
-        csv_path, index=False
-    )
+    csv_path = write_csv(data)
 
     col = dataguard.integer_column("col").min(3)
     table = dataguard.CsvTable(str(csv_path), "test_table")
@@ -38,13 +31,10 @@ def test_min_integer(tmp_path):
     assert passed < total
 
 
-def test_max_integer(tmp_path):
+def test_max_integer(write_csv):
     data = {"col": [1, 5, 6, 7, None]}
     # Violations: 6 (too high), 7 (too high), None (null).
-    csv_path = tmp_path / "test.csv"
-    pd.DataFrame({"col": pd.Series(data["col"], dtype="Int64")}).to_csv(
-        csv_path, index=False
-    )
+    csv_path = write_csv(data)
 
     col = dataguard.integer_column("col").max(5)
     table = dataguard.CsvTable(str(csv_path), "test_table")
@@ -55,13 +45,10 @@ def test_max_integer(tmp_path):
     assert passed < total
 
 
-def test_is_positive_integer(tmp_path):
+def test_is_positive_integer(write_csv):
     data = {"col": [-2, -1, 0, 1, 2, None]}
     # Violations: -2, -1, 0, None.
-    csv_path = tmp_path / "test.csv"
-    pd.DataFrame({"col": pd.Series(data["col"], dtype="Int64")}).to_csv(
-        csv_path, index=False
-    )
+    csv_path = write_csv(data)
 
     col = dataguard.integer_column("col").is_positive()
     table = dataguard.CsvTable(str(csv_path), "test_table")
@@ -72,13 +59,10 @@ def test_is_positive_integer(tmp_path):
     assert passed < total
 
 
-def test_is_negative_integer(tmp_path):
+def test_is_negative_integer(write_csv):
     data = {"col": [-2, -1, 0, 1, 2, None]}
     # Violations: 0, 1, 2, None.
-    csv_path = tmp_path / "test.csv"
-    pd.DataFrame({"col": pd.Series(data["col"], dtype="Int64")}).to_csv(
-        csv_path, index=False
-    )
+    csv_path = write_csv(data)
 
     col = dataguard.integer_column("col").is_negative()
     table = dataguard.CsvTable(str(csv_path), "test_table")
@@ -89,13 +73,10 @@ def test_is_negative_integer(tmp_path):
     assert passed < total
 
 
-def test_is_non_positive_integer(tmp_path):
+def test_is_non_positive_integer(write_csv):
     data = {"col": [-2, -1, 0, 1, 2, None]}
     # Violations: 1, 2, None.
-    csv_path = tmp_path / "test.csv"
-    pd.DataFrame({"col": pd.Series(data["col"], dtype="Int64")}).to_csv(
-        csv_path, index=False
-    )
+    csv_path = write_csv(data)
 
     col = dataguard.integer_column("col").is_non_positive()
     table = dataguard.CsvTable(str(csv_path), "test_table")
@@ -106,13 +87,10 @@ def test_is_non_positive_integer(tmp_path):
     assert passed < total
 
 
-def test_is_non_negative_integer(tmp_path):
+def test_is_non_negative_integer(write_csv):
     data = {"col": [-2, -1, 0, 1, 2, None]}
     # Violations: -2, -1, None.
-    csv_path = tmp_path / "test.csv"
-    pd.DataFrame({"col": pd.Series(data["col"], dtype="Int64")}).to_csv(
-        csv_path, index=False
-    )
+    csv_path = write_csv(data)
 
     col = dataguard.integer_column("col").is_non_negative()
     table = dataguard.CsvTable(str(csv_path), "test_table")
@@ -123,13 +101,10 @@ def test_is_non_negative_integer(tmp_path):
     assert passed < total
 
 
-def test_is_monotonically_increasing_integer(tmp_path):
+def test_is_monotonically_increasing_integer(write_csv):
     data = {"col": [1, 2, 2, 4, 3, None, 5]}
     # Violations: 3 (because 3 < 4). None is ignored by monotonicity check.
-    csv_path = tmp_path / "test.csv"
-    pd.DataFrame({"col": pd.Series(data["col"], dtype="Int64")}).to_csv(
-        csv_path, index=False
-    )
+    csv_path = write_csv(data)
 
     col = dataguard.integer_column("col").is_monotonically_increasing()
     table = dataguard.CsvTable(str(csv_path), "test_table")
@@ -140,13 +115,10 @@ def test_is_monotonically_increasing_integer(tmp_path):
     assert passed < total
 
 
-def test_is_monotonically_decreasing_integer(tmp_path):
+def test_is_monotonically_decreasing_integer(write_csv):
     data = {"col": [5, 4, 4, 2, 3, None, 1]}
     # Violations: 3 (because 3 > 2). None is ignored.
-    csv_path = tmp_path / "test.csv"
-    pd.DataFrame({"col": pd.Series(data["col"], dtype="Int64")}).to_csv(
-        csv_path, index=False
-    )
+    csv_path = write_csv(data)
 
     col = dataguard.integer_column("col").is_monotonically_decreasing()
     table = dataguard.CsvTable(str(csv_path), "test_table")
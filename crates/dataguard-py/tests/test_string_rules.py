@@ -1,14 +1,12 @@
 import dataguard
-import pandas as pd
 
 
-def test_is_numeric(tmp_path):
+def test_is_numeric(write_csv):
     # Data for the test
     data = {"numeric_col": ["123", "456", "abc", "12a", "", None, "789"]}
     # Expected errors: "abc", "12a", "", None
 
-    csv_path = tmp_path / "test.csv"
-    pd.DataFrame(data).to_csv(csv_path, index=False)
+    csv_path = write_csv(data)
 
     col = dataguard.string_column("numeric_col").is_numeric()
     table = dataguard.CsvTable(str(csv_path), "test_table")
@@ -19,11 +17,33 @@ def test_is_numeric(tmp_path):
     assert passed < total
 
 
-def test_is_alpha(tmp_path):
+def test_is_ascii_digit(write_csv):
+    data = {
+        "ean_col": [
+            "4006381333931",
+            "5901234123457",
+            "400638133393X",
+            "",
+            None,
+            "\u0663",
+        ]
+    }
+    # Expected errors: "400638133393X", "", None, "\u0663"
+    csv_path = write_csv(data)
+
+    col = dataguard.string_column("ean_col").is_ascii_digit()
+    table = dataguard.CsvTable(str(csv_path), "test_table")
+    table.prepare([col])
+
+    result = table.validate()
+    passed, total = result["passed"]
+    assert passed < total
+
+
+def test_is_alpha(write_csv):
     data = {"alpha_col": ["abc", "XYZ", "aBc", "123", "a1", "", None, "def"]}
     # Expected errors: "123", "a1", "", None
-    csv_path = tmp_path / "test.csv"
-    pd.DataFrame(data).to_csv(csv_path, index=False)
+    csv_path = write_csv(data)
 
     col = dataguard.string_column("alpha_col").is_alpha()
     table = dataguard.CsvTable(str(csv_path), "test_table")
@@ -34,11 +54,10 @@ def test_is_alpha(tmp_path):
     assert passed < total
 
 
-def test_is_alphanumeric(tmp_path):
+def test_is_alphanumeric(write_csv):
     data = {"alphanumeric_col": ["abc", "XYZ123", "aBc-", "123", "a1", "", None, "def"]}
     # Expected errors: "aBc-", "", None
-    csv_path = tmp_path / "test.csv"
-    pd.DataFrame(data).to_csv(csv_path, index=False)
+    csv_path = write_csv(data)
 
     col = dataguard.string_column("alphanumeric_col").is_alphanumeric()
     table = dataguard.CsvTable(str(csv_path), "test_table")
@@ -49,13 +68,12 @@ def test_is_alphanumeric(tmp_path):
     assert passed < total
 
 
-def test_is_lowercase(tmp_path):
+def test_is_lowercase(write_csv):
     data = {
         "lowercase_col": ["abc", "xyz", "aBc", "ab c", "ab-c", "123", "", None, "def"]
     }
     # Expected errors: "aBc", "", None
-    csv_path = tmp_path / "test.csv"
-    pd.DataFrame(data).to_csv(csv_path, index=False)
+    csv_path = write_csv(data)
 
     col = dataguard.string_column("lowercase_col").is_lowercase()
     table = dataguard.CsvTable(str(csv_path), "test_table")
@@ -66,13 +84,12 @@ def test_is_lowercase(tmp_path):
     assert passed < total
 
 
-def test_is_uppercase(tmp_path):
+def test_is_uppercase(write_csv):
     data = {
         "uppercase_col": ["ABC", "XYZ", "aBc", "AB C", "AB-C", "123", "", None, "DEF"]
     }
     # Expected errors: "aBc", "", None
-    csv_path = tmp_path / "test.csv"
-    pd.DataFrame(data).to_csv(csv_path, index=False)
+    csv_path = write_csv(data)
 
     col = dataguard.string_column("uppercase_col").is_uppercase()
     table = dataguard.CsvTable(str(csv_path), "test_table")
@@ -83,11 +100,10 @@ def test_is_uppercase(tmp_path):
     assert passed < total
 
 
-def test_with_length_between(tmp_path):
+def test_with_length_between(write_csv):
     data = {"col": ["abc", "abcd", "abcde", "ab", "abcdef", "", None]}
     # Violations: "ab" (too short), "abcdef" (too long), "" (too short), None (null).
-    csv_path = tmp_path / "test.csv"
-    pd.DataFrame(data).to_csv(csv_path, index=False)
+    csv_path = write_csv(data)
 
     col = dataguard.string_column("col").with_length_between(3, 5)
     table = dataguard.CsvTable(str(csv_path), "test_table")
@@ -98,11 +114,10 @@ def test_with_length_between(tmp_path):
     assert passed < total
 
 
-def test_with_min_length(tmp_path):
+def test_with_min_length(write_csv):
     data = {"col": ["abc", "abcd", "ab", "", None]}
     # Violations: "ab", "", None.
-    csv_path = tmp_path / "test.csv"
-    pd.DataFrame(data).to_csv(csv_path, index=False)
+    csv_path = write_csv(data)
 
     col = dataguard.string_column("col").with_min_length(3)
     table = dataguard.CsvTable(str(csv_path), "test_table")
@@ -113,11 +128,10 @@ def test_with_min_length(tmp_path):
     assert passed < total
 
 
-def test_with_max_length(tmp_path):
+def test_with_max_length(write_csv):
     data = {"col": ["abcde", "abcdef", "abcd", "", None]}
     # Violations: "abcdef", None.
-    csv_path = tmp_path / "test.csv"
-    pd.DataFrame(data).to_csv(csv_path, index=False)
+    csv_path = write_csv(data)
 
     col = dataguard.string_column("col").with_max_length(5)
     table = dataguard.CsvTable(str(csv_path), "test_table")
@@ -128,11 +142,10 @@ def test_with_max_length(tmp_path):
     assert passed < total
 
 
-def test_with_regex(tmp_path):
+def test_with_regex(write_csv):
     data = {"col": ["ABC-123", "XYZ-456", "abc-123", "ABC-12", "ABC-1234", "", None]}
     # Violations: "abc-123", "ABC-12", "ABC-1234", "", None
-    csv_path = tmp_path / "test.csv"
-    pd.DataFrame(data).to_csv(csv_path, index=False)
+    csv_path = write_csv(data)
 
     col = dataguard.string_column("col").with_regex(r"^[A-Z]{3}-\d{3}$", None)
     table = dataguard.CsvTable(str(csv_path), "test_table")
@@ -143,7 +156,29 @@ def test_with_regex(tmp_path):
     assert passed < total
 
 
-def test_is_url(tmp_path):
+def test_with_regex_digits_of_length(write_csv):
+    data = {
+        "ean_col": [
+            "4006381333931",
+            "5901234123457",
+            "400638133393",
+            "400638133393X",
+            None,
+        ]
+    }
+    # Violations: "400638133393", "400638133393X", None
+    csv_path = write_csv(data)
+
+    col = dataguard.string_column("ean_col").with_regex(r"^[0-9]{13}$", None)
+    table = dataguard.CsvTable(str(csv_path), "test_table")
+    table.prepare([col])
+
+    result = table.validate()
+    passed, total = result["passed"]
+    assert passed < total
+
+
+def test_is_url(write_csv):
     data = {
         "url_col": [
             "http://example.com",
@@ -159,8 +194,7 @@ def test_is_url(tmp_path):
         ]
     }
     # Expected Errors: "www.example.com", "example.com", "http:// bad .com", "not-a-url", "", None
-    csv_path = tmp_path / "test.csv"
-    pd.DataFrame(data).to_csv(csv_path, index=False)
+    csv_path = write_csv(data)
 
     col = dataguard.string_column("url_col").is_url()
     table = dataguard.CsvTable(str(csv_path), "test_table")
@@ -171,7 +205,7 @@ def test_is_url(tmp_path):
     assert passed < total
 
 
-def test_is_email(tmp_path):
+def test_is_email(write_csv):
     data = {
         "email_col": [
             "test@example.com",
@@ -188,8 +222,7 @@ def test_is_email(tmp_path):
         ]
     }
     # Expected Errors: "invalid-email", "user@domain", "user@domain.", "@domain.com", "user@domain..com", "", None
-    csv_path = tmp_path / "test.csv"
-    pd.DataFrame(data).to_csv(csv_path, index=False)
+    csv_path = write_csv(data)
 
     col = dataguard.string_column("email_col").is_email()
     table = dataguard.CsvTable(str(csv_path), "test_table")
@@ -200,7 +233,7 @@ def test_is_email(tmp_path):
     assert passed < total
 
 
-def test_is_uuid(tmp_path):
+def test_is_uuid(write_csv):
     data = {
         "uuid_col": [
             "a1a1a1a1-b2b2-c3c3-d4d4-e5e5e5e5e5e5",
@@ -216,8 +249,7 @@ def test_is_uuid(tmp_path):
         ]
     }
     # Expected Errors: "not-a-uuid", "1234-5678-90ab-cdef-1234567890ab", "a1a1a1a1-b2b2-c3c3-d4d4-e5e5e5e5e5e5x", "g1a1a1a1-b2b2-c3c3-d4d4-e5e5e5e5e5e5", "", None
-    csv_path = tmp_path / "test.csv"
-    pd.DataFrame(data).to_csv(csv_path, index=False)
+    csv_path = write_csv(data)
 
     col = dataguard.string_column("uuid_col").is_uuid()
     table = dataguard.CsvTable(str(csv_path), "test_table")
@@ -228,7 +260,7 @@ def test_is_uuid(tmp_path):
     assert passed < total
 
 
-def test_is_in_check(tmp_path):
+def test_is_in_check(write_csv):
     data = {
         "fruit_col": [
             "apple",
@@ -243,8 +275,7 @@ def test_is_in_check(tmp_path):
     # Expected errors: "grape", "Apple", "", None
     allowed_values = ["apple", "banana", "orange"]
 
-    csv_path = tmp_path / "test.csv"
-    pd.DataFrame(data).to_csv(csv_path, index=False)
+    csv_path = write_csv(data)
 
     col = dataguard.string_column("fruit_col").is_in(allowed_values)
     table = dataguard.CsvTable(str(csv_path), "test_table")